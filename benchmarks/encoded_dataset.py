@@ -0,0 +1,107 @@
+"""
+Compare memory a dataset takes as dicts and in a term dictionary.
+
+    python -m benchmarks.encoded_dataset [QUADS]
+
+Each measurement runs in a fresh process, which keeps QUADS quads in memory
+and reports bytes per quad, as `tracemalloc` counts them, and peak RSS:
+
+* `dataset`: a `Dataset`, a dict per quad and per term, as `to_rdf()` returns,
+* `encoded`: an `EncodedDataset` of the same quads.
+
+Quads describe people: each has a type, a name, an age and a friend, in a
+named graph per 100 people, which is how repetitive real data usually is.
+"""
+import resource
+import subprocess  # noqa: S404
+import sys
+import tracemalloc
+from typing import Iterator
+
+from yaml_ld.rdf import Dataset, EncodedDataset, Quad
+
+QUADS = 1000000
+PEOPLE_PER_GRAPH = 100
+MODES = ('dataset', 'encoded')
+
+XSD = 'http://www.w3.org/2001/XMLSchema#'
+
+
+def _iter_quads(quads: int) -> Iterator[Quad]:
+    """Generate fresh term dicts for each quad, as a parser would."""
+    for index in range(quads):
+        person = index // 4
+        graph_name = f'https://example.org/graph/{person // PEOPLE_PER_GRAPH}'
+        rdf_object = (
+            {'type': 'IRI', 'value': 'https://schema.org/Person'},
+            {
+                'type': 'literal',
+                'value': f'Person {person}',
+                'datatype': f'{XSD}string',
+            },
+            {
+                'type': 'literal',
+                'value': str(person % 90),
+                'datatype': f'{XSD}integer',
+            },
+            {'type': 'blank node', 'value': f'_:b{person + 1}'},
+        )[index % 4]
+
+        yield Quad(
+            subject={'type': 'blank node', 'value': f'_:b{person}'},
+            predicate={
+                'type': 'IRI',
+                'value': f'https://schema.org/p{index % 4}',
+            },
+            object=rdf_object,   # type: ignore
+            graph=graph_name,
+        )
+
+
+def _build(quads: int, mode: str) -> Dataset | EncodedDataset:
+    if mode == 'encoded':
+        return EncodedDataset(_iter_quads(quads))
+
+    dataset: Dataset = {}
+    for quad in _iter_quads(quads):
+        graph_name = quad.pop('graph')   # type: ignore
+        dataset.setdefault(graph_name, []).append(quad)
+
+    return dataset
+
+
+def _measure(quads: int, mode: str) -> None:
+    """Build quads in this process, print bytes per quad and RSS in MiB."""
+    tracemalloc.start()
+    dataset = _build(quads, mode)
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    kilobytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(retained / quads, kilobytes / 1024)
+    del dataset   # noqa: WPS420
+
+
+def main() -> None:
+    """Print memory each representation of the same quads takes."""
+    quads = int(sys.argv[1]) if len(sys.argv) == 2 else QUADS
+    print(f'Quads: {quads}')
+
+    for mode in MODES:
+        per_quad, peak = subprocess.run(  # noqa: S603
+            [sys.executable, '-m', __spec__.name, str(quads), mode],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+        print(
+            f'{mode:>7}: {float(per_quad):6.1f} bytes per quad, '
+            f'{float(peak):7.1f} MiB peak RSS',
+        )
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        _measure(int(sys.argv[1]), mode=sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,103 @@
+"""
+Compare converting quads in memory to JSON-LD with and without N-Quads.
+
+    python -m benchmarks.from_rdf [QUADS]
+
+Each measurement runs in a fresh process, which builds a dataset of QUADS
+quads (100 per named graph) and reports time and peak RSS of converting it:
+
+* `nquads`: serialize the dataset to N-Quads, which `pyld` parses again,
+* `dataset`: pass the dataset to `from_rdf()` as it is,
+* `quads`: pass quads `iter_to_rdf()` yields from an N-Quads file.
+"""
+import resource
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pyld import jsonld
+
+import yaml_ld
+from yaml_ld.rdf import Dataset
+
+QUADS = 1000000
+QUADS_PER_GRAPH = 100
+MODES = ('nquads', 'dataset', 'quads')
+
+
+def _build_dataset(quads: int) -> Dataset:
+    dataset: Dataset = {}
+    for index in range(quads):
+        graph_name = f'https://example.org/graph/{index // QUADS_PER_GRAPH}'
+        dataset.setdefault(graph_name, []).append({
+            'subject': {
+                'type': 'IRI',
+                'value': f'https://example.org/person/{index // 4}',
+            },
+            'predicate': {
+                'type': 'IRI',
+                'value': f'https://schema.org/p{index % 4}',
+            },
+            'object': {
+                'type': 'literal',
+                'value': f'Value {index}',
+                'datatype': 'http://www.w3.org/2001/XMLSchema#string',
+            },
+        })
+
+    return dataset
+
+
+def _measure(quads: int, mode: str, path: Path) -> None:
+    """Convert quads in this process, print seconds and peak RSS in MiB."""
+    dataset = None if mode == 'quads' else _build_dataset(quads)
+
+    start = time.perf_counter()
+    if mode == 'nquads':
+        nquads = jsonld.JsonLdProcessor.to_nquads(dataset)
+        jsonld.from_rdf(
+            nquads,
+            {'format': 'application/n-quads'},
+        )
+    elif mode == 'dataset':
+        yaml_ld.from_rdf(dataset)
+    else:
+        yaml_ld.from_rdf(yaml_ld.iter_to_rdf(path))
+
+    elapsed = time.perf_counter() - start
+    kilobytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(elapsed, kilobytes / 1024)
+
+
+def main() -> None:
+    """Print time and peak RSS of each way to convert the same quads."""
+    quads = int(sys.argv[1]) if len(sys.argv) == 2 else QUADS
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'dump.nq'
+        path.write_text(
+            jsonld.JsonLdProcessor.to_nquads(_build_dataset(quads)),
+            encoding='utf-8',
+        )
+        print(f'Quads: {quads}')
+
+        for mode in MODES:
+            elapsed, peak = subprocess.run(  # noqa: S603
+                [sys.executable, '-m', __spec__.name, str(quads), mode, path],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.split()
+            print(
+                f'{mode:>7}: {float(elapsed):6.2f} s, '
+                f'{float(peak):7.1f} MiB peak RSS',
+            )
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4:
+        _measure(int(sys.argv[1]), mode=sys.argv[2], path=Path(sys.argv[3]))
+    else:
+        main()
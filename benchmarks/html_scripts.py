@@ -0,0 +1,55 @@
+"""
+Compare serial and parallel parsing of many scripts embedded in HTML.
+
+    python -m benchmarks.html_scripts
+"""
+import os
+import time
+
+from yaml_ld.document_parsers.html_parser import HTMLDocumentParser
+
+SCRIPTS = 400
+OFFERS = 20
+
+
+def _script(index: int) -> str:
+    offers = ''.join(
+        f'  - price: {offer}\n    sku: SKU-{index}-{offer}\n'
+        for offer in range(OFFERS)
+    )
+    return (
+        '<script type="application/ld+yaml">\n'
+        f'"@id": https://example.org/product/{index}\n'
+        f'offers:\n{offers}'
+        '</script>'
+    )
+
+
+def main() -> None:
+    """Print time to parse a catalog page serially and in parallel."""
+    scripts = ''.join(_script(index) for index in range(SCRIPTS))
+    html = f'<html><body>{scripts}</body></html>'.encode()
+    parser = HTMLDocumentParser()
+    workers = os.cpu_count() or 1
+    print(f'{SCRIPTS} YAML-LD scripts, {len(html) / 1024:.0f} KiB')
+
+    # Start the worker processes before measuring.
+    warm_up_options = {'extractAllScripts': True, 'scriptWorkers': workers}
+    parser(html, source='', options=warm_up_options)   # type: ignore
+
+    for workers_option in (None, workers):
+        started = time.perf_counter()
+        parser(
+            html,
+            source='',
+            options={   # type: ignore
+                'extractAllScripts': True,
+                'scriptWorkers': workers_option,
+            },
+        )
+        seconds = time.perf_counter() - started
+        print(f'workers={workers_option}: {seconds:.3f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Compare throughput of JSON backends.
+
+    python -m benchmarks.json_backends [json-ld-api/tests]
+
+Given a checkout of the JSON-LD API specification tests, every `.jsonld`
+file of it is parsed; otherwise, a generated document is.
+"""
+import io
+import sys
+import time
+from pathlib import Path
+
+from yaml_ld.document_parsers.json_parser import JSONDocumentParser
+from yaml_ld.json_backend import JSONBackend, choose_json_backend
+
+NODES = 20000
+ROUNDS = 5
+
+
+def _generated_documents() -> list[bytes]:
+    nodes = ', '.join(
+        (
+            f'{{"@id": "https://example.org/person/{index}", '
+            '"@type": "https://schema.org/Person", '
+            f'"https://schema.org/name": "Person {index}", '
+            f'"https://schema.org/age": {index % 100}}}'
+        )
+        for index in range(NODES)
+    )
+    return [f'[{nodes}]'.encode()]
+
+
+def _corpus_documents(directory: Path) -> list[bytes]:
+    return [path.read_bytes() for path in sorted(directory.rglob('*.jsonld'))]
+
+
+def _parse_all(documents: list[bytes], backend: JSONBackend) -> None:
+    parser = JSONDocumentParser()
+    for document in documents:
+        try:
+            parser(
+                data_stream=io.BytesIO(document),
+                source='',
+                options={'jsonBackend': backend},   # type: ignore
+            )
+        except Exception:   # noqa: S112
+            # The corpus contains deliberately invalid and scalar documents.
+            continue
+
+
+def main() -> None:
+    """Print throughput of each available backend."""
+    if len(sys.argv) > 1:
+        documents = _corpus_documents(Path(sys.argv[1]))
+    else:
+        documents = _generated_documents()
+
+    megabytes = sum(map(len, documents)) / 1024 / 1024
+    print(f'{len(documents)} documents, {megabytes:.2f} MiB')
+
+    for backend in JSONBackend:
+        if choose_json_backend(backend) != backend:
+            print(f'{backend:>8}: not available')
+            continue
+
+        seconds = min(
+            _timed(documents, backend)
+            for _round in range(ROUNDS)
+        )
+        print(f'{backend:>8}: {megabytes / seconds:7.2f} MiB/s')
+
+
+def _timed(documents: list[bytes], backend: JSONBackend) -> float:
+    started = time.perf_counter()
+    _parse_all(documents, backend)
+    return time.perf_counter() - started
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Compare loading a large local file with and without mmap.
+
+    python -m benchmarks.mmap_loader
+
+Each measurement runs in a fresh process, which loads a JSON-LD or a YAML-LD
+file larger than `DEFAULT_MMAP_THRESHOLD` and reports time and peak RSS.
+"""
+import json
+import resource
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from yaml_ld.document_loaders.local_file import (
+    DEFAULT_MMAP_THRESHOLD,
+    LocalFileDocumentLoader,
+)
+
+NODES = 200000
+MODES = {'read': None, 'mmap': DEFAULT_MMAP_THRESHOLD}
+FILE_NAMES = ('document.json', 'document.yamlld')
+
+
+def _write_document(path: Path) -> None:
+    nodes = [
+        {
+            '@id': f'https://example.org/person/{index}',
+            'https://schema.org/name': f'Person {index}',
+            'https://schema.org/description': f'Person number {index}',
+        }
+        for index in range(NODES)
+    ]
+    if path.suffix == '.json':
+        path.write_text(json.dumps(nodes), encoding='utf-8')
+        return
+
+    # JSON is YAML too, but a block sequence is what YAML files look like.
+    path.write_text(
+        ''.join(f'- {json.dumps(node)}\n' for node in nodes),
+        encoding='utf-8',
+    )
+
+
+def _measure(path: Path, mode: str) -> None:
+    """Load the file in this process, print seconds and peak RSS in MiB."""
+    loader = LocalFileDocumentLoader(mmap_threshold=MODES[mode])
+    start = time.perf_counter()
+    loader(path, {})   # type: ignore
+    elapsed = time.perf_counter() - start
+    kilobytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(elapsed, kilobytes / 1024)
+
+
+def main() -> None:
+    """Print time and peak RSS of loading the same file in each mode."""
+    with tempfile.TemporaryDirectory() as directory:
+        for file_name in FILE_NAMES:
+            path = Path(directory) / file_name
+            _write_document(path)
+            megabytes = path.stat().st_size / 1024 / 1024
+            print(f'{file_name}: {megabytes:.1f} MiB')
+
+            for mode in MODES:
+                elapsed, peak = subprocess.run(  # noqa: S603
+                    [sys.executable, '-m', __spec__.name, str(path), mode],
+                    capture_output=True,
+                    check=True,
+                    text=True,
+                ).stdout.split()
+                print(
+                    f'{mode:>6}: {float(elapsed):6.2f} s, '
+                    f'{float(peak):7.1f} MiB peak RSS',
+                )
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        _measure(Path(sys.argv[1]), mode=sys.argv[2])
+    else:
+        main()
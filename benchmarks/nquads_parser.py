@@ -0,0 +1,81 @@
+"""
+Compare the N-Quads parser with `rdflib` on a generated dump.
+
+    python -m benchmarks.nquads_parser [QUADS]
+
+Each measurement runs in a fresh process, which reports time and peak RSS:
+
+* `rdflib`: `rdflib.Dataset().parse()`,
+* `dataset`: `to_rdf()`, which builds the whole dataset,
+* `stream`: `iter_to_rdf()`, which reads one line at a time.
+"""
+import resource
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from rdflib import Dataset
+
+import yaml_ld
+
+QUADS = 400000
+MODES = ('rdflib', 'dataset', 'stream')
+
+
+def _write_dump(path: Path, quads: int) -> None:
+    with path.open('w', encoding='utf-8') as dump:
+        for index in range(quads):
+            graph = f'<https://example.org/graph/{index % 10}>'
+            dump.write(
+                f'<https://example.org/person/{index // 4}> '
+                f'<https://schema.org/p{index % 4}> '
+                f'"Value {index}"@en {graph} .\n',
+            )
+
+
+def _measure(path: Path, mode: str) -> None:
+    """Parse the dump in this process, print seconds and peak RSS in MiB."""
+    start = time.perf_counter()
+    if mode == 'rdflib':
+        Dataset().parse(path, format='nquads')
+    elif mode == 'dataset':
+        yaml_ld.to_rdf(path)
+    else:
+        for _quad in yaml_ld.iter_to_rdf(path):   # noqa: WPS328
+            pass   # noqa: WPS420
+
+    elapsed = time.perf_counter() - start
+    kilobytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(elapsed, kilobytes / 1024)
+
+
+def main() -> None:
+    """Print time and peak RSS of parsing the same dump in each mode."""
+    quads = int(sys.argv[1]) if len(sys.argv) == 2 else QUADS
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'dump.nq'
+        _write_dump(path, quads)
+        megabytes = path.stat().st_size / 1024 / 1024
+        print(f'Dump: {quads} quads, {megabytes:.1f} MiB')
+
+        for mode in MODES:
+            elapsed, peak = subprocess.run(  # noqa: S603
+                [sys.executable, '-m', __spec__.name, str(path), mode],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.split()
+            print(
+                f'{mode:>7}: {float(elapsed):6.2f} s, '
+                f'{float(peak):7.1f} MiB peak RSS',
+            )
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        _measure(Path(sys.argv[1]), mode=sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,77 @@
+"""
+Measure peak memory of writing N-Quads versus the size of the output.
+
+    python -m benchmarks.nquads_writer
+
+Each measurement runs in a fresh process, which converts a JSON-LD array to
+N-Quads written to `/dev/null`, and reports its peak RSS:
+
+* `string`: `to_rdf()` returns the whole output as one string,
+* `stream`: `write_nquads()` writes quads `iter_to_rdf()` yields.
+"""
+import json
+import os
+import resource
+import subprocess  # noqa: S404
+import sys
+import tempfile
+from pathlib import Path
+
+import yaml_ld
+from yaml_ld.to_rdf import ToRDFOptions
+
+SIZES = (10000, 40000, 160000)
+MODES = ('string', 'stream')
+
+
+def _write_document(path: Path, size: int) -> None:
+    nodes = (
+        {
+            '@id': f'https://example.org/person/{index}',
+            'https://schema.org/name': f'Person {index}',
+            'https://schema.org/knows': {'@id': f'_:friend{index}'},
+        }
+        for index in range(size)
+    )
+    with path.open('w') as json_file:
+        json_file.write(',\n'.join(map(json.dumps, nodes)).join('[]'))
+
+
+def _measure(path: Path, mode: str) -> None:
+    """Convert the file in this process, print peak RSS in MiB."""
+    with open(os.devnull, 'w') as output:
+        if mode == 'string':
+            output.write(yaml_ld.to_rdf(   # type: ignore
+                path,
+                options=ToRDFOptions(format='application/n-quads'),
+            ))
+        else:
+            yaml_ld.write_nquads(yaml_ld.iter_to_rdf(path), output)
+
+    kilobytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(kilobytes / 1024)
+
+
+def main() -> None:
+    """Print peak RSS of converting documents of growing size."""
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SIZES:
+            path = Path(directory) / f'{size}.jsonld'
+            _write_document(path, size)
+            print(f'{size * 2} quads:')
+
+            for mode in MODES:
+                peak = subprocess.run(  # noqa: S603
+                    [sys.executable, '-m', __spec__.name, str(path), mode],
+                    capture_output=True,
+                    check=True,
+                    text=True,
+                ).stdout
+                print(f'  {mode:>6}: {float(peak):7.1f} MiB peak RSS')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        _measure(Path(sys.argv[1]), mode=sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,57 @@
+"""
+Compare the validated API with `yaml_ld.fast` on a small document.
+
+    python -m benchmarks.options
+"""
+import timeit
+
+import yaml_ld
+from yaml_ld import fast
+from yaml_ld.compact import CompactOptions
+from yaml_ld.expand import ExpandOptions
+
+DOCUMENT = {
+    '@context': {'@vocab': 'https://schema.org/'},
+    '@id': 'https://example.org/alice',
+    'name': 'Alice',
+    'knows': {'@id': 'https://example.org/bob', 'name': 'Bob'},
+}
+CONTEXT = {'@vocab': 'https://schema.org/'}
+NUMBER = 2000
+
+
+def main() -> None:
+    """Print time per call of each entry point."""
+    expand_options = ExpandOptions()
+    compiled_expand_options = expand_options.compile()
+    compact_options = CompactOptions()
+    compiled_compact_options = compact_options.compile()
+
+    cases = {
+        'yaml_ld.expand': lambda: yaml_ld.expand(
+            DOCUMENT,
+            options=expand_options,
+        ),
+        'fast.expand': lambda: fast.expand(
+            DOCUMENT,
+            compiled_expand_options,
+        ),
+        'yaml_ld.compact': lambda: yaml_ld.compact(
+            DOCUMENT,
+            ctx=CONTEXT,
+            options=compact_options,
+        ),
+        'fast.compact': lambda: fast.compact(
+            DOCUMENT,
+            CONTEXT,
+            compiled_compact_options,
+        ),
+    }
+
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=NUMBER, repeat=5))
+        print(f'{name:>16}: {seconds / NUMBER * 1e6:8.1f} µs/call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Measure YAML loading time on a document dominated by plain string scalars.
+
+    python -m benchmarks.scalar_resolver
+"""
+import timeit
+
+from yaml_ld.loader import YAMLBackend, choose_backend, load_all
+
+NODES = 2000
+NUMBER = 5
+
+
+def _document() -> str:
+    return ''.join(
+        f'- "@id": https://example.org/person/{index}\n'
+        '  "@type": https://schema.org/Person\n'
+        f'  https://schema.org/name: Person {index}\n'
+        '  https://schema.org/knows:\n'
+        f'    - https://example.org/person/{index + 1}\n'
+        f'    - https://example.org/person/{index + 2}\n'
+        f'  https://schema.org/birthDate: 1990-01-{index % 28 + 1:02}\n'
+        for index in range(NODES)
+    )
+
+
+def main() -> None:
+    """Print time to load the document with each available backend."""
+    document = _document()
+
+    for backend in YAMLBackend:
+        if choose_backend(backend) != backend:
+            continue
+
+        seconds = min(
+            timeit.repeat(
+                lambda: list(load_all(document, backend=backend)),  # noqa: B023
+                number=NUMBER,
+                repeat=3,
+            ),
+        )
+        print(f'{backend:>8}: {seconds / NUMBER * 1000:8.1f} ms/document')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Measure peak memory of streaming a JSON-LD array versus its size.
+
+    python -m benchmarks.streaming_json
+
+Each measurement runs in a fresh process, which reports its peak RSS. With
+`iter_to_rdf()`, it should stay flat; with `to_rdf()`, it grows.
+"""
+import json
+import resource
+import subprocess  # noqa: S404
+import sys
+import tempfile
+from pathlib import Path
+
+import yaml_ld
+
+SIZES = (10000, 40000, 160000)
+FUNCTIONS = ('iter_to_rdf', 'to_rdf')
+
+
+def _write_document(path: Path, size: int) -> None:
+    with path.open('w') as json_file:
+        json_file.write('[')
+        for index in range(size):
+            if index:
+                json_file.write(',\n')
+
+            json.dump(
+                {
+                    '@id': f'https://example.org/person/{index}',
+                    'https://schema.org/name': f'Person {index}',
+                },
+                json_file,
+            )
+        json_file.write(']')
+
+
+def _measure(path: Path, function: str) -> None:
+    """Convert the file in this process, print peak RSS in MiB."""
+    if function == 'iter_to_rdf':
+        for _quad in yaml_ld.iter_to_rdf(path):   # noqa: WPS328
+            pass   # noqa: WPS420
+    else:
+        yaml_ld.to_rdf(path)
+
+    kilobytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(kilobytes / 1024)
+
+
+def main() -> None:
+    """Print peak RSS of converting documents of growing size."""
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SIZES:
+            path = Path(directory) / f'{size}.jsonld'
+            _write_document(path, size)
+            megabytes = path.stat().st_size / 1024 / 1024
+
+            for function in FUNCTIONS:
+                peak = subprocess.run(  # noqa: S603
+                    [sys.executable, '-m', __spec__.name, str(path), function],
+                    capture_output=True,
+                    check=True,
+                    text=True,
+                ).stdout
+                print(
+                    f'{megabytes:6.1f} MiB, {function:>11}: '
+                    f'{float(peak):7.1f} MiB peak RSS',
+                )
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        _measure(Path(sys.argv[1]), function=sys.argv[2])
+    else:
+        main()
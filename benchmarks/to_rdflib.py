@@ -0,0 +1,90 @@
+"""
+Compare loading a document into `rdflib` through N-Quads and directly.
+
+    python -m benchmarks.to_rdflib [NODES]
+
+Each measurement runs in a fresh process, which converts a JSON-LD array of
+NODES nodes into an `rdflib.Dataset` and reports time and peak RSS:
+
+* `nquads`: `to_rdf()` prints N-Quads, which `rdflib` parses again,
+* `direct`: `to_rdflib()` adds quads to the dataset as they are.
+"""
+import json
+import resource
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from rdflib import Dataset
+
+import yaml_ld
+from yaml_ld.to_rdf import ToRDFOptions
+
+NODES = 20000
+MODES = ('nquads', 'direct')
+
+
+def _write_document(path: Path, nodes: int) -> None:
+    documents = (
+        {
+            '@context': {'@vocab': 'https://schema.org/'},
+            '@id': f'https://example.org/person/{index}',
+            '@type': 'Person',
+            'name': {'@value': f'Person {index}', '@language': 'en'},
+            'age': index % 90,
+            'knows': {'name': f'Friend {index}'},
+        }
+        for index in range(nodes)
+    )
+    with path.open('w') as json_file:
+        json_file.write(',\n'.join(map(json.dumps, documents)).join('[]'))
+
+
+def _measure(path: Path, mode: str) -> None:
+    """Load the file in this process, print seconds and peak RSS in MiB."""
+    start = time.perf_counter()
+    dataset = Dataset()
+    if mode == 'nquads':
+        dataset.parse(
+            data=yaml_ld.to_rdf(   # type: ignore
+                path,
+                options=ToRDFOptions(format='application/n-quads'),
+            ),
+            format='nquads',
+        )
+    else:
+        yaml_ld.to_rdflib(path, dataset)
+
+    elapsed = time.perf_counter() - start
+    kilobytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(elapsed, kilobytes / 1024, len(dataset))
+
+
+def main() -> None:
+    """Print time and peak RSS of each way to load the same document."""
+    nodes = int(sys.argv[1]) if len(sys.argv) == 2 else NODES
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'people.jsonld'
+        _write_document(path, nodes)
+
+        for mode in MODES:
+            elapsed, peak, quads = subprocess.run(  # noqa: S603
+                [sys.executable, '-m', __spec__.name, str(path), mode],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.split()
+            print(
+                f'{mode:>6}: {quads} quads, {float(elapsed):6.2f} s, '
+                f'{float(peak):7.1f} MiB peak RSS',
+            )
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        _measure(Path(sys.argv[1]), mode=sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,68 @@
+"""
+Compare converting a Turtle vocabulary to RDF directly and via JSON-LD.
+
+    python -m benchmarks.turtle_to_rdf [TERMS]
+
+`graph round trip` is how `to_rdf()` used to handle Turtle: an `rdflib` graph
+converted to JSON-LD, which `pyld` expands and converts back to triples.
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pyld import jsonld
+from rdflib import Graph
+from rdflib_pyld_compat import pyld_jsonld_from_rdflib_graph
+
+import yaml_ld
+
+TERMS = 20000
+
+
+def _write_vocabulary(path: Path, terms: int) -> None:
+    with path.open('w', encoding='utf-8') as turtle_file:
+        turtle_file.write(
+            '@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n'
+            '@prefix ex: <https://example.org/vocab#> .\n\n',
+        )
+        for index in range(terms):
+            turtle_file.write(
+                f'ex:Term{index} a rdfs:Class ;\n'
+                f'    rdfs:label "Term {index}"@en ;\n'
+                f'    rdfs:comment "Term number {index}." ;\n'
+                f'    rdfs:subClassOf ex:Term{index // 2} .\n',
+            )
+
+
+def _graph_round_trip(path: Path) -> dict:
+    graph = Graph().parse(path, format='turtle')
+    return jsonld.to_rdf(pyld_jsonld_from_rdflib_graph(graph))
+
+
+def _direct(path: Path) -> dict:
+    return yaml_ld.to_rdf(path)   # type: ignore
+
+
+def main() -> None:
+    """Print time to convert the same vocabulary in each way."""
+    terms = int(sys.argv[1]) if len(sys.argv) > 1 else TERMS
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'vocabulary.ttl'
+        _write_vocabulary(path, terms)
+        print(f'Terms: {terms}')
+
+        for name, convert in (
+            ('graph round trip', _graph_round_trip),
+            ('direct', _direct),
+        ):
+            start = time.perf_counter()
+            dataset = convert(path)
+            elapsed = time.perf_counter() - start
+            triples = len(dataset['@default'])
+            print(f'{name:>16}: {elapsed:6.2f} s, {triples} triples')
+
+
+if __name__ == '__main__':
+    main()
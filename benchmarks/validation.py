@@ -0,0 +1,38 @@
+"""
+Measure validation overhead on the document argument versus its size.
+
+    python -m benchmarks.validation
+
+The overhead should stay flat: documents are passed to `pyld` by reference.
+"""
+import timeit
+
+from pydantic import TypeAdapter
+
+from yaml_ld.models import JsonLdInput
+
+SIZES = (10, 1000, 100000)
+NUMBER = 1000
+
+
+def main() -> None:
+    """Print validation time per call for documents of growing size."""
+    adapter = TypeAdapter(JsonLdInput)
+
+    for size in SIZES:
+        document = [
+            {'@id': f'_:b{index}', 'https://schema.org/name': 'x'}
+            for index in range(size)
+        ]
+        seconds = min(
+            timeit.repeat(
+                lambda: adapter.validate_python(document),   # noqa: B023
+                number=NUMBER,
+                repeat=5,
+            ),
+        )
+        print(f'{size:>8} records: {seconds / NUMBER * 1e6:8.2f} µs/call')
+
+
+if __name__ == '__main__':
+    main()
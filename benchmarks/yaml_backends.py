@@ -0,0 +1,51 @@
+"""
+Compare throughput of YAML backends on a generated YAML-LD document.
+
+    python -m benchmarks.yaml_backends
+"""
+import io
+import time
+
+from yaml_ld.document_parsers.yaml_parser import YAMLDocumentParser
+from yaml_ld.loader import YAMLBackend, choose_backend
+
+NODES = 5000
+
+
+def _document() -> bytes:
+    nodes = [
+        (
+            f'- "@id": https://example.org/person/{index}\n'
+            '  "@type": https://schema.org/Person\n'
+            f'  https://schema.org/name: Person {index}\n'
+            '  https://schema.org/knows: '
+            f'https://example.org/person/{index + 1}\n'
+        )
+        for index in range(NODES)
+    ]
+    return ''.join(nodes).encode()
+
+
+def main() -> None:
+    """Print throughput of each available backend."""
+    document = _document()
+    parser = YAMLDocumentParser()
+
+    for backend in YAMLBackend:
+        if choose_backend(backend) != backend:
+            print(f'{backend:>8}: not available')
+            continue
+
+        started = time.perf_counter()
+        parser(
+            data_stream=io.BytesIO(document),
+            source='',
+            options={'yamlBackend': backend},   # type: ignore
+        )
+        seconds = time.perf_counter() - started
+        megabytes = len(document) / 1024 / 1024
+        print(f'{backend:>8}: {megabytes / seconds:6.2f} MiB/s')
+
+
+if __name__ == '__main__':
+    main()
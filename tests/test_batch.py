@@ -0,0 +1,92 @@
+import pytest
+
+import yaml_ld
+from yaml_ld.errors import NotFound
+from yaml_ld.expand import ExpandOptions
+
+DOCUMENTS = [
+    {
+        '@context': {'@vocab': 'https://schema.org/'},
+        '@id': f'https://example.org/{index}',
+        'name': f'Person {index}',
+    }
+    for index in range(10)
+]
+
+
+def test_expand_many_matches_expand():
+    results = list(yaml_ld.expand_many(DOCUMENTS))
+
+    assert [batch_result.index for batch_result in results] == list(range(10))
+    assert [batch_result.output for batch_result in results] == [
+        yaml_ld.expand(document) for document in DOCUMENTS
+    ]
+
+
+def test_error_does_not_abort_batch(tmp_path):
+    documents = [*DOCUMENTS[:2], tmp_path / 'missing.yamlld', *DOCUMENTS[2:]]
+
+    results = list(yaml_ld.expand_many(documents))
+
+    assert len(results) == len(documents)
+    assert isinstance(results[2].error, NotFound)
+    assert all(
+        batch_result.is_successful
+        for batch_result in results
+        if batch_result.index != 2
+    )
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_compact_many_in_processes(ordered: bool):
+    ctx = yaml_ld.compile_context({'@vocab': 'https://schema.org/'})
+
+    results = list(
+        yaml_ld.compact_many(
+            iter(DOCUMENTS),
+            ctx=ctx,
+            processes=2,
+            chunk_size=3,
+            ordered=ordered,
+        ),
+    )
+
+    outputs = {
+        batch_result.index: batch_result.output
+        for batch_result in results
+    }
+    assert outputs == {
+        index: yaml_ld.compact(document, ctx=ctx)
+        for index, document in enumerate(DOCUMENTS)
+    }
+    if ordered:
+        assert list(outputs) == list(range(10))
+
+
+def test_to_rdf_many():
+    results = list(yaml_ld.to_rdf_many(DOCUMENTS[:1]))
+
+    assert results[0].output == yaml_ld.to_rdf(DOCUMENTS[0])
+
+
+def test_context_is_not_kept_between_documents():
+    vocabularies = iter(['https://schema.org/', 'https://example.org/'])
+    context_url = 'https://example.org/context.jsonld'
+
+    def document_loader(source, options):
+        return {
+            'contextUrl': None,
+            'documentUrl': source,
+            'document': {'@context': {'@vocab': next(vocabularies)}},
+        }
+
+    document = {'@context': context_url, 'name': 'Alice'}
+    results = yaml_ld.expand_many(
+        [document, document],
+        options=ExpandOptions(document_loader=document_loader),
+    )
+
+    assert [
+        next(iter(batch_result.output[0]))
+        for batch_result in results
+    ] == ['https://schema.org/name', 'https://example.org/name']
@@ -0,0 +1,99 @@
+import pytest
+
+import yaml_ld
+from yaml_ld.compact import CompactOptions
+from yaml_ld.compile_context import CompileContextOptions
+from yaml_ld.expand import ExpandOptions
+
+CONTEXT = {
+    '@context': {
+        '@vocab': 'https://schema.org/',
+        'knows': {'@type': '@id'},
+    },
+}
+
+DOCUMENT = {
+    '@context': {'@vocab': 'https://schema.org/'},
+    '@id': 'https://example.org/alice',
+    'name': 'Alice',
+    'knows': {'@id': 'https://example.org/bob'},
+}
+
+
+@pytest.fixture(scope='module')
+def compiled_context():
+    return yaml_ld.compile_context(CONTEXT)
+
+
+def test_compact(compiled_context):
+    assert yaml_ld.compact(DOCUMENT, ctx=compiled_context) == (
+        yaml_ld.compact(DOCUMENT, ctx=CONTEXT)
+    )
+
+
+def test_flatten(compiled_context):
+    assert yaml_ld.flatten(DOCUMENT, ctx=compiled_context) == (
+        yaml_ld.flatten(DOCUMENT, ctx=CONTEXT)
+    )
+
+
+def test_expand(compiled_context):
+    document = {'@id': 'https://example.org/alice', 'knows': 'bob'}
+
+    assert yaml_ld.expand(
+        document,
+        options=ExpandOptions(expand_context=compiled_context),
+    ) == yaml_ld.expand(
+        document,
+        options=ExpandOptions(expand_context=CONTEXT),
+    )
+
+
+def test_compact_with_empty_context():
+    assert yaml_ld.compact(
+        DOCUMENT,
+        ctx=yaml_ld.compile_context({}),
+    ) == yaml_ld.compact(DOCUMENT, ctx={})
+
+
+RELATIVE_VOCABULARY = {'@vocab': 'terms#'}
+
+
+@pytest.mark.parametrize('compile_options', [
+    CompileContextOptions(),
+    CompileContextOptions(base='https://example.org/'),
+])
+def test_base(compile_options):
+    compiled_context = yaml_ld.compile_context(
+        RELATIVE_VOCABULARY,
+        options=compile_options,
+    )
+    document = {'@id': 'alice', 'name': 'Alice'}
+    base = 'https://example.org/'
+
+    expanded = yaml_ld.expand(
+        document,
+        options=ExpandOptions(base=base, expand_context=compiled_context),
+    )
+    assert expanded == yaml_ld.expand(
+        document,
+        options=ExpandOptions(base=base, expand_context=RELATIVE_VOCABULARY),
+    )
+    assert 'https://example.org/terms#name' in expanded[0]
+
+    assert yaml_ld.compact(
+        expanded,
+        ctx=compiled_context,
+        options=CompactOptions(base=base),
+    ) == yaml_ld.compact(
+        expanded,
+        ctx=RELATIVE_VOCABULARY,
+        options=CompactOptions(base=base),
+    )
+
+
+def test_compiled_context_is_immutable(compiled_context):
+    with pytest.raises(AttributeError):
+        compiled_context.document = {}
+
+    assert {compiled_context: 'hashable'}
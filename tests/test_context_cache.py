@@ -0,0 +1,68 @@
+import json
+import os
+
+import pytest
+
+import yaml_ld
+from yaml_ld.context_cache import (
+    DEFAULT_CONTEXT_CACHE_TTL,
+    RESOLVED_CONTEXT_CACHE,
+)
+
+
+@pytest.fixture()
+def context_path(tmp_path):
+    path = tmp_path / 'context.jsonld'
+    path.write_text(json.dumps({
+        '@context': {'name': 'https://schema.org/name'},
+    }))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    RESOLVED_CONTEXT_CACHE.clear()
+    yield
+    RESOLVED_CONTEXT_CACHE.clear()
+
+
+def test_context_survives_across_calls(context_path):
+    document = {'@context': str(context_path), 'name': 'Alice'}
+
+    first = yaml_ld.expand(document)
+    misses = RESOLVED_CONTEXT_CACHE.statistics.misses
+
+    assert yaml_ld.expand(document) == first
+    assert RESOLVED_CONTEXT_CACHE.statistics.misses == misses
+    assert RESOLVED_CONTEXT_CACHE.statistics.hits
+
+
+def test_changed_context_file_is_reloaded(context_path):
+    document = {'@context': str(context_path), 'name': 'Alice'}
+    assert yaml_ld.expand(document) == [
+        {'https://schema.org/name': [{'@value': 'Alice'}]},
+    ]
+
+    context_path.write_text(json.dumps({
+        '@context': {'name': 'https://xmlns.com/foaf/0.1/name'},
+    }))
+    # Make sure the modification time differs on coarse-grained filesystems.
+    stat = context_path.stat()
+    os.utime(context_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert yaml_ld.expand(document) == [
+        {'https://xmlns.com/foaf/0.1/name': [{'@value': 'Alice'}]},
+    ]
+
+
+def test_expired_context_is_reloaded(context_path):
+    document = {'@context': str(context_path), 'name': 'Alice'}
+    RESOLVED_CONTEXT_CACHE.configure(ttl=0)
+
+    try:
+        yaml_ld.expand(document)
+        yaml_ld.expand(document)
+    finally:
+        RESOLVED_CONTEXT_CACHE.configure(ttl=DEFAULT_CONTEXT_CACHE_TTL)
+
+    assert not RESOLVED_CONTEXT_CACHE.statistics.hits
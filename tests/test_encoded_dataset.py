@@ -0,0 +1,74 @@
+import yaml_ld
+from yaml_ld.nquads_writer import to_nquad
+from yaml_ld.rdf import CompactTerm, EncodedDataset
+from yaml_ld.to_rdf import ToRDFOptions
+
+DOCUMENT = {
+    '@context': {'@vocab': 'https://schema.org/'},
+    '@id': 'https://example.org/alice',
+    'name': {'@value': 'Alice', '@language': 'en'},
+    'knows': [
+        {'name': 'Bob'},
+        {'@id': 'https://example.org/carol', 'name': 'Carol'},
+    ],
+}
+
+NQUADS = (
+    '<https://example.org/alice> <https://schema.org/name> "Alice" .\n'
+    '<https://example.org/alice> <https://schema.org/knows> _:bob '
+    '<https://example.org/graph> .\n'
+)
+
+
+def _nquads(quads):
+    return sorted(map(to_nquad, quads))
+
+
+def test_round_trip():
+    dataset = yaml_ld.to_rdf(DOCUMENT)
+    encoded = yaml_ld.to_rdf(DOCUMENT, options=ToRDFOptions(encoded=True))
+
+    assert isinstance(encoded, EncodedDataset)
+    assert len(encoded) == 5
+    assert _nquads(encoded) == _nquads(
+        {**triple, 'graph': graph_name}
+        for graph_name, triples in dataset.items()
+        for triple in triples
+    )
+    assert yaml_ld.from_rdf(encoded) == yaml_ld.from_rdf(dataset)
+
+
+def test_terms_are_stored_once():
+    encoded = yaml_ld.to_rdf(DOCUMENT, options=ToRDFOptions(encoded=True))
+
+    assert len(encoded.terms) == len(set(encoded.terms)) == 9
+    assert len(encoded.quad_ids) == 20
+    assert CompactTerm(
+        'literal',
+        'Alice',
+        'http://www.w3.org/1999/02/22-rdf-syntax-ns#langString',
+        'en',
+    ) in encoded.terms
+
+
+def test_quads_share_term_dicts():
+    encoded = yaml_ld.to_rdf(DOCUMENT, options=ToRDFOptions(encoded=True))
+
+    subjects = {
+        id(quad['subject'])
+        for quad in encoded
+        if quad['subject']['value'] == 'https://example.org/alice'
+    }
+    assert len(subjects) == 1
+
+
+def test_encode_streamed_quads(tmp_path):
+    path = tmp_path / 'people.nq'
+    path.write_text(NQUADS, encoding='utf-8')
+
+    encoded = EncodedDataset(yaml_ld.iter_to_rdf(path))
+
+    assert _nquads(encoded) == _nquads(yaml_ld.iter_to_rdf(path))
+    assert _nquads(encoded) == _nquads(
+        yaml_ld.to_rdf(path, options=ToRDFOptions(encoded=True)),
+    )
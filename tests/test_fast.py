@@ -0,0 +1,56 @@
+import pytest
+
+import yaml_ld
+from yaml_ld import fast
+from yaml_ld.compact import CompactOptions
+from yaml_ld.errors import MappingKeyError
+from yaml_ld.expand import ExpandOptions
+from yaml_ld.from_rdf import FromRDFOptions
+from yaml_ld.loader import YAMLBackend
+from yaml_ld.to_rdf import ToRDFOptions
+
+DOCUMENT = {
+    '@context': {'@vocab': 'https://schema.org/'},
+    '@id': 'https://example.org/alice',
+    'name': 'Alice',
+}
+
+
+def test_expand():
+    assert fast.expand(DOCUMENT, ExpandOptions().compile()) == (
+        yaml_ld.expand(DOCUMENT)
+    )
+
+
+def test_compact():
+    ctx = {'@vocab': 'https://schema.org/'}
+    assert fast.compact(DOCUMENT, ctx, CompactOptions().compile()) == (
+        yaml_ld.compact(DOCUMENT, ctx=ctx)
+    )
+
+
+def test_to_rdf():
+    assert fast.to_rdf(DOCUMENT, ToRDFOptions().compile()) == (
+        yaml_ld.to_rdf(DOCUMENT)
+    )
+
+
+def test_compiled_options_are_reusable():
+    options = ExpandOptions().compile()
+    fast.expand(DOCUMENT, options)
+
+    assert fast.expand(DOCUMENT, options) == yaml_ld.expand(DOCUMENT)
+    with pytest.raises(TypeError):
+        options['base'] = 'https://example.org/'   # type: ignore
+
+
+def test_parser_options_are_compiled():
+    options = ExpandOptions(yaml_backend=YAMLBackend.PURE).compile()
+
+    assert options['yamlBackend'] == YAMLBackend.PURE
+    assert 'yaml_backend' not in FromRDFOptions.model_fields
+
+
+def test_errors_are_converted():
+    with pytest.raises(MappingKeyError):
+        fast.expand({1: 'one', 'a': 'b'}, ExpandOptions().compile())
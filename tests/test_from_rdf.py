@@ -0,0 +1,80 @@
+import pytest
+from rdflib import BNode, Dataset, Graph, Literal, URIRef
+
+import yaml_ld
+from yaml_ld.errors import InvalidNQuadsLine, PyLDError
+
+NQUADS = (
+    '<https://example.org/alice> <https://schema.org/knows> _:bob .\n'
+    '_:bob <https://schema.org/name> "Bob" .\n'
+    '<https://example.org/alice> <https://schema.org/name> "Alice" '
+    '<https://example.org/graph> .\n'
+)
+
+EXPECTED = [
+    {
+        '@id': '_:b0',
+        'https://schema.org/name': [{'@value': 'Bob'}],
+    },
+    {
+        '@id': 'https://example.org/alice',
+        'https://schema.org/knows': [{'@id': '_:b0'}],
+    },
+    {
+        '@id': 'https://example.org/graph',
+        '@graph': [{
+            '@id': 'https://example.org/alice',
+            'https://schema.org/name': [{'@value': 'Alice'}],
+        }],
+    },
+]
+
+
+def _relabeled(nquads: str) -> str:
+    return nquads.replace('_:bob', '_:b0')
+
+
+def test_nquads():
+    assert yaml_ld.from_rdf(_relabeled(NQUADS)) == EXPECTED
+
+
+def test_invalid_nquads():
+    with pytest.raises(InvalidNQuadsLine) as error_info:
+        yaml_ld.from_rdf('<https://example.org/alice> .\n')
+
+    # As `pyld` used to report it, which callers might be catching.
+    assert isinstance(error_info.value, PyLDError)
+    assert error_info.value.code == 'jsonld.ParseError'
+
+
+def test_dataset():
+    dataset = yaml_ld.to_rdf(yaml_ld.from_rdf(NQUADS))
+
+    assert yaml_ld.from_rdf(dataset) == EXPECTED
+
+
+def test_quads(tmp_path):
+    path = tmp_path / 'people.nq'
+    path.write_text(_relabeled(NQUADS), encoding='utf-8')
+
+    assert yaml_ld.from_rdf(yaml_ld.iter_to_rdf(path)) == EXPECTED
+
+
+def test_rdflib_dataset():
+    dataset = Dataset()
+    dataset.parse(data=NQUADS, format='nquads')
+
+    assert yaml_ld.from_rdf(dataset) == EXPECTED
+
+
+def test_rdflib_graph():
+    graph = Graph()
+    bob = BNode()
+    graph.add((
+        URIRef('https://example.org/alice'),
+        URIRef('https://schema.org/knows'),
+        bob,
+    ))
+    graph.add((bob, URIRef('https://schema.org/name'), Literal('Bob')))
+
+    assert yaml_ld.from_rdf(graph) == EXPECTED[:2]
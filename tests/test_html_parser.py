@@ -0,0 +1,215 @@
+import io
+
+import lxml.html
+import pytest
+from yarl import URL
+
+from yaml_ld.document_loaders.http import LinkHeader
+from yaml_ld.document_parsers import html_parser
+from yaml_ld.document_parsers.html_parser import HTMLDocumentParser
+from yaml_ld.errors import LoadingDocumentFailed, NoLinkedDataFoundInHTML
+
+HTML = b'''<!DOCTYPE html>
+<html>
+<head>
+  <base href="/base/">
+  <link rel="alternate stylesheet" type="application/ld+json" href="a.jsonld">
+  <link rel="alternate" href="untyped.jsonld">
+  <link rel="icon" type="image/png" href="icon.png">
+  <script type="application/ld+json">{"@id": "alice", "name": "Alice"}</script>
+  <script type="application/ld+yaml">
+    "@id": bob
+    name: Bob
+  </script>
+  <script>console.log('not LD');</script>
+</head>
+<body><a href="document.jsonld">Download</a></body>
+</html>
+'''
+
+
+def _parse(html: bytes, options=None):
+    return HTMLDocumentParser()(
+        data_stream=io.BytesIO(html),
+        source='https://example.org/page',
+        options={} if options is None else options,
+    )
+
+
+def test_link_tags():
+    links = HTMLDocumentParser().extract_link_tags(
+        lxml.html.fromstring(HTML),
+        source='https://example.org/page',
+    )
+
+    assert links == [
+        LinkHeader(
+            url=URL('https://example.org/a.jsonld'),
+            rel='alternate',
+            content_type='application/ld+json',
+            attributes={},
+        ),
+    ]
+
+
+def test_nanodash_anchors():
+    links = HTMLDocumentParser().extract_link_tags(
+        lxml.html.fromstring(HTML),
+        source='https://w3id.org/np/RA123',
+    )
+
+    assert links[-1].url == 'document.jsonld'
+
+
+def test_first_script():
+    html = HTML.replace(b'<link rel="alternate stylesheet"', b'<link')
+
+    assert _parse(html) == {'@id': 'alice', 'name': 'Alice'}
+
+
+def test_all_scripts():
+    html = HTML.replace(b'<link rel="alternate stylesheet"', b'<link')
+    options = {'extractAllScripts': True}
+
+    assert _parse(html, options) == [
+        {'@id': 'alice', 'name': 'Alice'},
+        {'@id': 'bob', 'name': 'Bob'},
+    ]
+    assert options['base'] == 'https://example.org/base/'
+
+
+def test_no_linked_data():
+    with pytest.raises(NoLinkedDataFoundInHTML):
+        _parse(b'<html><body><p>Nothing here</p></body></html>')
+
+
+def test_reading_stops_after_first_script():
+    html = (
+        b'<html><head>'
+        b'<script type="application/ld+json">{"@id": "alice"}</script>'
+        b'</head><body>' + b'<p>Lorem ipsum</p>' * 100000 + b'</body></html>'
+    )
+    data_stream = io.BytesIO(html)
+
+    document = HTMLDocumentParser()(
+        data_stream=data_stream,
+        source='https://example.org/page',
+        options={},
+    )
+
+    assert document == {'@id': 'alice'}
+    assert data_stream.tell() < len(html) / 10
+
+
+BODY_LINK = (
+    b'<html><head><title>Page</title></head><body>'
+    b'<link rel="alternate" type="application/ld+json" href="a.jsonld">'
+    b'<script type="application/ld+json">{"@id": "body"}</script>'
+    b'</body></html>'
+)
+
+
+def test_link_in_body_is_ignored():
+    links = HTMLDocumentParser().extract_link_tags(
+        lxml.html.fromstring(BODY_LINK),
+        source='https://example.org/page',
+    )
+
+    assert not links
+
+
+@pytest.mark.parametrize('html', [
+    HTML.replace(b'<link rel="alternate stylesheet"', b'<link'),
+    BODY_LINK,
+    b'<p>No head</p><script type="application/ld+json">{"@id": "a"}</script>',
+    (
+        b'<html><head><script type="application/ld+json">[]</script></head>'
+        b'<body><script type="text/plain">x</script>'
+        b'<script type="application/ld+json">{"@id": "body"}</script>'
+        b'</body></html>'
+    ),
+])
+def test_streaming_agrees_with_tree(html: bytes):
+    streaming_options: dict = {}
+    tree_options = {'extractAllScripts': True}
+
+    first_document = _parse(html, streaming_options)
+
+    assert first_document == _parse(html, tree_options)[0]
+    assert streaming_options.get('base') == tree_options.get('base')
+
+
+def _catalog_page(count: int) -> bytes:
+    scripts = [
+        (
+            f'<script type="application/ld+yaml">\n'
+            f'"@id": https://example.org/product/{index}\n'
+            f'name: Product {index}\n'
+            '</script>'
+        ) if index % 2 else (
+            '<script type="application/ld+json">'
+            f'{{"@id": "https://example.org/product/{index}"}}'
+            '</script>'
+        )
+        for index in range(count)
+    ]
+    return f'<html><body>{"".join(scripts)}</body></html>'.encode()
+
+
+def test_scripts_parsed_in_parallel_keep_source_order(monkeypatch):
+    monkeypatch.setattr(
+        'yaml_ld.document_parsers.html_parser.PARALLEL_SCRIPTS_THRESHOLD',
+        0,
+    )
+    html = _catalog_page(20)
+
+    documents = _parse(html, {'extractAllScripts': True, 'scriptWorkers': 2})
+
+    assert documents == _parse(html, {'extractAllScripts': True})
+    assert [document['@id'] for document in documents] == [
+        f'https://example.org/product/{index}' for index in range(20)
+    ]
+
+
+def test_small_page_is_parsed_serially(monkeypatch):
+    monkeypatch.setattr(
+        'yaml_ld.document_parsers.html_parser._script_pool',
+        None,
+    )
+
+    assert len(
+        _parse(
+            _catalog_page(4),
+            {'extractAllScripts': True, 'scriptWorkers': 2},
+        ),
+    ) == 4
+
+
+def test_error_in_worker_is_raised(monkeypatch):
+    monkeypatch.setattr(
+        'yaml_ld.document_parsers.html_parser.PARALLEL_SCRIPTS_THRESHOLD',
+        0,
+    )
+    html = _catalog_page(4).replace(
+        b'</body>',
+        b'<script type="application/ld+yaml">name: "unterminated</script>'
+        b'</body>',
+    )
+
+    with pytest.raises(LoadingDocumentFailed):
+        _parse(html, {'extractAllScripts': True, 'scriptWorkers': 2})
+
+
+def test_script_pool_is_shut_down_at_exit(monkeypatch):
+    exit_handlers = []
+    monkeypatch.setattr(
+        'atexit.register',
+        lambda handler, **kwargs: exit_handlers.append((handler, kwargs)),
+    )
+    html_parser._script_pool.cache_clear()
+
+    pool = html_parser._script_pool(1)   # noqa: WPS437
+
+    assert exit_handlers == [(pool.shutdown, {'cancel_futures': True})]
+    pool.shutdown()
+    html_parser._script_pool.cache_clear()
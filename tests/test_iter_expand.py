@@ -0,0 +1,173 @@
+import io
+import json
+
+import pytest
+
+import yaml_ld
+from yaml_ld.errors import CycleDetected, LoadingDocumentFailed
+from yaml_ld.expand import ExpandOptions
+from yaml_ld.nquads_writer import to_nquad
+from yaml_ld.to_rdf import ToRDFOptions
+
+STREAM = b'''
+"@context": {"@vocab": "https://schema.org/"}
+"@id": "https://example.org/alice"
+knows: {"@id": "_:bob"}
+---
+"@context": {"@vocab": "https://schema.org/"}
+"@id": "_:bob"
+name: Bob
+'''
+
+
+@pytest.fixture()
+def stream_path(tmp_path):
+    path = tmp_path / 'stream.yamlld'
+    path.write_bytes(STREAM)
+    return path
+
+
+def test_iter_expand(stream_path):
+    assert list(yaml_ld.iter_expand(stream_path)) == yaml_ld.expand(
+        stream_path,
+        options=ExpandOptions(extract_all_scripts=True),
+    )
+
+
+def test_iter_to_rdf(stream_path):
+    quads = list(yaml_ld.iter_to_rdf(io.BytesIO(STREAM)))
+
+    triples = [
+        {key: quad_value for key, quad_value in quad.items() if key != 'graph'}
+        for quad in quads
+    ]
+    expected_triples = yaml_ld.to_rdf(stream_path)['@default']
+    assert sorted(map(repr, triples)) == sorted(map(repr, expected_triples))
+
+    # Blank node labels are shared between documents of the stream.
+    assert quads[0]['object'] == quads[1]['subject']
+
+
+def test_documents_are_read_one_at_a_time():
+    stream = io.BytesIO(STREAM + b'---\nname: "unterminated\n')
+    nodes = yaml_ld.iter_expand(stream)
+
+    assert next(nodes)['@id'] == 'https://example.org/alice'
+    assert next(nodes)['@id'] == '_:bob'
+    with pytest.raises(LoadingDocumentFailed):
+        next(nodes)
+
+    assert not stream.closed
+
+
+def test_root_sequence_items_are_read_one_at_a_time():
+    stream = io.StringIO(
+        '- "@id": https://example.org/alice\n'
+        '  https://schema.org/name: Alice\n'
+        '- "@id": https://example.org/bob\n'
+        '  https://schema.org/name: "unterminated\n',
+    )
+    nodes = yaml_ld.iter_expand(stream)
+
+    assert next(nodes)['@id'] == 'https://example.org/alice'
+    with pytest.raises(LoadingDocumentFailed):
+        next(nodes)
+
+
+def test_alias_to_previous_item():
+    stream = io.StringIO('''
+- "@id": https://example.org/alice
+  https://schema.org/address: &address
+    https://schema.org/addressLocality: Lisbon
+- "@id": https://example.org/bob
+  https://schema.org/address: *address
+''')
+
+    alice, bob = yaml_ld.iter_expand(stream)
+
+    assert alice['https://schema.org/address'] == (
+        bob['https://schema.org/address']
+    )
+
+
+def test_alias_to_root_sequence():
+    stream = io.StringIO(
+        '&root\n'
+        '- "@id": https://example.org/alice\n'
+        '- *root\n',
+    )
+
+    with pytest.raises(CycleDetected):
+        list(yaml_ld.iter_expand(stream))
+
+
+def test_json_ld_array_items_are_read_one_at_a_time(tmp_path):
+    path = tmp_path / 'dump.jsonld'
+    path.write_text(
+        '[{"@id": "https://example.org/alice", '
+        '"https://schema.org/name": "Alice"}, '
+        '{"@id": "https://example.org/bob", "https://schema.org/name": ',
+    )
+    nodes = yaml_ld.iter_expand(path)
+
+    assert next(nodes)['@id'] == 'https://example.org/alice'
+    with pytest.raises(LoadingDocumentFailed):
+        next(nodes)
+
+
+def test_iter_to_rdf_json_ld(tmp_path):
+    path = tmp_path / 'dump.jsonld'
+    path.write_text(json.dumps([
+        {
+            '@context': {'@vocab': 'https://schema.org/'},
+            '@id': f'https://example.org/person/{index}',
+            'name': f'Person {index}',
+            'knows': {'@id': '_:friend'},
+        }
+        for index in range(3)
+    ]))
+
+    quads = list(yaml_ld.iter_to_rdf(path))
+
+    assert len(quads) == 6
+    assert sorted(map(repr, quads)) == sorted(
+        repr({**triple, 'graph': '@default'})
+        for triple in yaml_ld.to_rdf(path)['@default']
+    )
+
+
+@pytest.mark.parametrize(('file_name', 'document'), [
+    (
+        'repeated.yamlld',
+        '- {"@id": "https://example.org/a", "https://schema.org/name": A}\n'
+        '- {"@id": "https://example.org/a", "https://schema.org/name": A}\n',
+    ),
+    (
+        'graph.yamlld',
+        '"@context": {"@vocab": "https://schema.org/"}\n'
+        '"@graph": [{"@id": "https://example.org/a", name: A}]\n',
+    ),
+    (
+        'graph.jsonld',
+        '{"@context": {"@vocab": "https://schema.org/"}, '
+        '"@graph": [{"@id": "https://example.org/a", "name": "A"}]}',
+    ),
+    (
+        'graphs.jsonld',
+        '[{"@graph": [{"@id": "https://example.org/a", '
+        '"https://schema.org/name": "A"}]}, '
+        '{"@id": "https://example.org/a", "https://schema.org/name": "A"}]',
+    ),
+])
+def test_iter_to_rdf_matches_to_rdf(tmp_path, file_name: str, document: str):
+    path = tmp_path / file_name
+    path.write_text(document, encoding='utf-8')
+
+    quads = list(yaml_ld.iter_to_rdf(path))
+
+    nquads = yaml_ld.to_rdf(
+        path,
+        options=ToRDFOptions(format='application/n-quads'),
+    )
+    # A quad of several documents is repeated, which is harmless in RDF.
+    assert set(map(to_nquad, quads)) == set(nquads.splitlines(keepends=True))
@@ -0,0 +1,135 @@
+import io
+import json
+import math
+
+import pytest
+
+from yaml_ld.document_parsers.json_parser import JSONDocumentParser
+from yaml_ld.errors import (
+    DocumentIsScalar,
+    InvalidEncoding,
+    LoadingDocumentFailed,
+)
+from yaml_ld.json_backend import (
+    JSONBackend,
+    choose_json_backend,
+    load_items,
+)
+
+FAST_BACKENDS = [
+    pytest.param(
+        backend,
+        marks=pytest.mark.skipif(
+            choose_json_backend(backend) != backend,
+            reason=f'{backend} is not installed.',
+        ),
+    )
+    for backend in (JSONBackend.ORJSON, JSONBackend.MSGSPEC)
+]
+
+DOCUMENTS = [
+    '{"@id": "https://example.org/alice", "name": "Alice"}',
+    '[{"@id": "_:b0"}, {"@id": "_:b1", "name": "Ω \\u00e9"}]',
+    '{"numbers": [0, -0, 1.5, 1e3, 9223372036854775807]}',
+    '{"big": 123456789012345678901234567890}',
+    '{"big": -18446744073709551616}',
+    '{"huge": 1e400}',
+    '{"lone surrogate": "\\ud800"}',
+]
+
+
+def _parse(document: bytes, backend: JSONBackend):
+    return JSONDocumentParser()(
+        data_stream=io.BytesIO(document),
+        source='',
+        options={'jsonBackend': backend},   # type: ignore
+    )
+
+
+@pytest.mark.parametrize('backend', FAST_BACKENDS)
+@pytest.mark.parametrize('document', DOCUMENTS)
+def test_backends_agree(document: str, backend: JSONBackend):
+    assert _parse(document.encode(), backend) == (
+        _parse(document.encode(), JSONBackend.STDLIB)
+    )
+
+
+@pytest.mark.parametrize('backend', FAST_BACKENDS)
+def test_long_integer_stays_integer(backend: JSONBackend):
+    document = _parse(b'{"big": 123456789012345678901234567890}', backend)
+
+    assert document['big'] == 123456789012345678901234567890
+
+
+@pytest.mark.parametrize('backend', FAST_BACKENDS)
+def test_nan(backend: JSONBackend):
+    assert math.isnan(_parse(b'{"value": NaN}', backend)['value'])
+
+
+@pytest.mark.parametrize('backend', [*FAST_BACKENDS, JSONBackend.STDLIB])
+@pytest.mark.parametrize(('document', 'error_class'), [
+    (b'{"name": "\xff"}', InvalidEncoding),
+    (b'{"name": ', LoadingDocumentFailed),
+    (b'"scalar"', DocumentIsScalar),
+])
+def test_errors(document: bytes, error_class, backend: JSONBackend):
+    with pytest.raises(error_class):
+        _parse(document, backend)
+
+
+def test_unavailable_backend_falls_back(monkeypatch):
+    monkeypatch.setattr('yaml_ld.json_backend._fast_decoders', {})
+
+    assert choose_json_backend() == JSONBackend.STDLIB
+    assert choose_json_backend(JSONBackend.ORJSON) == JSONBackend.STDLIB
+
+
+def test_environment_variable(monkeypatch):
+    monkeypatch.setenv('YAML_LD_JSON_BACKEND', 'json')
+
+    assert choose_json_backend() == JSONBackend.STDLIB
+
+
+@pytest.mark.parametrize('document', [
+    '[]',
+    ' [ {"a": 1} , 5, [1, 2], {"b": "' + 'x' * 40 + '"}, 12345 ] ',
+    '{"a": [1, 2, 3]}',
+    '[{"number": 1234567890}]',
+])
+def test_load_items(monkeypatch, document: str):
+    monkeypatch.setattr('yaml_ld.json_backend.READ_CHUNK_SIZE', 3)
+
+    items = list(load_items(io.StringIO(document)))
+
+    parsed = json.loads(document)
+    if isinstance(parsed, list):
+        parsed = [item for item in parsed if isinstance(item, (dict, list))]
+    else:
+        parsed = [parsed]
+    assert items == parsed
+
+
+@pytest.mark.parametrize('document', [
+    '',
+    '[{"a": 1},]',
+    '[{"a": 1} {"b": 2}]',
+    '[{"a": 1}] trailing',
+    '[{"a": 1}',
+])
+def test_load_items_errors(document: str):
+    with pytest.raises(json.JSONDecodeError):
+        list(load_items(io.StringIO(document)))
+
+
+@pytest.mark.parametrize(('document', 'is_root_array'), [
+    ('[{"a": 1}]', True),
+    ('{"a": 1}', False),
+])
+def test_load_items_tells_root_array(document: str, is_root_array: bool):
+    items = load_items(io.StringIO(document))
+    next(items)
+
+    with pytest.raises(StopIteration) as stop:
+        next(items)
+
+    assert stop.value.value is is_root_array
@@ -0,0 +1,206 @@
+import pytest
+
+import yaml_ld
+from yaml_ld.document_loaders.document_cache import DocumentCache
+from yaml_ld.document_loaders.local_file import LocalFileDocumentLoader
+from yaml_ld.document_loaders.mapped_file import MappedFile, mapped_file
+from yaml_ld.errors import InvalidEncoding, NotFound
+
+DOCUMENTS = {
+    '.json': '{"@id": "https://example.org/ω", "name": "Ω"}',
+    '.yaml': '"@id": https://example.org/ω\nname: Ω\n',
+    '.md': '---\n"@id": https://example.org/ω\nname: Ω\n---\n# Ω\n',
+    '.ttl': '<https://example.org/ω> <https://schema.org/name> "Ω" .\n',
+}
+
+MAPPED = LocalFileDocumentLoader(mmap_threshold=0)
+UNMAPPED = LocalFileDocumentLoader(mmap_threshold=None)
+
+
+@pytest.mark.parametrize('extension', DOCUMENTS.keys())
+def test_mapped_file_is_parsed_alike(tmp_path, extension):
+    path = tmp_path / f'document{extension}'
+    path.write_text(DOCUMENTS[extension], encoding='utf-8')
+
+    assert MAPPED(path, {})['document'] == UNMAPPED(path, {})['document']
+
+
+def test_mapped_file_keeps_base(tmp_path):
+    path = tmp_path / 'document.ttl'
+    path.write_text('<rel/path> <https://schema.org/name> "Ω" .\n')
+
+    (node,) = MAPPED(path, {})['document']
+
+    assert node['@id'] == (tmp_path / 'rel/path').as_uri()
+    assert UNMAPPED(path, {})['document'] == [node]
+
+
+def test_empty_file_is_not_mapped(tmp_path):
+    path = tmp_path / 'empty.json'
+    path.write_bytes(b'')
+
+    with MAPPED.open(path) as data_stream:
+        assert not isinstance(data_stream, MappedFile)
+
+
+def test_invalid_encoding(tmp_path):
+    path = tmp_path / 'document.json'
+    path.write_bytes(b'{"name": "\xff"}')
+
+    with pytest.raises(InvalidEncoding):
+        MAPPED(path, {})
+
+
+def test_not_found(tmp_path):
+    with pytest.raises(NotFound):
+        MAPPED(tmp_path / 'missing.json', {})
+
+
+def test_mapped_file_reads_in_chunks(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'0123456789')
+
+    with mapped_file(path) as data_stream:
+        assert data_stream.read(4) == b'0123'
+        assert data_stream.tell() == 4
+        assert data_stream.read() == b'456789'
+        assert data_stream.read() == b''
+
+        data_stream.seek(-3, 2)
+        chunk = bytearray(5)
+        assert data_stream.readinto(chunk) == 3
+        assert chunk[:3] == b'789'
+
+
+def test_mapped_file_reads_lines(tmp_path, monkeypatch):
+    path = tmp_path / 'lines.yaml'
+    path.write_bytes(b'- a\n- bc\n\n- d')
+
+    # A line is found in the mapping, not read one byte after another.
+    monkeypatch.setattr(MappedFile, 'read', None)
+    with mapped_file(path) as data_stream:
+        assert data_stream.peek(3) == b'- a'
+        assert data_stream.readline() == b'- a\n'
+        assert data_stream.readline(3) == b'- b'
+        assert list(data_stream) == [b'c\n', b'\n', b'- d']
+        assert data_stream.readline() == b''
+
+        data_stream.seek(0)
+        assert data_stream.readlines() == path.read_bytes().splitlines(
+            keepends=True,
+        )
+
+
+def test_unchanged_file_is_parsed_once(tmp_path):
+    path = tmp_path / 'context.json'
+    path.write_text('{"@context": {"@vocab": "https://schema.org/"}}')
+    loader = LocalFileDocumentLoader()
+
+    first = loader(path, {})
+    second = loader(f'file://{path}', {})
+
+    assert second['document'] == first['document']
+    assert second['documentUrl'] == f'file://{path}'
+    assert loader.cache.statistics.hits == 1
+
+
+def test_modified_document_does_not_change_cache(tmp_path):
+    path = tmp_path / 'context.json'
+    path.write_text('{"@context": {"@vocab": "https://schema.org/"}}')
+    loader = LocalFileDocumentLoader()
+
+    loader(path, {})['document']['@context']['@vocab'] = 'https://example.org/'
+    loader(path, {})['document'].clear()
+
+    assert loader(path, {})['document'] == {
+        '@context': {'@vocab': 'https://schema.org/'},
+    }
+    assert loader.cache.statistics.hits == 2
+
+
+def test_changed_file_is_parsed_again(tmp_path):
+    path = tmp_path / 'context.json'
+    path.write_text('{"name": "Alice"}')
+    loader = LocalFileDocumentLoader()
+    loader(path, {})
+
+    path.write_text('{"name": "Bob, changed"}')
+
+    assert loader(path, {})['document'] == {'name': 'Bob, changed'}
+
+
+def test_invalidate(tmp_path):
+    path = tmp_path / 'context.json'
+    path.write_text('{"name": "Alice"}')
+    loader = LocalFileDocumentLoader()
+    loader(path, {})
+
+    loader.cache.invalidate(path)
+
+    assert not loader.cache
+    assert loader(path, {})['document'] == {'name': 'Alice'}
+
+
+def test_cache_is_bounded_by_file_size(tmp_path):
+    loader = LocalFileDocumentLoader(cache=DocumentCache(max_size=40))
+    paths = [tmp_path / f'{index}.json' for index in range(3)]
+    for path in paths:
+        path.write_text('{"name": "' + 'x' * 8 + '"}')   # 20 bytes each
+        loader(path, {})
+
+    assert len(loader.cache) == 2
+    assert loader.cache.size == 40
+
+    loader(paths[0], {})
+    assert loader.cache.statistics.hits == 0
+
+
+HTML = """<html><head><base href="https://example.org/dir/"></head><body>
+<script id="first" type="application/ld+json">
+{"@id": "a", "https://schema.org/name": "First"}
+</script>
+<script id="second" type="application/ld+json">
+{"@id": "b", "https://schema.org/name": "Second"}
+</script>
+</body></html>
+"""
+
+
+@pytest.mark.parametrize('fragments', [('', '#second'), ('#second', '')])
+def test_cached_document_depends_on_fragment(tmp_path, fragments):
+    path = tmp_path / 'page.html'
+    path.write_text(HTML, encoding='utf-8')
+
+    documents = {
+        fragment: yaml_ld.expand(f'{path}{fragment}')
+        for fragment in fragments
+    }
+
+    assert documents == {
+        '': [{
+            '@id': 'https://example.org/dir/a',
+            'https://schema.org/name': [{'@value': 'First'}],
+        }],
+        '#second': [{
+            '@id': 'https://example.org/dir/b',
+            'https://schema.org/name': [{'@value': 'Second'}],
+        }],
+    }
+
+
+def test_cached_html_keeps_base(tmp_path):
+    path = tmp_path / 'page.html'
+    path.write_text(HTML, encoding='utf-8')
+    loader = LocalFileDocumentLoader()
+
+    first_options: dict = {}
+    loader(path, first_options)   # type: ignore
+    second_options: dict = {}
+    loader(path, second_options)   # type: ignore
+
+    assert loader.cache.statistics.hits == 1
+    assert second_options['base'] == first_options['base'] == (
+        'https://example.org/dir/'
+    )
+    assert yaml_ld.to_rdf(path) == yaml_ld.to_rdf(path)
+    assert len(yaml_ld.to_rdf(path)['@default']) == 2
@@ -0,0 +1,31 @@
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from yaml_ld.models import JsonLdInput
+
+INPUT_ADAPTER = TypeAdapter(JsonLdInput)
+
+
+@pytest.mark.parametrize(
+    'document',
+    [
+        {'@id': 'https://example.org/alice', 'knows': [{'@id': '_:b0'}]},
+        [{'@id': 'https://example.org/alice'}],
+        'https://example.org/alice.yamlld',
+    ],
+)
+def test_document_is_passed_by_reference(document):
+    assert INPUT_ADAPTER.validate_python(document) is document
+
+
+def test_nested_containers_are_not_copied():
+    records = [{'@id': '_:b0'}, {'@id': '_:b1'}]
+
+    validated = INPUT_ADAPTER.validate_python(records)
+
+    assert validated[0] is records[0]
+
+
+def test_wrong_top_level_type():
+    with pytest.raises(ValidationError):
+        INPUT_ADAPTER.validate_python(42)
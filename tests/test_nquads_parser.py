@@ -0,0 +1,119 @@
+import io
+
+import pytest
+import yaml_ld
+from yaml_ld.document_loaders import content_types
+from yaml_ld.document_parsers.nquads_parser import NQuadsParser, NTriplesParser
+from yaml_ld.errors import InvalidEncoding, InvalidNQuadsLine
+from yaml_ld.to_rdf import ToRDFOptions
+
+NQUADS = (
+    '# People\n'
+    '<https://example.org/alice> <https://schema.org/name> "Alice" .\n'
+    '\n'
+    '<https://example.org/alice> <https://schema.org/knows> _:bob.1 .\r\n'
+    '_:bob.1 <https://schema.org/name> "Bob \\"B\\u00F6b\\"\\n"@de-AT .\r'
+    '_:bob.1 <https://schema.org/age> "42"^^<http://www.w3.org/2001/'
+    'XMLSchema#integer> <https://example.org/graph> .  # Named graph\n'
+    '<https://example.org/alice> <https://schema.org/name> "Alice" .\n'
+)
+
+
+def test_dataset_skips_repeated_quads():
+    dataset = NQuadsParser().dataset(NQUADS, source='', options={})
+
+    assert {
+        graph_name: len(triples)
+        for graph_name, triples in dataset.items()
+    } == {'@default': 3, 'https://example.org/graph': 1}
+
+
+def test_unescape():
+    quads = list(NQuadsParser().iter_quads(NQUADS, source=''))
+
+    assert quads[2]['object'] == {
+        'type': 'literal',
+        'value': 'Bob "Böb"\n',
+        'datatype': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#langString',
+        'language': 'de-AT',
+    }
+    assert quads[1]['object'] == {'type': 'blank node', 'value': '_:bob.1'}
+    assert quads[3]['graph'] == 'https://example.org/graph'
+
+
+def test_iter_quads_keeps_repeated_quads():
+    quads = list(NQuadsParser().iter_quads(io.BytesIO(NQUADS.encode()), ''))
+
+    assert len(quads) == 5
+
+
+@pytest.mark.parametrize('line', [
+    '<https://example.org/alice> <https://schema.org/name> "Alice"\n',
+    '"Alice" <https://schema.org/name> <https://example.org/alice> .\n',
+    '<https://example.org/alice> _:name "Alice" .\n',
+])
+def test_invalid_line(line):
+    with pytest.raises(InvalidNQuadsLine) as error_info:
+        list(NQuadsParser().iter_quads(f'\n{line}', source='data.nq'))
+
+    assert error_info.value.line_number == 2
+
+
+def test_n_triples_reject_graph_names():
+    with pytest.raises(InvalidNQuadsLine):
+        NTriplesParser().dataset(NQUADS, source='data.nt', options={})
+
+
+def test_invalid_encoding():
+    with pytest.raises(InvalidEncoding):
+        NQuadsParser().dataset(b'<a:b> <a:c> "\xff" .\n', '', options={})
+
+
+@pytest.mark.parametrize(('extension', 'parser'), [
+    ('.nt', NTriplesParser),
+    ('.nq', NQuadsParser),
+])
+def test_content_type_by_extension(extension, parser):
+    content_type = content_types.by_extension(extension)
+
+    assert isinstance(
+        content_types.parser_by_content_type(content_type, uri=''),
+        parser,
+    )
+
+
+def test_to_rdf(tmp_path):
+    path = tmp_path / 'people.nq'
+    path.write_text(NQUADS, encoding='utf-8')
+
+    nquads = yaml_ld.to_rdf(
+        path,
+        options=ToRDFOptions(format='application/n-quads'),
+    )
+
+    assert nquads.splitlines() == [
+        '<https://example.org/alice> <https://schema.org/knows> _:bob.1 .',
+        '<https://example.org/alice> <https://schema.org/name> "Alice" .',
+        '_:bob.1 <https://schema.org/age> "42"^^<http://www.w3.org/2001/'
+        'XMLSchema#integer> <https://example.org/graph> .',
+        '_:bob.1 <https://schema.org/name> "Bob \\"Böb\\"\\n"@de-AT .',
+    ]
+
+
+def test_iter_to_rdf_streams_lines(tmp_path):
+    path = tmp_path / 'people.nt'
+    path.write_text(
+        '<https://example.org/alice> <https://schema.org/name> "Alice" .\n',
+        encoding='utf-8',
+    )
+
+    assert list(yaml_ld.iter_to_rdf(path)) == [{
+        'subject': {'type': 'IRI', 'value': 'https://example.org/alice'},
+        'predicate': {'type': 'IRI', 'value': 'https://schema.org/name'},
+        'object': {
+            'type': 'literal',
+            'value': 'Alice',
+            'datatype': 'http://www.w3.org/2001/XMLSchema#string',
+        },
+        'graph': '@default',
+    }]
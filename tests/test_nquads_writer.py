@@ -0,0 +1,182 @@
+import io
+import json
+import os
+import pty
+import subprocess  # noqa: S404
+import sys
+import tracemalloc
+
+import pytest
+from typer.testing import CliRunner
+
+import yaml_ld
+from yaml_ld import cli as cli_module
+from yaml_ld.cli import cli
+from yaml_ld.to_rdf import ToRDFOptions
+
+STREAM = '''
+"@context": {"@vocab": "https://schema.org/"}
+"@id": https://example.org/alice
+name: Alice
+knows: {name: Bob}
+---
+"@id": https://example.org/carol
+"https://schema.org/name": Carol
+'''
+
+GRAPHS = '''
+- "@context": {"@vocab": "https://schema.org/"}
+  "@id": https://example.org/alice
+  name: Alice
+- "@context": {"@vocab": "https://schema.org/"}
+  "@id": https://example.org/alice
+  name: Alice
+---
+"@context": {"@vocab": "https://schema.org/"}
+"@graph": [{"@id": "https://example.org/carol", name: Carol}]
+'''
+
+TO_RDF = (
+    sys.executable,
+    '-c',
+    'from yaml_ld.cli import app; app()',
+    'to-rdf',
+)
+
+
+class CountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+def test_write_nquads_matches_to_rdf(tmp_path):
+    path = tmp_path / 'people.yamlld'
+    path.write_text(STREAM, encoding='utf-8')
+    text_stream = io.StringIO()
+
+    count = yaml_ld.write_nquads(yaml_ld.iter_to_rdf(path), text_stream)
+
+    nquads = yaml_ld.to_rdf(
+        path,
+        options=ToRDFOptions(format='application/n-quads'),
+    )
+    assert count == 4
+    assert sorted(text_stream.getvalue().splitlines()) == nquads.splitlines()
+
+
+def test_write_nquads_in_batches():
+    quads = [
+        {
+            'subject': {'type': 'IRI', 'value': f'https://example.org/{index}'},
+            'predicate': {'type': 'IRI', 'value': 'https://schema.org/name'},
+            'object': {'type': 'blank node', 'value': '_:b0'},
+            'graph': '_:b1',
+        }
+        for index in range(5)
+    ]
+    text_stream = CountingStream()
+
+    assert yaml_ld.write_nquads(quads, text_stream, batch_size=2) == 5
+    assert text_stream.writes == 3
+    assert text_stream.getvalue().splitlines()[-1] == (
+        '<https://example.org/4> <https://schema.org/name> _:b0 _:b1 .'
+    )
+
+
+def test_cli_streams_quads(tmp_path):
+    path = tmp_path / 'people.yamlld'
+    path.write_text(STREAM, encoding='utf-8')
+
+    output = CliRunner().invoke(cli, ['to-rdf', str(path)]).stdout
+
+    nquads = yaml_ld.to_rdf(
+        path,
+        options=ToRDFOptions(format='application/n-quads'),
+    )
+    assert sorted(output.splitlines()) == nquads.splitlines()
+
+
+def _read_all(descriptor: int) -> str:
+    chunks = []
+    while True:
+        try:
+            chunk = os.read(descriptor, 4096)
+        except OSError:
+            # Linux reports the end of a pseudo-terminal as an error.
+            break
+
+        if not chunk:
+            break
+
+        chunks.append(chunk)
+
+    return b''.join(chunks).decode()
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='No pseudo-terminals.')
+def test_cli_output_does_not_depend_on_terminal(tmp_path):
+    path = tmp_path / 'graphs.yamlld'
+    path.write_text(GRAPHS, encoding='utf-8')
+
+    piped = subprocess.run(   # noqa: S603
+        [*TO_RDF, str(path)],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    leader, follower = pty.openpty()
+    with subprocess.Popen(   # noqa: S603
+        [*TO_RDF, str(path)],
+        stdout=follower,
+    ) as process:
+        os.close(follower)
+        printed = _read_all(leader)
+
+    os.close(leader)
+    assert process.returncode == 0
+
+    nquads = yaml_ld.to_rdf(
+        path,
+        options=ToRDFOptions(format='application/n-quads'),
+    )
+    assert printed.replace('\r\n', '\n') == piped
+    assert set(piped.splitlines(keepends=True)) == set(
+        nquads.splitlines(keepends=True),
+    )
+
+
+def _to_rdf_peak_memory(path, nodes: int, monkeypatch) -> int:
+    path.write_text(json.dumps([
+        {
+            '@id': f'https://example.org/person/{index}',
+            'https://schema.org/name': [
+                f'Person {index}, name {name}' for name in range(10)
+            ],
+        }
+        for index in range(nodes)
+    ]))
+
+    with open(os.devnull, 'w') as devnull:
+        monkeypatch.setattr(sys, 'stdout', devnull)
+        tracemalloc.start()
+        try:
+            cli_module.to_rdf(input_=str(path))
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return peak
+
+
+def test_cli_memory_does_not_grow_with_output(tmp_path, monkeypatch):
+    # Both write more quads than `write_nquads()` collects into a batch.
+    small = _to_rdf_peak_memory(tmp_path / 'small.jsonld', 500, monkeypatch)
+    large = _to_rdf_peak_memory(tmp_path / 'large.jsonld', 2000, monkeypatch)
+
+    assert large < small * 1.5
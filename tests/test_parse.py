@@ -1,3 +1,4 @@
+import io
 from pathlib import Path
 
 import more_itertools
@@ -6,7 +7,9 @@ from ruamel.yaml.parser import ParserError
 from yarl import URL
 
 from tests.common import tests_root
-from yaml_ld.loader import load_all  # noqa: WPS347
+from yaml_ld.document_parsers.yaml_parser import YAMLDocumentParser
+from yaml_ld.errors import CycleDetected, InvalidEncoding
+from yaml_ld.loader import load_all, load_items  # noqa: WPS347
 from yaml_ld.string_as_url_or_path import as_url_or_path
 
 
@@ -35,3 +38,50 @@ def test_closing_html_comment_in_yaml():
 )
 def test_string_as_url_or_path(given: str, expected: URL):
     assert as_url_or_path(given) == expected
+
+
+def test_invalid_encoding_after_first_document():
+    data_stream = io.BytesIO(b'"@id": https://example.org/\n---\nname: \xff\n')
+
+    with pytest.raises(InvalidEncoding):
+        YAMLDocumentParser()(
+            data_stream=data_stream,
+            source='',
+            options={},   # type: ignore
+        )
+
+    assert not data_stream.closed
+
+
+def test_line_breaks_are_read_as_they_are():
+    assert YAMLDocumentParser()(
+        data_stream=io.BytesIO('name: "Ω\r\n  ω"\r\n'.encode()),
+        source='',
+        options={},   # type: ignore
+    ) == {'name': 'Ω ω'}
+
+
+@pytest.mark.parametrize(
+    'document',
+    [
+        'a: &node {b: *node}',
+        '&node [1, *node]',
+        'a: &node [{b: [c, *node]}]',
+    ],
+)
+def test_alias_cycle(document: str):
+    with pytest.raises(CycleDetected):
+        more_itertools.consume(load_all(document))
+
+
+def test_aliases_share_constructed_object():
+    (document,) = load_all('a: &node {b: c}\nd: [*node, *node]\n')
+
+    assert document['d'][0] is document['a']
+    assert document['d'][1] is document['a']
+
+
+def test_aliases_share_object_between_root_sequence_items():
+    first, second = load_items('- &node {b: [c]}\n- d: *node\n')
+
+    assert second['d'] is first
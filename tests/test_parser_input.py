@@ -0,0 +1,67 @@
+import io
+
+import pytest
+
+from yaml_ld.document_parsers.html_parser import HTMLDocumentParser
+from yaml_ld.document_parsers.json_parser import JSONDocumentParser
+from yaml_ld.document_parsers.markdown_parser import MarkdownDocumentParser
+from yaml_ld.document_parsers.rdf_xml_parser import RDFXMLParser
+from yaml_ld.document_parsers.turtle_parser import TurtleParser
+from yaml_ld.document_parsers.yaml_parser import YAMLDocumentParser
+from yaml_ld.errors import InvalidEncoding
+
+DOCUMENTS = {
+    JSONDocumentParser: '{"@id": "https://example.org/ω", "name": "Ω"}',
+    YAMLDocumentParser: '"@id": https://example.org/ω\nname: Ω\n',
+    MarkdownDocumentParser: '---\n"@id": https://example.org/ω\n---\n# Ω\n',
+    TurtleParser: '<https://example.org/ω> <https://schema.org/name> "Ω" .',
+    RDFXMLParser: (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+        'xmlns:schema="https://schema.org/">'
+        '<rdf:Description rdf:about="https://example.org/ω">'
+        '<schema:name>Ω</schema:name>'
+        '</rdf:Description></rdf:RDF>'
+    ),
+    HTMLDocumentParser: (
+        '<html><head><meta charset="utf-8">'
+        '<script type="application/ld+json">{"name": "Ω"}</script>'
+        '</head></html>'
+    ),
+}
+
+INPUTS = {
+    'binary stream': lambda text: io.BytesIO(text.encode()),
+    'text stream': io.StringIO,
+    'str': str,
+    'bytes': str.encode,
+    'memoryview': lambda text: memoryview(text.encode()),
+}
+
+
+@pytest.mark.parametrize('input_kind', INPUTS.keys())
+@pytest.mark.parametrize('parser_class', DOCUMENTS.keys())
+def test_parsers_accept_content(parser_class, input_kind: str):
+    document = DOCUMENTS[parser_class]
+
+    def parse(data_stream):   # noqa: WPS430
+        return parser_class()(
+            data_stream=data_stream,
+            source='https://example.org/',
+            options={},
+        )
+
+    assert parse(INPUTS[input_kind](document)) == (
+        parse(io.BytesIO(document.encode()))
+    )
+
+
+@pytest.mark.parametrize('parser_class', [
+    JSONDocumentParser,
+    YAMLDocumentParser,
+    MarkdownDocumentParser,
+])
+@pytest.mark.parametrize('content', [b'name: "\xff"', memoryview(b'\xff')])
+def test_invalid_encoding_of_content(parser_class, content):
+    with pytest.raises(InvalidEncoding):
+        parser_class()(data_stream=content, source='', options={})
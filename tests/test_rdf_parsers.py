@@ -0,0 +1,130 @@
+import pytest
+from pyld import jsonld
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+import yaml_ld
+from yaml_ld.document_loaders.local_file import LocalFileDocumentLoader
+from yaml_ld.document_parsers.rdf_parser import RDFDataset
+from yaml_ld.document_parsers.rdf_xml_parser import RDFXMLParser
+from yaml_ld.document_parsers.turtle_parser import TurtleParser
+from yaml_ld.to_rdf import ToRDFOptions
+
+TURTLE = """
+@prefix schema: <https://schema.org/> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+<https://example.org/alice> a schema:Person ;
+    schema:name "Alice", "Алиса"@ru ;
+    schema:age "42"^^xsd:integer ;
+    schema:knows [ schema:name "Bob" ] ;
+    schema:colleagues ( <https://example.org/carol> ) .
+"""
+
+N_QUADS = 'application/n-quads'
+
+
+def _graph(nquads: str) -> Graph:
+    return Graph().parse(data=nquads, format='nt')
+
+
+def test_turtle_to_rdf_matches_json_ld(tmp_path):
+    path = tmp_path / 'alice.ttl'
+    path.write_text(TURTLE, encoding='utf-8')
+    document = yaml_ld.load_document(path)['document']
+
+    options = ToRDFOptions(format=N_QUADS)
+    direct = yaml_ld.to_rdf(path, options=options)
+    via_json_ld = yaml_ld.to_rdf(document, options=options)
+
+    assert direct.count('\n') == 9
+    assert isomorphic(_graph(direct), _graph(via_json_ld))
+
+
+def test_turtle_to_rdf_dataset(tmp_path):
+    path = tmp_path / 'alice.ttl'
+    path.write_text(TURTLE, encoding='utf-8')
+
+    dataset = yaml_ld.to_rdf(path)
+
+    assert type(dataset) is dict
+    assert {
+        'type': 'literal',
+        'value': 'Алиса',
+        'datatype': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#langString',
+        'language': 'ru',
+    } in [triple['object'] for triple in dataset['@default']]
+
+
+def test_repeated_triple_is_written_once(tmp_path):
+    path = tmp_path / 'alice.ttl'
+    path.write_text(
+        '<https://example.org/alice> <https://schema.org/name> "Alice" .\n'
+        '<https://example.org/alice> <https://schema.org/name> "Alice"@en .\n'
+        '<https://example.org/alice> <https://schema.org/name> "Alice" .\n',
+        encoding='utf-8',
+    )
+
+    nquads = yaml_ld.to_rdf(path, options=ToRDFOptions(format=N_QUADS))
+
+    assert nquads == jsonld.to_rdf(
+        yaml_ld.expand(path),
+        {'format': N_QUADS},
+    )
+    assert nquads.count('\n') == 2
+
+
+@pytest.mark.parametrize(('parser', 'content'), [
+    (TurtleParser(), b'<rel> <https://schema.org/name> "Alice" .'),
+    (
+        RDFXMLParser(),
+        b'<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+        b'xmlns:schema="https://schema.org/">'
+        b'<rdf:Description rdf:about="rel"><schema:name>Alice</schema:name>'
+        b'</rdf:Description></rdf:RDF>',
+    ),
+])
+def test_relative_iri_is_resolved_against_source(parser, content):
+    dataset = parser.dataset(
+        content,
+        source='https://example.org/dir/alice',
+        options={},
+    )
+
+    (triple,) = dataset['@default']
+    assert triple['subject']['value'] == 'https://example.org/dir/rel'
+
+
+def test_blank_nodes_are_labeled_as_pyld_does():
+    dataset = TurtleParser().dataset(TURTLE, source='', options={})
+
+    blank_nodes = {
+        term['value']
+        for triple in dataset['@default']
+        for term in triple.values()
+        if term['type'] == 'blank node'
+    }
+    assert blank_nodes == {'_:b0', '_:b1'}
+
+
+def test_turtle_parser_keeps_json_ld_output():
+    document = TurtleParser()(TURTLE, source='', options={})
+
+    alice, = [
+        node
+        for node in document
+        if node['@id'] == 'https://example.org/alice'
+    ]
+    assert alice['https://schema.org/name'][0] == {'@value': 'Alice'}
+
+
+@pytest.mark.parametrize('rdf_dataset', [False, True])
+def test_cached_document_depends_on_rdf_dataset_option(tmp_path, rdf_dataset):
+    path = tmp_path / 'alice.ttl'
+    path.write_text(TURTLE, encoding='utf-8')
+    loader = LocalFileDocumentLoader()
+
+    loader(path, {'rdfDataset': not rdf_dataset})   # type: ignore
+    document = loader(path, {'rdfDataset': rdf_dataset})['document']
+
+    assert isinstance(document, RDFDataset) is rdf_dataset
@@ -0,0 +1,103 @@
+from rdflib import BNode, Dataset, Graph, Literal, URIRef
+from rdflib.compare import isomorphic
+from rdflib.plugins.stores.memory import Memory
+
+import yaml_ld
+from yaml_ld.to_rdf import ToRDFOptions
+
+DOCUMENT = {
+    '@context': {'@vocab': 'https://schema.org/'},
+    '@id': 'https://example.org/alice',
+    'name': {'@value': 'Alice', '@language': 'en'},
+    'age': 42,
+    'knows': {'name': 'Bob', 'knows': {'@id': 'https://example.org/alice'}},
+    '@included': [{
+        '@id': 'https://example.org/graph',
+        '@graph': [{'@id': 'https://example.org/carol', 'name': 'Carol'}],
+    }],
+}
+
+NQUADS = (
+    '_:bob <https://schema.org/name> "Bob" _:graph .\n'
+    '<https://example.org/alice> <https://schema.org/knows> _:bob _:graph .\n'
+)
+
+
+class CountingStore(Memory):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = 0
+
+    def addN(self, quads):   # noqa: N802
+        self.batches += 1
+        return super().addN(quads)
+
+
+def test_matches_parsed_nquads():
+    dataset = yaml_ld.to_rdflib(DOCUMENT)
+
+    parsed = Dataset()
+    parsed.parse(
+        data=yaml_ld.to_rdf(
+            DOCUMENT,
+            options=ToRDFOptions(format='application/n-quads'),
+        ),
+        format='nquads',
+    )
+    assert len(dataset) == len(parsed) == 6
+    for graph in parsed.graphs():
+        assert isomorphic(graph, dataset.graph(graph.identifier))
+
+
+def test_blank_node_identity():
+    dataset = yaml_ld.to_rdflib(DOCUMENT, Dataset())
+
+    bob = dataset.value(
+        URIRef('https://example.org/alice'),
+        URIRef('https://schema.org/knows'),
+    )
+    assert isinstance(bob, BNode)
+    assert dataset.value(bob, URIRef('https://schema.org/name')) == (
+        Literal('Bob')
+    )
+
+
+def test_graph_takes_default_graph():
+    graph = yaml_ld.to_rdflib(DOCUMENT, Graph())
+
+    assert len(graph) == 5
+    assert (
+        URIRef('https://example.org/alice'),
+        URIRef('https://schema.org/name'),
+        Literal('Alice', lang='en'),
+    ) in graph
+
+
+def test_add_in_batches():
+    store = CountingStore()
+    graph = Graph(store=store)
+    quads = [
+        {
+            'subject': {'type': 'IRI', 'value': f'https://example.org/{index}'},
+            'predicate': {'type': 'IRI', 'value': 'https://schema.org/knows'},
+            'object': {'type': 'blank node', 'value': '_:b0'},
+            'graph': '@default',
+        }
+        for index in range(5)
+    ]
+
+    assert yaml_ld.add_to_rdflib(quads, graph, batch_size=2) == 5
+    assert store.batches == 3
+    assert len(set(graph.objects())) == 1
+
+
+def test_blank_graph_name(tmp_path):
+    path = tmp_path / 'people.nq'
+    path.write_text(NQUADS, encoding='utf-8')
+    dataset = Dataset()
+
+    assert yaml_ld.add_to_rdflib(yaml_ld.iter_to_rdf(path), dataset) == 2
+
+    (graph_name,) = {context for *_triple, context in dataset.quads()}
+    assert isinstance(graph_name, BNode)
+    assert len(dataset.get_context(graph_name)) == 2
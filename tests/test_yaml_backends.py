@@ -0,0 +1,155 @@
+import io
+
+import pytest
+
+from yaml_ld.document_parsers.yaml_parser import YAMLDocumentParser
+from yaml_ld.errors import CycleDetected, UnknownYAMLBackend
+from yaml_ld.loader import YAMLBackend, choose_backend
+
+requires_libyaml = pytest.mark.skipif(
+    choose_backend(YAMLBackend.LIBYAML) != YAMLBackend.LIBYAML,
+    reason='ruamel.yaml.clib is not installed.',
+)
+
+DOCUMENTS = [
+    'date: 2024-01-15',
+    'time: 2024-01-15T10:00:00Z',
+    'values: [yes, no, on, off, true, False, ~, null, Null]',
+    'numbers: [0o17, 017, 0x1F, 1_000, .inf, -.Inf, .nan, 1e3, 1.5]',
+    '"@id": https://example.org/alice\nknows: https://example.org/bob',
+    'knows: [https://example.org/bob, https://example.org/carol]',
+    '{"@id": "https://example.org/alice", "name": "Alice"}',
+    'name: &name Alice\nnickname: *name',
+    'description: |\n  Line one\n  Line two\n',
+]
+
+
+def _parse(document: str, backend: YAMLBackend):
+    return YAMLDocumentParser()(
+        data_stream=io.BytesIO(document.encode()),
+        source='',
+        options={'yamlBackend': backend},   # type: ignore
+    )
+
+
+@requires_libyaml
+@pytest.mark.parametrize('document', DOCUMENTS)
+def test_backends_agree(document: str):
+    assert _parse(document, YAMLBackend.LIBYAML) == (
+        _parse(document, YAMLBackend.PURE)
+    )
+
+
+def test_timestamps_are_strings():
+    assert _parse('date: 2024-01-15', YAMLBackend.LIBYAML) == {
+        'date': '2024-01-15',
+    }
+
+
+def test_backend_from_environment(monkeypatch):
+    monkeypatch.setenv('YAML_LD_YAML_BACKEND', 'pure')
+
+    assert choose_backend() == YAMLBackend.PURE
+
+
+def test_unknown_backend_from_environment(monkeypatch):
+    monkeypatch.setenv('YAML_LD_YAML_BACKEND', 'fast')
+
+    with pytest.raises(UnknownYAMLBackend) as error_info:
+        choose_backend()
+
+    assert 'libyaml, pure' in str(error_info.value)
+
+
+@requires_libyaml
+def test_fallback_to_pure_backend():
+    """libyaml rejects `:` in a plain scalar of a flow collection."""
+    document = '{"@id": https://example.org/alice}'
+
+    assert _parse(document, YAMLBackend.LIBYAML) == {
+        '@id': 'https://example.org/alice',
+    }
+
+
+@pytest.mark.parametrize(
+    ('scalar', 'expected'),
+    [
+        ('https://example.org/alice', 'https://example.org/alice'),
+        ('2024-01-15', '2024-01-15'),
+        ('2024-01-15T10:00:00Z', '2024-01-15T10:00:00Z'),
+        ('yes', 'yes'),
+        ('True', True),
+        ('~', None),
+        ('NULL', None),
+        ('0x1F', 31),
+        ('-.5', -0.5),
+        ('1e3', 1000.0),
+        ('-1', -1),
+    ],
+)
+@pytest.mark.parametrize(
+    'backend',
+    [
+        YAMLBackend.PURE,
+        pytest.param(YAMLBackend.LIBYAML, marks=requires_libyaml),
+    ],
+)
+def test_core_schema_scalars(scalar, expected, backend):
+    assert _parse(f'value: {scalar}', backend) == {'value': expected}
+
+
+@pytest.mark.parametrize(
+    ('document', 'expected'),
+    [
+        ('%YAML 1.1\n---\nvalue: yes\n', True),
+        ('%YAML 1.1\n---\nvalue: 0o17\n', '0o17'),
+        ('%YAML 1.2\n---\nvalue: 0o17\n', 15),
+        ('value: "%YAML 1.1"\n', '%YAML 1.1'),
+    ],
+)
+@pytest.mark.parametrize(
+    'backend',
+    [
+        YAMLBackend.PURE,
+        pytest.param(YAMLBackend.LIBYAML, marks=requires_libyaml),
+    ],
+)
+def test_yaml_version_directive(document, expected, backend):
+    assert _parse(document, backend) == {'value': expected}
+
+
+@requires_libyaml
+def test_yaml_version_directive_of_later_document():
+    document = 'name: Alice\n...\n%YAML 1.1\n---\nvalue: yes\n'
+
+    assert YAMLDocumentParser()(
+        data_stream=io.StringIO(document),
+        source='',
+        options={   # type: ignore
+            'yamlBackend': YAMLBackend.LIBYAML,
+            'extractAllScripts': True,
+        },
+    ) == [{'name': 'Alice'}, {'value': True}]
+
+
+@requires_libyaml
+@pytest.mark.parametrize('padding', [16370, 16375, 16380, 16384])
+def test_yaml_version_directive_across_read_chunks(padding):
+    """libyaml reads 16384 characters at a time; a directive may span two."""
+    first = f'name: "{"x" * padding}"\n...\n'
+    document = f'{first}%YAML 1.1\n---\nvalue: yes\n'
+
+    assert YAMLDocumentParser()(
+        data_stream=io.StringIO(document),
+        source='',
+        options={   # type: ignore
+            'yamlBackend': YAMLBackend.LIBYAML,
+            'extractAllScripts': True,
+        },
+    )[1] == {'value': True}
+
+
+@requires_libyaml
+def test_alias_cycle():
+    with pytest.raises(CycleDetected):
+        _parse('a: &node\n  b: *node\n', YAMLBackend.LIBYAML)
@@ -1,9 +1,33 @@
+from yaml_ld.batch import compact_many, expand_many, to_rdf_many
 from yaml_ld.compact import compact
+from yaml_ld.compile_context import compile_context
 from yaml_ld.expand import expand
 from yaml_ld.flatten import flatten  # noqa: WPS347
 from yaml_ld.frame import frame
 from yaml_ld.from_rdf import from_rdf  # noqa: WPS347
+from yaml_ld.iter_expand import iter_expand
+from yaml_ld.iter_to_rdf import iter_to_rdf
 from yaml_ld.load_document import load_document  # noqa: WPS347
+from yaml_ld.nquads_writer import write_nquads
+from yaml_ld.rdflib_writer import add_to_rdflib
 from yaml_ld.to_rdf import to_rdf  # noqa: WPS347
+from yaml_ld.to_rdflib import to_rdflib
 
-__all__ = ['expand', 'compact', 'to_rdf', 'from_rdf', 'flatten', 'frame', 'load_document']   # noqa: WPS410
+__all__ = [   # noqa: WPS410
+    'expand',
+    'expand_many',
+    'iter_expand',
+    'compact',
+    'compact_many',
+    'compile_context',
+    'to_rdf',
+    'to_rdf_many',
+    'iter_to_rdf',
+    'write_nquads',
+    'to_rdflib',
+    'add_to_rdflib',
+    'from_rdf',
+    'flatten',
+    'frame',
+    'load_document',
+]
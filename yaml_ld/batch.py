@@ -0,0 +1,295 @@
+"""Process many ＊-LD documents with shared state."""
+import pickle  # noqa: S403
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+
+import funcy
+from pydantic import SkipValidation, validate_call
+
+from yaml_ld import fast
+from yaml_ld.compact import DEFAULT_COMPACT_OPTIONS, CompactOptions
+from yaml_ld.errors import YAMLLDError
+from yaml_ld.expand import DEFAULT_EXPAND_OPTIONS, ExpandOptions
+from yaml_ld.models import (
+    DEFAULT_VALIDATE_CALL_CONFIG,
+    CompiledContext,
+    JsonLdContext,
+    JsonLdInput,
+    JsonLdRecord,
+)
+from yaml_ld.options import CompiledOptions
+from yaml_ld.rdf import Dataset, EncodedDataset
+from yaml_ld.to_rdf import DEFAULT_TO_RDF_OPTIONS, ToRDFOptions
+
+DEFAULT_CHUNK_SIZE = 16
+"""How many documents to send to a worker process at once."""
+
+OutputType = TypeVar('OutputType')
+Process = Callable[[JsonLdInput], Any]   # type: ignore
+
+
+@dataclass
+class BatchResult(Generic[OutputType]):
+    """Outcome of processing one document of a batch."""
+
+    index: int
+    """Position of the document in the input."""
+
+    output: OutputType | None = None
+    """Processed document, unless processing failed."""
+
+    error: Exception | None = None
+    """Why processing failed, if it did."""
+
+    @property
+    def is_successful(self) -> bool:
+        """Was the document processed successfully?"""
+        return self.error is None
+
+
+@dataclass
+class ProcessingFailed(YAMLLDError):   # type: ignore
+    """
+    Processing a document failed in a worker process.
+
+    {self.error_class}: {self.message}
+    """
+
+    error_class: str
+    message: str
+
+
+def _per_document(
+    function: Callable[..., Any],   # type: ignore
+    options: CompiledOptions,
+    **kwargs,
+) -> Process:
+    """
+    Call the function with its own copy of the options for each document.
+
+    The copy brings a context resolver of its own: contexts outlive a document
+    only in the bounded shared context cache, which checks their freshness.
+    """
+    def process(document: JsonLdInput) -> Any:   # type: ignore  # noqa: WPS430
+        return function(document, options=options.copy(), **kwargs)
+
+    return process
+
+
+@dataclass
+class ExpandOperation:
+    """Expand each document."""
+
+    options: ExpandOptions
+
+    def prepare(self) -> Process:
+        """Construct a function to expand one document."""
+        return _per_document(fast.expand, options=self.options.compile())
+
+
+@dataclass
+class CompactOperation:
+    """Compact each document."""
+
+    options: CompactOptions
+    ctx: JsonLdContext | CompiledContext
+
+    def prepare(self) -> Process:
+        """Construct a function to compact one document."""
+        return _per_document(
+            fast.compact,
+            ctx=self.ctx,
+            options=self.options.compile(),
+        )
+
+
+@dataclass
+class ToRDFOperation:
+    """Convert each document to RDF."""
+
+    options: ToRDFOptions
+
+    def prepare(self) -> Process:
+        """Construct a function to convert one document to RDF."""
+        return _per_document(fast.to_rdf, options=self.options.compile())
+
+
+Operation = ExpandOperation | CompactOperation | ToRDFOperation
+
+
+
+def _process_document(
+    process: Process,
+    index: int,
+    document: JsonLdInput,
+) -> BatchResult:
+    try:
+        return BatchResult(index=index, output=process(document))
+    except Exception as error:
+        return BatchResult(index=index, error=error)
+
+
+def _transferable(batch_result: BatchResult) -> BatchResult:
+    """Make sure the result can be sent back from a worker process."""
+    try:
+        pickle.dumps(batch_result.error)
+    except Exception:
+        batch_result.error = ProcessingFailed(
+            error_class=type(batch_result.error).__name__,
+            message=str(batch_result.error),
+        )
+
+    return batch_result
+
+
+def _process_chunk(
+    operation: Operation,
+    chunk: list[tuple[int, JsonLdInput]],
+) -> list[BatchResult]:
+    """Process a chunk of documents in a worker process."""
+    process = operation.prepare()
+    return [
+        _transferable(_process_document(process, index, document))
+        for index, document in chunk
+    ]
+
+
+def _completed_chunks(
+    pending: deque[Future],
+    ordered: bool,
+) -> Iterator[list[BatchResult]]:
+    if ordered:
+        yield pending.popleft().result()
+        return
+
+    done, _not_done = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield future.result()
+
+
+def _run_in_pool(   # noqa: WPS211
+    operation: Operation,
+    documents: Iterable[JsonLdInput],
+    processes: int,
+    chunk_size: int,
+    ordered: bool,
+) -> Iterator[BatchResult]:
+    # Do not read the whole input in advance.
+    max_pending = 2 * processes
+    chunks = funcy.chunks(chunk_size, enumerate(documents))
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending: deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_process_chunk, operation, chunk))
+            if len(pending) >= max_pending:
+                for completed_chunk in _completed_chunks(pending, ordered):
+                    yield from completed_chunk
+
+        while pending:
+            for completed_chunk in _completed_chunks(pending, ordered):
+                yield from completed_chunk
+
+
+def run(   # noqa: WPS211
+    operation: Operation,
+    documents: Iterable[JsonLdInput],
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+) -> Iterator[BatchResult]:
+    """Apply an operation to each of the documents."""
+    if processes is None:
+        process = operation.prepare()
+        for index, document in enumerate(documents):
+            yield _process_document(process, index, document)
+
+        return
+
+    yield from _run_in_pool(
+        operation=operation,
+        documents=documents,
+        processes=processes,
+        chunk_size=chunk_size,
+        ordered=ordered,
+    )
+
+
+@validate_call(config=DEFAULT_VALIDATE_CALL_CONFIG)
+def expand_many(   # noqa: WPS211
+    documents: SkipValidation[Iterable[JsonLdInput]],
+    options: ExpandOptions = DEFAULT_EXPAND_OPTIONS,
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+) -> Iterator[BatchResult[list[JsonLdRecord]]]:
+    """
+    Expand many [＊-LD](/blog/any-ld/) documents.
+
+    Options, document loader and context cache are shared by all documents.
+    If `processes` is given, documents are sent to a pool of that many worker
+    processes in chunks of `chunk_size`; with `ordered=False`, results are
+    yielded as they complete. A failure is reported in the `BatchResult` of
+    the failed document and does not abort the batch.
+    """
+    return run(
+        operation=ExpandOperation(options=options),
+        documents=documents,
+        processes=processes,
+        chunk_size=chunk_size,
+        ordered=ordered,
+    )
+
+
+@validate_call(config=DEFAULT_VALIDATE_CALL_CONFIG)
+def compact_many(   # noqa: WPS211
+    documents: SkipValidation[Iterable[JsonLdInput]],
+    ctx: JsonLdContext | CompiledContext | None = None,
+    options: CompactOptions = DEFAULT_COMPACT_OPTIONS,
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+) -> Iterator[BatchResult[JsonLdRecord | list[JsonLdRecord]]]:
+    """
+    Compact many [＊-LD](/blog/any-ld/) documents with the same context.
+
+    See `expand_many()` for the meaning of the batch parameters. Pass a
+    compiled context (see `compile_context()`) as `ctx` to process it once.
+    """
+    return run(
+        operation=CompactOperation(options=options, ctx=ctx or {}),
+        documents=documents,
+        processes=processes,
+        chunk_size=chunk_size,
+        ordered=ordered,
+    )
+
+
+@validate_call(config=DEFAULT_VALIDATE_CALL_CONFIG)
+def to_rdf_many(   # noqa: WPS211
+    documents: SkipValidation[Iterable[JsonLdInput]],
+    options: ToRDFOptions = DEFAULT_TO_RDF_OPTIONS,
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+) -> Iterator[BatchResult[Dataset | EncodedDataset | str]]:
+    """
+    Convert many [＊-LD](/blog/any-ld/) documents to RDF.
+
+    See `expand_many()` for the meaning of the batch parameters.
+    """
+    return run(
+        operation=ToRDFOperation(options=options),
+        documents=documents,
+        processes=processes,
+        chunk_size=chunk_size,
+        ordered=ordered,
+    )
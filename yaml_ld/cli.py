@@ -24,6 +24,7 @@ from yarl import URL
 import yaml_ld
 from yaml_ld.compact import CompactOptions
 from yaml_ld.document_loaders.default import CACHE_DIRECTORY
+from yaml_ld.document_parsers.nquads_parser import NQuadsParser
 from yaml_ld.expand import ExpandOptions
 from yaml_ld.flatten import FlattenOptions
 from yaml_ld.from_rdf import FromRDFOptions
@@ -293,7 +294,6 @@ def flatten(    # noqa: WPS211
 
 
 @cli.command()
-@funcy.post_processing(print_without_wrapping)
 def to_rdf(
     input_: Annotated[
         MaybeStr,
@@ -314,15 +314,17 @@ def to_rdf(
         ),
     ] = True,
 ):
-    """Convert a ＊-LD document → RDF."""
-    return yaml_ld.to_rdf(
-        document=decode_input(input_),
-        options=ToRDFOptions(
-            base=base,
-            format='application/n-quads',
-            extract_all_scripts=extract_all_scripts,
-        ),
+    """
+    Convert a ＊-LD document → RDF.
+
+    Quads are written as soon as they are produced, in no particular order.
+    """
+    document = decode_input(input_)
+    options = ToRDFOptions(
+        base=base,
+        extract_all_scripts=extract_all_scripts,
     )
+    yaml_ld.write_nquads(yaml_ld.iter_to_rdf(document, options), sys.stdout)
 
 
 @cli.command()
@@ -348,24 +350,28 @@ def from_rdf(
 ):
     """Convert an RDF document → ＊-LD form."""
     source = decode_input(input_)
+    options = FromRDFOptions(use_native_types=use_native_types)
 
     match source:
         case Path() as path:
-            dataset = path.read_text()
+            with path.open(mode='rb') as data_stream:
+                response = yaml_ld.from_rdf(
+                    dataset=NQuadsParser().iter_quads(
+                        data_stream,
+                        source=str(path),
+                    ),
+                    options=options,
+                )
 
         case URL() as url:
-            dataset = requests.get(str(url)).text   # noqa: S113
+            response = yaml_ld.from_rdf(
+                dataset=requests.get(str(url)).text,   # noqa: S113
+                options=options,
+            )
 
         case _:
             raise ValueError(f'Unknown source type: {source}')
 
-    response = yaml_ld.from_rdf(
-        dataset=dataset,
-        options=FromRDFOptions(
-            use_native_types=use_native_types,
-        ),
-    )
-
     return pretty_print(
         document=response,
         output_format=output_format,
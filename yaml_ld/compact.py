@@ -1,30 +1,26 @@
 from typing import Annotated
 
 from pydantic import validate_call
-from pyld import jsonld
 
-from yaml_ld.document_loaders.content_types import (
-    DEFAULT_ACCEPT_HEADER,
-    DEFAULT_USER_AGENT,
-)
-from yaml_ld.document_loaders.default import DEFAULT_DOCUMENT_LOADER
-from yaml_ld.expand import except_json_ld_errors
+from yaml_ld import fast
 from yaml_ld.models import (
     DEFAULT_VALIDATE_CALL_CONFIG,
+    CompiledContext,
     JsonLdContext,
     JsonLdInput,
     JsonLdRecord,
-    ensure_string_or_document,
 )
 from yaml_ld.options import (
     BaseOptions,
     ExpandContextOptions,
     ExtractAllScriptsOptions,
+    ParserOptions,
 )
 
 
 class CompactOptions(   # type: ignore
     BaseOptions,
+    ParserOptions,
     ExtractAllScriptsOptions,
     ExpandContextOptions,
 ):
@@ -46,7 +42,10 @@ DEFAULT_COMPACT_OPTIONS = CompactOptions()
 @validate_call(config=DEFAULT_VALIDATE_CALL_CONFIG)
 def compact(  # noqa: WPS211
     document: JsonLdInput,
-    ctx: Annotated[JsonLdContext | None, 'Context to compact with.'] = None,
+    ctx: Annotated[
+        JsonLdContext | CompiledContext | None,
+        'Context to compact with.',
+    ] = None,
     options: CompactOptions = DEFAULT_COMPACT_OPTIONS,
 ) -> JsonLdRecord | list[JsonLdRecord]:
     """
@@ -56,18 +55,4 @@ def compact(  # noqa: WPS211
     making the document more human-readable while preserving its original
     structure and semantics.
     """
-    dict_options = options.model_dump(by_alias=True, exclude_none=True)
-    dict_options.setdefault('documentLoader', DEFAULT_DOCUMENT_LOADER)
-    dict_options.setdefault(
-        'headers', {
-            'Accept': DEFAULT_ACCEPT_HEADER,
-            'User-Agent': DEFAULT_USER_AGENT,
-        },
-    )
-
-    with except_json_ld_errors():
-        return jsonld.compact(
-            input_=ensure_string_or_document(document),
-            ctx=ctx or {},
-            options=dict_options,
-        )
+    return fast.compact(document, ctx, options.compile())
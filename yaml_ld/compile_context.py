@@ -0,0 +1,78 @@
+import copy
+import uuid
+
+from pydantic import validate_call
+from pyld import jsonld
+
+from yaml_ld.errors import except_json_ld_errors
+from yaml_ld.models import (
+    DEFAULT_PROCESSING_MODE,
+    DEFAULT_VALIDATE_CALL_CONFIG,
+    CompiledContext,
+    JsonLdContext,
+    JsonLdRecord,
+    ensure_string_or_document,
+)
+from yaml_ld.options import BaseOptions, ParserOptions
+
+
+class CompileContextOptions(BaseOptions, ParserOptions):   # type: ignore
+    """Options to compile a context."""
+
+
+DEFAULT_COMPILE_CONTEXT_OPTIONS = CompileContextOptions()
+
+
+@validate_call(config=DEFAULT_VALIDATE_CALL_CONFIG)
+def compile_context(
+    ctx: JsonLdContext,
+    options: CompileContextOptions = DEFAULT_COMPILE_CONTEXT_OPTIONS,
+) -> CompiledContext:
+    """
+    Process a context once, to reuse it for many documents.
+
+    Pass the result as `ctx` to `compact()` or `flatten()`, or as
+    `expand_context` in options of `expand()`. It is reused by calls with the
+    same `base` and `processingMode` options, and processed again by others.
+    """
+    dict_options = options.compile().copy()
+    dict_options.setdefault('base', '')
+    dict_options.setdefault('processingMode', DEFAULT_PROCESSING_MODE)
+
+    document = copy.deepcopy(ensure_string_or_document(ctx))
+    processor = jsonld.JsonLdProcessor()
+
+    with except_json_ld_errors():
+        active_context: JsonLdRecord = processor.process_context(
+            processor._get_initial_context(dict_options),   # noqa: WPS437
+            document,
+            dict_options,
+        )
+        active_context = _ensure_identified(processor, active_context)
+        inverse_context = processor._get_inverse_context(   # noqa: WPS437
+            active_context,
+        )
+
+    return CompiledContext(
+        document=document,
+        base=str(dict_options['base']),
+        processing_mode=dict_options['processingMode'],
+        active_context=active_context,
+        inverse_context=inverse_context,
+    )
+
+
+def _ensure_identified(
+    processor: jsonld.JsonLdProcessor,
+    active_context: JsonLdRecord,
+) -> JsonLdRecord:
+    """Make sure the active context has an identifier to cache by."""
+    if '_uuid' in active_context:
+        return active_context
+
+    # An empty context produces a bare clone of the initial context.
+    active_context = processor._clone_active_context(   # noqa: WPS437
+        active_context,
+    )
+    active_context['_uuid'] = str(uuid.uuid1())
+    return active_context
@@ -0,0 +1,221 @@
+import copy
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from pyld import jsonld
+from pyld.context_resolver import ContextResolver
+from yarl import URL
+
+DEFAULT_CONTEXT_CACHE_TTL = 300
+"""How long (in seconds) a resolved context is considered fresh."""
+
+ContextCacheKey = tuple[str, str]
+"""Base IRI and context IRI (or canonical form of an inline context)."""
+
+FileSignature = tuple[int, int] | None
+
+
+@dataclass
+class ContextCacheStatistics:
+    """Hit & miss counters of a resolved context cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+
+        return self.hits / lookups
+
+
+@dataclass
+class _CacheEntry:
+    resolved: Any   # type: ignore
+    expires_at: float
+    file_signature: FileSignature
+
+
+def _file_signature(context_key: str) -> FileSignature:
+    """Identify the version of a local context file, if that is one."""
+    # Inline contexts are keyed by their canonical JSON serialization.
+    if context_key.startswith('{'):
+        return None
+
+    url = URL(context_key)
+    if url.scheme not in {'', 'file'}:
+        return None
+
+    try:
+        stat = os.stat(url.path)
+    except (OSError, ValueError):
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ResolvedContextCache:
+    """
+    Process-wide cache of resolved JSON-LD contexts.
+
+    Entries are keyed by the base IRI plus the context IRI (or the canonical
+    form of an inline context). An entry expires after `ttl` seconds; a context
+    loaded from a local file is also dropped as soon as that file changes.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = jsonld.RESOLVED_CONTEXT_CACHE_MAX_SIZE,
+        ttl: float | None = DEFAULT_CONTEXT_CACHE_TTL,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.statistics = ContextCacheStatistics()
+        self._entries = jsonld.LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key: ContextCacheKey, default=None):
+        """Retrieve a fresh resolved context, or `default`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._is_fresh(key, entry):
+                del self._entries[key]   # noqa: WPS420
+                entry = None
+
+            if entry is None:
+                self.statistics.misses += 1
+                return default
+
+            self.statistics.hits += 1
+            return entry.resolved
+
+    def __setitem__(self, key: ContextCacheKey, resolved) -> None:
+        """Store a resolved context."""
+        expires_at = float('inf')
+        if self.ttl is not None:
+            expires_at = time.monotonic() + self.ttl
+
+        entry = _CacheEntry(
+            resolved=resolved,
+            expires_at=expires_at,
+            file_signature=_file_signature(key[1]),
+        )
+
+        with self._lock:
+            self._entries[key] = entry
+
+    def __len__(self) -> int:
+        """Count cached contexts."""
+        return len(self._entries)
+
+    def configure(
+        self,
+        maxsize: int | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """Change size and/or TTL of the cache, dropping its contents."""
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+
+            if ttl is not None:
+                self.ttl = ttl
+
+            self._entries = jsonld.LRUCache(maxsize=self.maxsize)
+
+    def clear(self) -> None:
+        """Drop all cached contexts and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.statistics = ContextCacheStatistics()
+
+    def _is_fresh(self, key: ContextCacheKey, entry: _CacheEntry) -> bool:
+        if time.monotonic() >= entry.expires_at:
+            return False
+
+        return entry.file_signature == _file_signature(key[1])
+
+
+RESOLVED_CONTEXT_CACHE = ResolvedContextCache()
+"""Resolved context cache shared by all YAML-LD API calls."""
+
+
+class CachingContextResolver(ContextResolver):
+    """
+    Resolve contexts with a `ResolvedContextCache`.
+
+    Unlike the stock `pyld` resolver, this one caches remote contexts too, and
+    keys the cache by the base IRI contexts are resolved against.
+    """
+
+    def __init__(
+        self,
+        shared_cache: ResolvedContextCache,
+        document_loader,
+    ) -> None:
+        super().__init__(shared_cache, document_loader)
+        self._base = ''
+
+    def resolve(self, active_ctx, context, base, cycles=None):
+        """Resolve a context against the given base."""
+        outer_base, self._base = self._base, base or ''
+        try:
+            return super().resolve(active_ctx, context, base, cycles)
+        finally:
+            self._base = outer_base
+
+    def _key(self, context_key: str) -> ContextCacheKey:
+        if not context_key.startswith('{'):
+            context_key = jsonld.prepend_base(self._base, context_key)
+
+        return self._base, context_key
+
+    def _get(self, key):
+        cache_key = self._key(key)
+        resolved = self.per_op_cache.get(cache_key)
+        if not resolved:
+            resolved = self.shared_cache.get(cache_key)
+            if resolved:
+                self.per_op_cache[cache_key] = resolved
+
+        return resolved
+
+    def _cache_resolved_context(self, key, resolved, tag):
+        if tag == 'static':
+            # Do not let the caller mutate a cached inline context.
+            resolved.document = copy.deepcopy(resolved.document)
+
+        cache_key = self._key(key)
+        self.per_op_cache[cache_key] = resolved
+        self.shared_cache[cache_key] = resolved
+        return resolved
+
+
+def context_resolver(document_loader) -> ContextResolver:
+    """
+    Construct a context resolver for one API call.
+
+    Contexts are shared between calls only if they are loaded by the default
+    document loader; a custom loader might return different content for the
+    same IRI.
+    """
+    from yaml_ld.document_loaders.default import (  # noqa: WPS433
+        DEFAULT_DOCUMENT_LOADER,
+    )
+
+    if document_loader is DEFAULT_DOCUMENT_LOADER:
+        return CachingContextResolver(
+            shared_cache=RESOLVED_CONTEXT_CACHE,
+            document_loader=document_loader,
+        )
+
+    return ContextResolver(
+        jsonld.LRUCache(maxsize=jsonld.RESOLVED_CONTEXT_CACHE_MAX_SIZE),
+        document_loader,
+    )
@@ -10,6 +10,7 @@ DocumentLoaderOptions = TypedDict(
         'extractAllScripts': bool,
         'headers': dict[str, str],
         'base': str,
+        'rdfDataset': bool,
     },
 )
 
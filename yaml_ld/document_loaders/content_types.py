@@ -7,6 +7,7 @@ from yarl import URL
 
 from yaml_ld.document_parsers.base import BaseDocumentParser
 from yaml_ld.document_parsers.json_parser import JSONDocumentParser
+from yaml_ld.document_parsers.nquads_parser import NQuadsParser, NTriplesParser
 from yaml_ld.document_parsers.rdf_xml_parser import RDFXMLParser
 from yaml_ld.document_parsers.turtle_parser import TurtleParser
 from yaml_ld.document_parsers.yaml_parser import YAMLDocumentParser
@@ -80,6 +81,8 @@ def by_extension(extension: str) -> str | None:
         '.yamlld': 'application/ld+yaml',
         '.html': 'text/html',
         '.ttl': 'text/turtle',
+        '.nt': 'application/n-triples',
+        '.nq': 'application/n-quads',
         '.md': 'text/markdown',
     }.get(extension)
 
@@ -109,6 +112,8 @@ def parser_by_content_type_map():
         'application/xml': RDFXMLParser,
         'application/rdf+xml': RDFXMLParser,
         'text/turtle': TurtleParser,
+        'application/n-triples': NTriplesParser,
+        'application/n-quads': NQuadsParser,
         'text/markdown': MarkdownDocumentParser,
     }
 
@@ -0,0 +1,130 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Hashable
+
+DEFAULT_DOCUMENT_CACHE_SIZE = 64 * 1024 * 1024
+"""Total size (in bytes) of local files whose parsed documents are cached."""
+
+DocumentCacheKey = tuple[Hashable, ...]
+"""
+Absolute path of a file, followed by everything else its parsed document
+depends on, such as the URL fragment and the loader options.
+"""
+
+FileSignature = tuple[int, int]
+"""Modification time (in nanoseconds) and size of a file."""
+
+
+@dataclass
+class DocumentCacheStatistics:
+    """Hit & miss counters of a parsed document cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+
+        return self.hits / lookups
+
+
+@dataclass
+class _CacheEntry:
+    document: Any   # type: ignore
+    file_signature: FileSignature
+
+    @property
+    def size(self) -> int:
+        return self.file_signature[1]
+
+
+class DocumentCache:
+    """
+    LRU cache of documents parsed from local files.
+
+    An entry is valid while the modification time and size of its file stay
+    the same. Memory use is bounded by the total size of cached files, which
+    is cheap to know and proportional to the size of parsed documents.
+
+    Cached documents are shared between calls: do not modify them.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_DOCUMENT_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.statistics = DocumentCacheStatistics()
+        self._entries: OrderedDict[DocumentCacheKey, _CacheEntry] = (
+            OrderedDict()
+        )
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        key: DocumentCacheKey,
+        file_signature: FileSignature,
+        default=None,
+    ):
+        """Retrieve a document parsed from this version of a file."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.file_signature != file_signature:
+                self.statistics.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.statistics.hits += 1
+            return entry.document
+
+    def set(
+        self,
+        key: DocumentCacheKey,
+        file_signature: FileSignature,
+        document,
+    ) -> None:
+        """Store a document parsed from a file, evicting the oldest ones."""
+        entry = _CacheEntry(document=document, file_signature=file_signature)
+
+        with self._lock:
+            self._pop(key)
+            if entry.size > self.max_size:
+                return
+
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_size:
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, path: Path | str) -> None:
+        """Forget documents parsed from a file."""
+        absolute_path = str(Path(path).absolute())
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == absolute_path]
+            for key in keys:
+                self._pop(key)
+
+    def clear(self) -> None:
+        """Drop all cached documents and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.statistics = DocumentCacheStatistics()
+
+    @property
+    def size(self) -> int:
+        """Total size of files whose documents are cached."""
+        return self._size
+
+    def __len__(self) -> int:
+        """Count cached documents."""
+        return len(self._entries)
+
+    def _pop(self, key: DocumentCacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
@@ -1,4 +1,3 @@
-import io
 import logging
 import re
 from dataclasses import dataclass, field
@@ -275,7 +274,7 @@ class HTTPDocumentLoader(DocumentLoader):
             raise LoadingDocumentFailed(path=source)
 
         yaml_document = parser(
-            data_stream=io.BytesIO(response.content),
+            data_stream=response.content,
             source=string_source,
             options=options,
         )
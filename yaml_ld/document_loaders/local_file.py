@@ -1,16 +1,52 @@
+import copy
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import IO, Any, ContextManager
 
 from yarl import URL
 
 from yaml_ld.document_loaders import content_types
 from yaml_ld.document_loaders.base import DocumentLoader, DocumentLoaderOptions
+from yaml_ld.document_loaders.document_cache import DocumentCache
+from yaml_ld.document_loaders.mapped_file import mapped_file
+from yaml_ld.document_parsers.base import BaseDocumentParser
 from yaml_ld.errors import LoadingDocumentFailed, NotFound
 from yaml_ld.models import URI, RemoteDocument
 
+DEFAULT_MMAP_THRESHOLD = 16 * 1024 * 1024
+"""Files of this size in bytes or larger are read via a memory mapping."""
 
+CACHE_KEY_OPTIONS = (
+    'base',
+    'extractAllScripts',
+    'rdfDataset',
+    'yamlBackend',
+    'jsonBackend',
+    'scriptWorkers',
+)
+"""Options a parsed document, or the base its parser finds, depend on."""
+
+
+@dataclass(frozen=True)
+class _ParsedFile:
+    document: Any   # type: ignore
+    base: str | None
+
+
+@dataclass
 class LocalFileDocumentLoader(DocumentLoader):
     """Load documents from a local file system."""
 
+    mmap_threshold: int | None = DEFAULT_MMAP_THRESHOLD
+    """Minimal size of a file to memory map it; `None` to never do that."""
+
+    cache: DocumentCache | None = field(default_factory=DocumentCache)
+    """
+    Cache of parsed documents; `None` to parse files on every load.
+
+    Each load returns a copy of the cached document, which is safe to modify.
+    """
+
     def __call__(
         self,
         source: URI,
@@ -31,12 +67,7 @@ class LocalFileDocumentLoader(DocumentLoader):
             raise LoadingDocumentFailed(path=path)
 
         try:
-            with path.open(mode='rb') as data_stream:
-                yaml_document = parser(
-                    data_stream=data_stream,   # type: ignore
-                    source=str(source),
-                    options=options,
-                )
+            yaml_document = self._load(path, parser, str(source), options)
         except FileNotFoundError as file_not_found:
             raise NotFound(path) from file_not_found
 
@@ -46,3 +77,60 @@ class LocalFileDocumentLoader(DocumentLoader):
             'contextUrl': None,
             'contentType': content_type,
         }
+
+    def _load(
+        self,
+        path: Path,
+        parser: BaseDocumentParser,
+        source: str,
+        options: DocumentLoaderOptions,
+    ):
+        """Parse a file, unless it has been parsed since it last changed."""
+        if self.cache is None:
+            return self._parse(path, parser, source, options)
+
+        stat = path.stat()
+        file_signature = stat.st_mtime_ns, stat.st_size
+        cache_key = (
+            str(path.absolute()),
+            URL(source).fragment,
+            *(options.get(option_name) for option_name in CACHE_KEY_OPTIONS),
+        )
+
+        parsed_file = self.cache.get(cache_key, file_signature)
+        if parsed_file is None:
+            parsed_file = _ParsedFile(
+                document=self._parse(path, parser, source, options),
+                base=options.get('base'),
+            )
+            self.cache.set(cache_key, file_signature, parsed_file)
+
+        elif parsed_file.base != options.get('base'):
+            # The parser found the base in the file, as HTML one does.
+            options['base'] = parsed_file.base
+
+        # Callers, `pyld` among them, may modify the document they get.
+        return copy.deepcopy(parsed_file.document)
+
+    def _parse(
+        self,
+        path: Path,
+        parser: BaseDocumentParser,
+        source: str,
+        options: DocumentLoaderOptions,
+    ):
+        with self.open(path) as data_stream:
+            return parser(
+                data_stream=data_stream,   # type: ignore
+                source=source,
+                options=options,
+            )
+
+    def open(self, path: Path) -> ContextManager[IO[bytes]]:
+        """Open a file, via a memory mapping if it is large enough."""
+        if self.mmap_threshold is not None:
+            # An empty file cannot be mapped, hence the lower bound.
+            if path.stat().st_size >= max(self.mmap_threshold, 1):
+                return mapped_file(path)
+
+        return path.open(mode='rb')
@@ -0,0 +1,91 @@
+"""Read large local files through a memory mapping."""
+import contextlib
+import io
+import mmap
+from pathlib import Path
+from typing import Iterator
+
+
+class MappedFile(io.RawIOBase):
+    """
+    Binary stream over a memory mapped file.
+
+    Like `io.BytesIO`, it exposes its content via `getbuffer()`, so that a
+    parser able to read from a buffer does not copy the file into memory.
+    Lines are found in the mapping, rather than read one byte at a time as
+    `io.RawIOBase` would.
+    """
+
+    def __init__(self, mapping: mmap.mmap) -> None:
+        """Read from the beginning of the mapping."""
+        super().__init__()
+        self._mapping = mapping
+        self._position = 0
+
+    def readable(self) -> bool:
+        """Mapped file is readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Mapped file is seekable."""
+        return True
+
+    def tell(self) -> int:
+        """Current position in the mapping."""
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to a position in the mapping."""
+        origin = {
+            io.SEEK_SET: 0,
+            io.SEEK_CUR: self._position,
+            io.SEEK_END: len(self._mapping),
+        }[whence]
+        self._position = max(origin + offset, 0)
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        """Copy the next chunk of the mapping into a buffer."""
+        chunk = self._mapping[self._position:self._position + len(buffer)]
+        buffer[:len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    def read(self, size: int = -1) -> bytes:
+        """Read the next `size` bytes, or the rest of the mapping."""
+        end = len(self._mapping) if size < 0 else self._position + size
+        chunk = self._mapping[self._position:end]
+        self._position += len(chunk)
+        return chunk
+
+    def readline(self, size: int | None = -1) -> bytes:
+        """Read up to the next line break, found in the mapping at once."""
+        start = self._position
+        end = self._mapping.find(b'\n', start) + 1 or len(self._mapping)
+        if size is not None and size >= 0:
+            end = min(end, start + size)
+
+        self._position = max(end, start)
+        return self._mapping[start:end]
+
+    def peek(self, size: int = 0) -> bytes:
+        """Return the next bytes without moving, as `io.BufferedReader`."""
+        size = size if size > 0 else io.DEFAULT_BUFFER_SIZE
+        return self._mapping[self._position:self._position + size]
+
+    def getbuffer(self) -> memoryview:
+        """Content of the file, without copying it."""
+        return memoryview(self._mapping)
+
+
+@contextlib.contextmanager
+def mapped_file(path: Path) -> Iterator[MappedFile]:
+    """Map a file into memory for reading."""
+    with path.open(mode='rb') as file_stream:
+        with mmap.mmap(
+            file_stream.fileno(),
+            0,
+            access=mmap.ACCESS_READ,
+        ) as mapping:
+            with MappedFile(mapping) as mapped_stream:
+                yield mapped_stream
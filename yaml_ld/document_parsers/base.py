@@ -1,17 +1,97 @@
+import contextlib
 import io
 from abc import abstractmethod
+from typing import IO, Iterator
 
 from yaml_ld.document_loaders.base import DocumentLoaderOptions
 from yaml_ld.models import JsonLdRecord
 
+Content = str | bytes | memoryview
+"""Whole document in memory: text, or UTF-8 encoded bytes."""
+
+ParserInput = IO[bytes] | IO[str] | Content
+"""Document to parse: a stream, or its content."""
+
+
+@contextlib.contextmanager
+def read_content(data_stream: ParserInput) -> Iterator[Content]:
+    """
+    Read the rest of a document.
+
+    If the stream exposes its content via `getbuffer()`, as `io.BytesIO` and
+    memory mapped files do, provide a view of that buffer instead of a copy.
+    """
+    if isinstance(data_stream, Content):
+        yield data_stream
+        return
+
+    getbuffer = getattr(data_stream, 'getbuffer', None)
+    if getbuffer is None:
+        yield data_stream.read()
+        return
+
+    with getbuffer() as buffer, buffer[data_stream.tell():] as rest:
+        yield rest
+
+    data_stream.seek(0, io.SEEK_END)
+
+
+def read_text(data_stream: ParserInput) -> str:
+    """Read the rest of a document as text, decoding it as UTF-8 if needed."""
+    with read_content(data_stream) as content:
+        if isinstance(content, str):
+            return content
+
+        return str(content, 'utf-8')
+
+
+def as_stream(data_stream: ParserInput) -> IO[bytes] | IO[str]:
+    """Wrap document content into a stream, for libraries that need one."""
+    match data_stream:
+        case str():
+            return io.StringIO(data_stream)
+
+        case bytes() | memoryview():
+            return io.BytesIO(data_stream)
+
+    return data_stream
+
+
+@contextlib.contextmanager
+def decoded(data_stream: ParserInput) -> Iterator[IO[str] | str]:
+    """Decode a document as UTF-8 on the fly, without reading it whole."""
+    if isinstance(data_stream, str | io.TextIOBase):
+        yield data_stream
+        return
+
+    if isinstance(data_stream, bytes | memoryview):
+        yield str(data_stream, 'utf-8')
+        return
+
+    # Parsers handle line breaks themselves, let them see them as they are.
+    text_stream = io.TextIOWrapper(data_stream, encoding='utf-8', newline='')
+    try:
+        yield text_stream
+    finally:
+        # Do not let the wrapper close the stream, which is not ours.
+        text_stream.detach()
+
 
 class BaseDocumentParser:
-    """Parse documents of various types into LD."""
+    """
+    Parse documents of various types into LD.
+
+    A document is given either as a stream or as its content in memory; each
+    parser reads it in the cheapest way it can.
+    """
+
+    is_cheap: bool = False
+    """Is parsing as fast as sending the result between processes?"""
 
     @abstractmethod
     def __call__(
         self,
-        data_stream: io.BytesIO,
+        data_stream: ParserInput,
         source: str,
         options: DocumentLoaderOptions,
     ) -> JsonLdRecord | list[JsonLdRecord]:
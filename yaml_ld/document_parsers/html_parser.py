@@ -1,11 +1,15 @@
 """HTML document parser."""  # noqa: WPS232
-import io
+import atexit
+import functools
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Iterator, Mapping
 
 import funcy
-import lxml  # noqa: S410
-from bs4 import BeautifulSoup
+import lxml.html  # noqa: S410
+from lxml import etree  # noqa: S410
+from lxml.html import HtmlElement  # noqa: S410
 from pyld.jsonld import JsonLdError, parse_url, prepend_base
 from yarl import URL
 
@@ -19,7 +23,9 @@ from yaml_ld.document_loaders.http import (
 )
 from yaml_ld.document_parsers.base import (
     BaseDocumentParser,
+    Content,
     DocumentLoaderOptions,
+    ParserInput,
 )
 from yaml_ld.errors import DocumentIsScalar, NoLinkedDataFoundInHTML
 from yaml_ld.models import JsonLdRecord
@@ -33,19 +39,258 @@ class Script:
     content: str   # noqa: WPS110
 
 
+PARALLEL_SCRIPTS_THRESHOLD = 64 * 1024
+"""Total size of scripts worth parsing in worker processes, in characters."""
+
+WORKER_OPTIONS = ('base', 'extractAllScripts', 'yamlBackend', 'jsonBackend')
+"""Options which affect parsing of a script, and can be sent to a worker."""
+
+HTML_CHUNK_SIZE = 64 * 1024
+"""How many bytes of HTML to feed to the streaming parser at once."""
+
+NANODASH_HOSTS = frozenset({'nanodash.knowledgepixels.com'})
+NANOPUBLICATION_HOSTS = frozenset({'purl.org', 'w3id.org'})
+
+
+def _is_nanodash(url: URL) -> bool:
+    """Is this a Nanodash page, which links LD via anchors?"""
+    return url.host in NANODASH_HOSTS or (
+        url.host in NANOPUBLICATION_HOSTS and url.path.startswith('/np/')
+    )
+
+
+def _link_header(url: URL, attributes: Mapping[str, str]) -> LinkHeader | None:
+    """Convert a <link rel=alternate type=…> tag to a link header."""
+    rel_values = attributes.get('rel', '').split()
+    content_type = attributes.get('type')
+    href = attributes.get('href')
+    if 'alternate' not in rel_values or not content_type or href is None:
+        return None
+
+    return LinkHeader(
+        url=url.join(URL(href)),
+        rel=rel_values[0],
+        content_type=content_type,
+        attributes={},
+    )
+
+
+def _update_base(html_base: str, url: str, options: DocumentLoaderOptions):
+    """Resolve documents against <base> of the HTML page."""
+    # use either specified base, or document location
+    effective_base = options.get('base', url)
+    if effective_base:
+        html_base = prepend_base(effective_base, html_base)
+    options['base'] = html_base
+
+
+class _HeadTarget:   # noqa: WPS230
+    """
+    Collect <base>, <link> and <script> tags while HTML is being parsed.
+
+    This is a parser target for `lxml`: no tree is built.
+    """
+
+    def __init__(self) -> None:
+        self.base_href: str | None = None
+        self.link_attributes: list[dict[str, str]] = []
+        self.scripts: deque[Script] = deque()
+        self.is_head_closed = False
+        self._is_in_head = False
+        self._script_type: str | None = None
+        self._script_text: list[str] = []
+
+    def start(self, tag: str, attrib: Mapping[str, str]) -> None:
+        """Remember attributes of the interesting tags."""
+        if tag == 'head':
+            self._is_in_head = True
+
+        elif tag == 'base':
+            if self._is_in_head and self.base_href is None:
+                self.base_href = attrib.get('href')
+
+        elif tag == 'link':
+            if self._is_in_head:
+                self.link_attributes.append(dict(attrib))
+
+        elif tag == 'script':
+            self._script_type = attrib.get('type')
+            self._script_text = []
+
+    def data(self, text: str) -> None:
+        """Collect content of a script."""
+        if self._script_type:
+            self._script_text.append(text)
+
+    def end(self, tag: str) -> None:
+        """Emit a complete script."""
+        if tag == 'head':
+            self._is_in_head = False
+            self.is_head_closed = True
+
+        elif tag == 'script':
+            if self._script_type:
+                self.scripts.append(
+                    Script(
+                        content_type=self._script_type,
+                        content=''.join(self._script_text),
+                    ),
+                )
+            self._script_type = None
+
+    def close(self) -> None:
+        """Nothing to return: results are in attributes."""
+
+
+def _script_documents(
+    script: Script,
+    source: str,
+    options: DocumentLoaderOptions,
+) -> list[JsonLdRecord]:
+    """Parse a script, if there is a parser for its type."""
+    try:
+        parser = parser_by_content_type(
+            content_type=script.content_type,
+            uri=source,
+        )
+    except ParserNotFound:
+        return []
+
+    document_or_array = parser(
+        data_stream=script.content,
+        source=source,
+        options=options,
+    )
+
+    match document_or_array:
+        case list() as array:
+            return array
+
+        case dict() as mapping:
+            return [mapping]
+
+        case scalar:
+            raise DocumentIsScalar(scalar)
+
+
+def _parse_scripts(
+    scripts: list[Script],
+    source: str,
+    options: DocumentLoaderOptions,
+) -> list[list[JsonLdRecord]]:
+    """Parse a chunk of scripts in a worker process."""
+    return [_script_documents(script, source, options) for script in scripts]
+
+
+def _is_expensive(script: Script, source: str) -> bool:
+    """Is it worth sending the script to a worker process?"""
+    try:
+        parser = parser_by_content_type(
+            content_type=script.content_type,
+            uri=source,
+        )
+    except ParserNotFound:
+        return False
+
+    return not parser.is_cheap
+
+
+@functools.cache
+def _script_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Worker processes to parse scripts in, shared by all pages.
+
+    The pool lives until the interpreter exits, and is shut down then.
+    """
+    pool = ProcessPoolExecutor(max_workers=workers)
+    atexit.register(pool.shutdown, cancel_futures=True)
+    return pool
+
+
+def _read_html(data_stream: ParserInput) -> str | bytes:
+    """Read HTML in a form `lxml` accepts."""
+    if isinstance(data_stream, memoryview):
+        return data_stream.tobytes()
+
+    if isinstance(data_stream, str | bytes):
+        return data_stream
+
+    return data_stream.read()
+
+
+def _html_chunks(data_stream: ParserInput) -> Iterator[str | bytes]:
+    """Split HTML into chunks to feed the parser with."""
+    if isinstance(data_stream, Content):
+        for start in range(0, len(data_stream), HTML_CHUNK_SIZE):
+            chunk = data_stream[start:start + HTML_CHUNK_SIZE]
+            if isinstance(chunk, memoryview):
+                chunk = chunk.tobytes()
+
+            yield chunk
+
+        return
+
+    while chunk := data_stream.read(HTML_CHUNK_SIZE):   # noqa: WPS332
+        yield chunk
+
+
+class _StreamingHTMLParser:
+    """Feed HTML to `lxml` chunk by chunk, until told to stop."""
+
+    def __init__(self, data_stream: ParserInput) -> None:
+        self.target = _HeadTarget()
+        self.first_chunk: str | bytes = b''
+        self._parser = etree.HTMLParser(target=self.target)
+        self._chunks = _html_chunks(data_stream)
+        self._is_closed = False
+
+    def feed(self) -> bool:
+        """Parse the next chunk; return `False` if there is none."""
+        if self._is_closed:
+            return False
+
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._parser.close()
+            self._is_closed = True
+            return False
+
+        self.first_chunk = self.first_chunk or chunk
+        self._parser.feed(chunk)
+        return True
+
+    def read_head(self) -> None:
+        """Parse HTML until the end of <head>, where links and base are."""
+        while not self.target.is_head_closed and self.feed():
+            continue   # noqa: WPS328
+
+    def scripts(self) -> Iterator[Script]:
+        """Parse HTML only as far as the consumer needs scripts."""
+        while True:   # noqa: WPS457
+            while self.target.scripts:
+                yield self.target.scripts.popleft()
+
+            if not self.feed():
+                return
+
+
 class HTMLDocumentParser(BaseDocumentParser):
     """Parse HTML documents, specifically their <script> tags."""
 
     def __call__(
         self,
-        data_stream: io.BytesIO,
+        data_stream: ParserInput,
         source: str,
         options: DocumentLoaderOptions,
     ) -> JsonLdRecord | list[JsonLdRecord]:
         """Parse HTML with LD in <script> tags."""
-        html_content = data_stream.read()
+        if self._can_stream(source, options):
+            return self._parse_first_script(data_stream, source, options)
+
+        html_content = _read_html(data_stream)
+        document = lxml.html.fromstring(html_content)
         links = self.extract_link_tags(
-            html_content,
+            document,
             source=source,
         )
 
@@ -59,43 +304,89 @@ class HTMLDocumentParser(BaseDocumentParser):
             return linked_document['document']
 
         scripts = self.extract_script_tags(
-            html_content=html_content,
+            document=document,
             url=source,
             profile=None,
             options=options,
         )
 
+        if options.get('extractAllScripts'):
+            return self._parse_all_scripts(list(scripts), source, options)
+
         documents = self.parsed_documents_stream(
             scripts=scripts,
             source=source,
             options=options,
         )
 
-        if options.get('extractAllScripts'):
-            return list(documents)
-
         try:
             return next(iter(documents))
         except StopIteration:
             raise NoLinkedDataFoundInHTML(html=html_content)
 
+    def _can_stream(
+        self,
+        source: str,
+        options: DocumentLoaderOptions,
+    ) -> bool:
+        """Can we stop reading after the first script?"""
+        url = URL(source)
+        return not (
+            options.get('extractAllScripts')
+            or url.fragment
+            or _is_nanodash(url)
+        )
+
+    def _parse_first_script(
+        self,
+        data_stream: ParserInput,
+        source: str,
+        options: DocumentLoaderOptions,
+    ) -> JsonLdRecord:
+        """Parse HTML only until the first usable LD script."""
+        streaming_parser = _StreamingHTMLParser(data_stream)
+        streaming_parser.read_head()
+        target = streaming_parser.target
+
+        url = URL(source)
+        links = [
+            link
+            for attributes in target.link_attributes
+            if (link := _link_header(url, attributes))
+        ]
+        linked_document = maybe_follow_one_of_link_headers(
+            links=links,
+            content_type='text/html',
+            options=options,
+        )
+        if linked_document:
+            return linked_document['document']
+
+        if target.base_href is not None:
+            _update_base(target.base_href, url=source, options=options)
+
+        documents = self.parsed_documents_stream(
+            scripts=streaming_parser.scripts(),
+            source=source,
+            options=options,
+        )
+        try:
+            return next(iter(documents))
+        except StopIteration:
+            raise NoLinkedDataFoundInHTML(html=streaming_parser.first_chunk)
+
     def extract_script_tags(   # noqa: C901, WPS210
         self,
-        html_content: bytes,
+        document: HtmlElement,
         url,
         profile,
         options,
     ) -> Iterable[Script]:
-        """Load one or more script tags from an HTML source."""
-        document = lxml.html.fromstring(html_content)
+        """Load one or more script tags from a parsed HTML document."""
         # potentially update options[:base]
         html_base = document.xpath('/html/head/base/@href')
         if html_base:
-            # use either specified base, or document location
-            effective_base = options.get('base', url)
-            if effective_base:
-                html_base = prepend_base(effective_base, html_base[0])
-            options['base'] = html_base
+            _update_base(html_base[0], url=url, options=options)
 
         url_elements = parse_url(url)
         if url_elements.fragment:
@@ -133,69 +424,114 @@ class HTMLDocumentParser(BaseDocumentParser):
     ) -> Iterable[JsonLdRecord]:
         """Parse each of the given scripts and emit a stream of LD documents."""
         for script in scripts:
-            try:
-                parser = parser_by_content_type(
-                    content_type=script.content_type,
-                    uri=source,
-                )
-            except ParserNotFound:
-                continue
+            yield from _script_documents(script, source, options)
 
-            stream = io.BytesIO(script.content.encode())
-            document_or_array = parser(
-                data_stream=stream,
+    def parsed_documents_in_parallel(
+        self,
+        scripts: list[Script],
+        source: str,
+        options: DocumentLoaderOptions,
+        workers: int,
+    ) -> Iterable[JsonLdRecord]:
+        """
+        Parse expensive scripts in worker processes, in source order.
+
+        Cheap scripts, such as JSON, are parsed in this process meanwhile:
+        sending their documents back from a worker would take as long.
+        """
+        pool = _script_pool(workers)
+        worker_options = {
+            option_name: options[option_name]   # type: ignore
+            for option_name in WORKER_OPTIONS
+            if option_name in options
+        }
+        expensive_indices = [
+            index
+            for index, script in enumerate(scripts)
+            if _is_expensive(script, source)
+        ]
+
+        # A few chunks per worker balance the load without much IPC.
+        chunk_size = max(len(expensive_indices) // (workers * 4), 1)
+        offloaded: dict[int, tuple[Future, int]] = {}
+        for chunk in funcy.chunks(chunk_size, expensive_indices):
+            future = pool.submit(
+                _parse_scripts,
+                [scripts[index] for index in chunk],
+                source,
+                worker_options,
+            )
+            for position, index in enumerate(chunk):
+                offloaded[index] = future, position
+
+        for index, script in enumerate(scripts):
+            if index in offloaded:
+                future, position = offloaded[index]
+                yield from future.result()[position]
+            else:
+                yield from _script_documents(script, source, options)
+
+    def _parse_all_scripts(
+        self,
+        scripts: list[Script],
+        source: str,
+        options: DocumentLoaderOptions,
+    ) -> list[JsonLdRecord]:
+        if self._is_worth_parallel(scripts, source, options):
+            documents = self.parsed_documents_in_parallel(
+                scripts=scripts,
+                source=source,
+                options=options,
+                workers=options['scriptWorkers'],   # type: ignore
+            )
+        else:
+            documents = self.parsed_documents_stream(
+                scripts=scripts,
                 source=source,
                 options=options,
             )
 
-            match document_or_array:
-                case list() as array:
-                    yield from array
+        return list(documents)
 
-                case dict() as mapping:
-                    yield mapping
+    def _is_worth_parallel(
+        self,
+        scripts: list[Script],
+        source: str,
+        options: DocumentLoaderOptions,
+    ) -> bool:
+        """Is there enough expensive scripts to parse them in parallel?"""
+        if not options.get('scriptWorkers'):
+            return False
 
-                case scalar:
-                    raise DocumentIsScalar(scalar)
+        expensive_size = sum(
+            len(script.content)
+            for script in scripts
+            if _is_expensive(script, source)
+        )
+        return expensive_size >= PARALLEL_SCRIPTS_THRESHOLD
 
     @funcy.post_processing(list)
     def extract_link_tags(   # noqa: WPS210, WPS231
         self,
-        html_content: str,
+        document: HtmlElement,
         source: str,
     ) -> Iterable[LinkHeader]:
-        """Extract <link> tags."""
-        url = URL(source)
-        soup = BeautifulSoup(html_content, features='lxml')
-        links = soup.find_all('link', attrs={'rel': 'alternate'})
-        for link in links:
-            content_type = link.get('type')
-
-            if content_type:
-                href = url.join(URL(str(link['href'])))
-                yield LinkHeader(
-                    url=href,
-                    rel=str(funcy.first(link['rel'])),
-                    content_type=str(content_type),
-                    attributes={},
-                )
+        """
+        Extract <link> tags from <head> of a parsed HTML document.
 
+        HTML allows `rel=alternate` links in <head> only, and the streaming
+        parser stops reading there: links in <body> are ignored by both.
+        """
         url = URL(source)
-        if (
-            url.host == 'nanodash.knowledgepixels.com'
-            or (
-                url.host in {'purl.org', 'w3id.org'}
-                and url.path.startswith('/np/')
-            )
-        ):
+        for link in document.xpath('/html/head//link'):
+            if link_header := _link_header(url, link.attrib):
+                yield link_header
+
+        if _is_nanodash(url):
             # Hack for Nanodash which does not support content negotiation.
-            anchors = soup.find_all(
-                'a',
-                href=lambda href: href and href.endswith('.jsonld'),
-            )
-            for anchor in anchors:   # noqa: WPS526
-                anchor_href = anchor.get('href')
-                if anchor_href is not None:
+            anchor_hrefs = document.xpath('//a/@href')
+            for anchor_href in anchor_hrefs:   # noqa: WPS526
+                if anchor_href.endswith('.jsonld'):
                     yield LinkHeader(
                         url=str(anchor_href),
                         rel='alternate',
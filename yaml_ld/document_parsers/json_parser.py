@@ -1,17 +1,25 @@
-import io
+import contextlib
 import json
+import logging
+from typing import Generator
 
 from yaml_ld.document_parsers.base import (
     BaseDocumentParser,
     DocumentLoaderOptions,
+    ParserInput,
+    decoded,
+    read_content,
 )
 from yaml_ld.errors import (
     DocumentIsScalar,
     InvalidEncoding,
     LoadingDocumentFailed,
 )
+from yaml_ld.json_backend import choose_json_backend, load_items, loads
 from yaml_ld.models import JsonLdRecord
 
+logger = logging.getLogger(__name__)
+
 
 def ensure_not_scalar(document) -> JsonLdRecord | list[JsonLdRecord]:
     """Ensure document is not a scalar value."""
@@ -21,24 +29,61 @@ def ensure_not_scalar(document) -> JsonLdRecord | list[JsonLdRecord]:
     return document
 
 
+def _iter_not_scalar(
+    items: Generator[object, None, bool],
+) -> Generator[JsonLdRecord | list[JsonLdRecord], None, bool]:
+    """Ensure items are not scalars, and return what `items` returns."""
+    while True:
+        try:
+            item = next(items)
+        except StopIteration as stop:
+            return stop.value
+
+        yield ensure_not_scalar(item)
+
+
+@contextlib.contextmanager
+def except_json_errors(source: str):
+    """Convert JSON decoding errors to typed YAML-LD exceptions."""
+    try:
+        yield
+    except UnicodeDecodeError as unicode_decode_error:
+        raise InvalidEncoding() from unicode_decode_error
+    except json.JSONDecodeError as json_error:
+        raise LoadingDocumentFailed(path=source) from json_error
+
+
 class JSONDocumentParser(BaseDocumentParser):
     """Parse JSON and JSON-LD documents."""
 
+    is_cheap = True
+
     def __call__(
         self,
-        data_stream: io.BytesIO,
+        data_stream: ParserInput,
         source: str,
         options: DocumentLoaderOptions,
     ) -> JsonLdRecord | list[JsonLdRecord]:
         """Parse JSON document into LD."""
-        try:
-            text = data_stream.read().decode('utf-8')
-        except UnicodeDecodeError as unicode_decode_error:
-            raise InvalidEncoding() from unicode_decode_error
+        backend = choose_json_backend(options.get('jsonBackend'))
+        logger.debug('Parsing %s with %s JSON backend', source, backend)
 
-        try:
-            document = json.loads(text)
-        except json.JSONDecodeError as json_error:
-            raise LoadingDocumentFailed(path=source) from json_error
+        with except_json_errors(source), read_content(data_stream) as content:
+            document = loads(content, backend=backend)
 
         return ensure_not_scalar(document)
+
+    def iter_documents(
+        self,
+        data_stream: ParserInput,
+        source: str,
+    ) -> Generator[JsonLdRecord | list[JsonLdRecord], None, bool]:
+        """
+        Parse a JSON document of a stream one part at a time.
+
+        If the root of the document is an array, its items are parsed one at
+        a time, and this returns True. This always uses the standard `json`
+        module.
+        """
+        with except_json_errors(source), decoded(data_stream) as text_stream:
+            return (yield from _iter_not_scalar(load_items(text_stream)))
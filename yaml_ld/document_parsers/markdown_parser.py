@@ -1,10 +1,10 @@
-import io
-
 import frontmatter
 
 from yaml_ld.document_parsers.base import (
     BaseDocumentParser,
     DocumentLoaderOptions,
+    ParserInput,
+    read_text,
 )
 from yaml_ld.document_parsers.yaml_parser import ensure_not_scalar
 from yaml_ld.errors import InvalidEncoding, LoadingDocumentFailed
@@ -16,13 +16,13 @@ class MarkdownDocumentParser(BaseDocumentParser):
 
     def __call__(   # noqa: WPS238, WPS231, WPS225, C901
         self,
-        data_stream: io.BytesIO,
+        data_stream: ParserInput,
         source: str,
         options: DocumentLoaderOptions,
     ) -> JsonLdRecord | list[JsonLdRecord]:
         """Parse Markdown document with YAML front matter into LD."""
         try:
-            markdown_content = data_stream.read().decode('utf-8')
+            markdown_content = read_text(data_stream)
         except UnicodeDecodeError as unicode_decode_error:
             raise InvalidEncoding() from unicode_decode_error
 
@@ -0,0 +1,215 @@
+import io
+import re
+from typing import IO, Iterator
+
+from yaml_ld.document_parsers.base import (
+    DocumentLoaderOptions,
+    ParserInput,
+    decoded,
+)
+from yaml_ld.document_parsers.rdf_parser import (
+    RDF_LANG_STRING,
+    XSD_STRING,
+    RDFDataset,
+    RDFDocumentParser,
+)
+from yaml_ld.errors import InvalidEncoding, InvalidNQuadsLine
+from yaml_ld.rdf import Quad, Term
+
+_IRI = '<([^>]*)>'
+# A label might contain, but not end with, a dot.
+_BLANK_NODE = r'(_:[^\s<>"]*[^\s<>".])'
+_LITERAL = (
+    r'"((?:[^"\\\r\n]|\\.)*)"'
+    r'(?:\^\^<([^>]*)>|@([a-zA-Z]+(?:-[a-zA-Z0-9]+)*))?'
+)
+_SPACE = '[ \t]*'
+_END = r'(?:#[^\r\n]*)?[\r\n]*'
+
+_STATEMENT = re.compile(''.join([
+    _SPACE,
+    f'(?:{_IRI}|{_BLANK_NODE})',
+    _SPACE,
+    _IRI,
+    _SPACE,
+    f'(?:{_IRI}|{_BLANK_NODE}|{_LITERAL})',
+    _SPACE,
+    f'(?:(?:{_IRI}|{_BLANK_NODE}){_SPACE})?',
+    r'\.',
+    _SPACE,
+    _END,
+]))
+_BLANK_LINE = re.compile(_SPACE + _END)
+
+_ESCAPE = re.compile(
+    r'\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|([tbnrf"\'\\]))',
+)
+_ESCAPED_CHARACTERS = {
+    't': '\t',
+    'b': '\b',
+    'n': '\n',
+    'r': '\r',
+    'f': '\f',
+    '"': '"',
+    "'": "'",
+    '\\': '\\',
+}
+
+Statement = tuple[str | None, ...]
+"""Groups of `_STATEMENT` regular expression matched on a line."""
+
+
+def _unescape_match(match: re.Match[str]) -> str:
+    short_code, long_code, character = match.groups()
+    if character is not None:
+        return _ESCAPED_CHARACTERS[character]
+
+    return chr(int(short_code or long_code, 16))
+
+
+def _unescape(text: str) -> str:
+    if '\\' not in text:
+        return text
+
+    return _ESCAPE.sub(_unescape_match, text)
+
+
+def _node(iri: str | None, blank_node: str | None) -> Term:
+    if iri is not None:
+        return {'type': 'IRI', 'value': _unescape(iri)}
+
+    return {'type': 'blank node', 'value': blank_node}   # type: ignore
+
+
+def _literal(
+    lexical_form: str,
+    datatype: str | None,
+    language: str | None,
+) -> Term:
+    if language is not None:
+        return {
+            'type': 'literal',
+            'value': _unescape(lexical_form),
+            'datatype': RDF_LANG_STRING,
+            'language': language,
+        }
+
+    return {
+        'type': 'literal',
+        'value': _unescape(lexical_form),
+        'datatype': _unescape(datatype) if datatype else XSD_STRING,
+    }
+
+
+def _quad(statement: Statement) -> Quad:
+    (
+        subject_iri, subject_blank_node,
+        predicate,
+        object_iri, object_blank_node, lexical_form, datatype, language,
+        graph_iri, graph_blank_node,
+    ) = statement
+
+    rdf_object = (
+        _node(object_iri, object_blank_node)
+        if lexical_form is None
+        else _literal(lexical_form, datatype, language)
+    )
+    graph = graph_blank_node or '@default'
+    if graph_iri is not None:
+        graph = _unescape(graph_iri)
+
+    return {
+        'subject': _node(subject_iri, subject_blank_node),
+        'predicate': {'type': 'IRI', 'value': _unescape(predicate)},
+        'object': rdf_object,
+        'graph': graph,
+    }
+
+
+def _lines(text_stream: IO[str] | str) -> IO[str]:
+    """Split text at any of `\\n`, `\\r` and `\\r\\n`, as N-Quads does."""
+    if isinstance(text_stream, str):
+        return io.StringIO(text_stream, newline='')
+
+    return text_stream
+
+
+class NQuadsParser(RDFDocumentParser):
+    """
+    Parse N-Quads documents, one line at a time.
+
+    Memory use of `iter_quads()` is bounded by the longest line, so files of
+    any size can be converted as a stream.
+    """
+
+    allows_graph_names = True
+    """May statements name the graph they belong to?"""
+
+    def iter_quads(
+        self,
+        data_stream: ParserInput,
+        source: str,
+    ) -> Iterator[Quad]:
+        """Parse quads one by one, as they are read."""
+        for statement in self._statements(data_stream, source):
+            yield _quad(statement)
+
+    def dataset(
+        self,
+        data_stream: ParserInput,
+        source: str,
+        options: DocumentLoaderOptions,
+    ) -> RDFDataset:
+        """Parse a document into an RDF dataset, skipping repeated quads."""
+        dataset = RDFDataset()
+        seen_statements: set[Statement] = set()
+        for statement in self._statements(data_stream, source):
+            if statement in seen_statements:
+                continue
+
+            seen_statements.add(statement)
+            quad = _quad(statement)
+            dataset.setdefault(quad.pop('graph'), []).append(quad)
+
+        return dataset
+
+    def _statements(
+        self,
+        data_stream: ParserInput,
+        source: str,
+    ) -> Iterator[Statement]:
+        try:
+            with decoded(data_stream) as text_stream:
+                yield from self._parse_lines(_lines(text_stream), source)
+        except UnicodeDecodeError as unicode_decode_error:
+            raise InvalidEncoding() from unicode_decode_error
+
+    def _parse_lines(
+        self,
+        lines: IO[str],
+        source: str,
+    ) -> Iterator[Statement]:
+        for line_number, line in enumerate(lines, start=1):
+            match = _STATEMENT.fullmatch(line)
+            if match is None and _BLANK_LINE.fullmatch(line):
+                continue
+
+            if match is None or not self._is_allowed(match.groups()):
+                raise InvalidNQuadsLine(
+                    source=source,
+                    line_number=line_number,
+                    line=line.rstrip('\r\n'),
+                )
+
+            yield match.groups()
+
+    def _is_allowed(self, statement: Statement) -> bool:
+        graph_iri, graph_blank_node = statement[-2:]
+        is_in_default_graph = graph_iri is None and graph_blank_node is None
+        return self.allows_graph_names or is_in_default_graph
+
+
+class NTriplesParser(NQuadsParser):
+    """Parse N-Triples documents, one line at a time."""
+
+    allows_graph_names = False
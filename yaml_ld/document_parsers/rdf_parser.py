@@ -0,0 +1,176 @@
+from abc import abstractmethod
+from pathlib import Path
+
+import rdflib
+from pyld import jsonld
+from rdflib import BNode, ConjunctiveGraph, Graph, Literal
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from yarl import URL
+
+from yaml_ld.document_parsers.base import (
+    BaseDocumentParser,
+    DocumentLoaderOptions,
+    ParserInput,
+    as_stream,
+)
+from yaml_ld.models import JsonLdRecord
+from yaml_ld.rdf import Term, Triple
+
+XSD_STRING = 'http://www.w3.org/2001/XMLSchema#string'
+RDF_LANG_STRING = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#langString'
+
+
+class RDFDataset(dict[str, list[Triple]]):   # type: ignore
+    """RDF dataset parsed from a document, in the form `pyld` uses."""
+
+
+class RDFDocumentParser(BaseDocumentParser):
+    """
+    Parse documents in an RDF syntax.
+
+    With `rdfDataset` loader option, return the `RDFDataset` as it is:
+    `to_rdf()` does that to skip converting it to JSON-LD and back again.
+    """
+
+    @abstractmethod
+    def dataset(
+        self,
+        data_stream: ParserInput,
+        source: str,
+        options: DocumentLoaderOptions,
+    ) -> RDFDataset:
+        """Parse a document into an RDF dataset."""
+        raise NotImplementedError()
+
+    def __call__(
+        self,
+        data_stream: ParserInput,
+        source: str,
+        options: DocumentLoaderOptions,
+    ) -> JsonLdRecord | list[JsonLdRecord] | RDFDataset:
+        """Parse a document into an RDF dataset, or into LD."""
+        dataset = self.dataset(data_stream, source, options)
+        if options.get('rdfDataset', False):
+            return dataset
+
+        return jsonld.from_rdf(dataset)
+
+
+class DatasetSink(Graph):
+    """
+    `rdflib` graph which converts triples as they are parsed, not storing them.
+
+    Blank nodes are labeled `_:b0`, `_:b1`, … as `pyld` does. A triple
+    repeated in the document is kept as many times: finding repeats would
+    take a second copy of every triple.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.dataset = RDFDataset({'@default': []})
+        self.issuer = jsonld.IdentifierIssuer('_:b')
+
+    def add(self, triple) -> 'DatasetSink':
+        """Convert a triple of the default graph to `pyld` form."""
+        return self.add_to_graph(triple, '@default')
+
+    def add_to_graph(self, triple, graph_name: str) -> 'DatasetSink':
+        """Convert a triple of a named graph to `pyld` form."""
+        subject, predicate, rdf_object = triple
+        self.dataset.setdefault(graph_name, []).append({
+            'subject': self.convert(subject),
+            'predicate': self.convert(predicate),
+            'object': self.convert(rdf_object),
+        })
+        return self
+
+    def convert(self, term) -> Term:
+        """Convert an `rdflib` term to `pyld` form."""
+        match term:
+            case BNode():
+                return {
+                    'type': 'blank node',
+                    'value': self.issuer.get_id(str(term)),
+                }
+
+            case Literal(language=str() as language):
+                return {
+                    'type': 'literal',
+                    'value': str(term),
+                    'datatype': RDF_LANG_STRING,
+                    'language': language,
+                }
+
+            case Literal():
+                return {
+                    'type': 'literal',
+                    'value': str(term),
+                    'datatype': str(term.datatype or XSD_STRING),
+                }
+
+        return {'type': 'IRI', 'value': str(term)}
+
+
+def dataset_from_rdflib(graph: Graph) -> RDFDataset:
+    """Convert an `rdflib` graph, or a dataset of graphs, to `pyld` form."""
+    sink = DatasetSink()
+    if not isinstance(graph, ConjunctiveGraph):
+        for triple in graph:
+            sink.add(triple)
+
+        return sink.dataset
+
+    default_graph = (
+        DATASET_DEFAULT_GRAPH_ID
+        if isinstance(graph, rdflib.Dataset)
+        else graph.default_context.identifier
+    )
+    for subject, predicate, rdf_object, context in graph.quads():
+        # `Dataset` yields names of graphs, `ConjunctiveGraph` graphs.
+        context_name = getattr(context, 'identifier', context)
+        graph_name = '@default'
+        if context_name != default_graph:
+            graph_name = sink.convert(context_name)['value']
+
+        sink.add_to_graph((subject, predicate, rdf_object), graph_name)
+
+    return sink.dataset
+
+
+class RDFLibDocumentParser(RDFDocumentParser):
+    """Parse documents with an `rdflib` parser."""
+
+    rdflib_format: str
+    """Name of the `rdflib` parser plugin."""
+
+    def dataset(
+        self,
+        data_stream: ParserInput,
+        source: str,
+        options: DocumentLoaderOptions,
+    ) -> RDFDataset:
+        """Parse a document into an RDF dataset, triple by triple."""
+        sink = DatasetSink()
+        sink.parse(
+            as_stream(data_stream),
+            format=self.rdflib_format,
+            publicID=public_id(source),
+        )
+        return sink.dataset
+
+
+def public_id(source: str) -> str | None:
+    """
+    IRI to resolve relative IRIs of a document against.
+
+    `rdflib` would take it from the name of the stream, which a memory mapped
+    file or content in memory does not have.
+    """
+    if not source:
+        return None
+
+    if URL(source).scheme:
+        return source
+
+    return Path(source).absolute().as_uri()
+
@@ -1,24 +1,7 @@
-import io
+from yaml_ld.document_parsers.rdf_parser import RDFLibDocumentParser
 
-from rdflib import Graph
-from rdflib_pyld_compat import pyld_jsonld_from_rdflib_graph
 
-from yaml_ld.document_parsers.base import (
-    BaseDocumentParser,
-    DocumentLoaderOptions,
-)
-from yaml_ld.models import JsonLdRecord
-
-
-class TurtleParser(BaseDocumentParser):
+class TurtleParser(RDFLibDocumentParser):
     """Parse Turtle documents."""
 
-    def __call__(   # noqa: WPS238, WPS231, WPS225, C901
-        self,
-        data_stream: io.BytesIO,
-        source: str,
-        options: DocumentLoaderOptions,
-    ) -> JsonLdRecord | list[JsonLdRecord]:
-        """Parse YAML document stream into LD."""
-        graph = Graph().parse(data_stream, format='turtle')
-        return pyld_jsonld_from_rdflib_graph(graph)
+    rdflib_format = 'turtle'
@@ -1,13 +1,20 @@
-import io
+import collections
+import contextlib
+import functools
+import re
+from typing import IO, Generator
 
 from ruamel.yaml.composer import ComposerError
 from ruamel.yaml.constructor import ConstructorError
+from ruamel.yaml.parser import ParserError
 from ruamel.yaml.reader import ReaderError
 from ruamel.yaml.scanner import ScannerError
 
 from yaml_ld.document_parsers.base import (
     BaseDocumentParser,
     DocumentLoaderOptions,
+    ParserInput,
+    decoded,
 )
 from yaml_ld.errors import (
     DocumentIsScalar,
@@ -16,9 +23,22 @@ from yaml_ld.errors import (
     MappingKeyError,
     UndefinedAliasFound,
 )
-from yaml_ld.loader import load_all  # noqa: WPS347
+from yaml_ld.loader import (  # noqa: WPS347
+    YAMLBackend,
+    choose_backend,
+    load_all,
+    load_items,
+)
 from yaml_ld.models import JsonLdRecord
 
+DECODE_CHUNK_SIZE = 64 * 1024
+"""How many characters to decode at once when checking encoding."""
+
+VERSION_DIRECTIVE = re.compile(r'^\ufeff?%YAML\s', re.MULTILINE)
+VERSION_DIRECTIVE_AFTER_LINE_BREAK = re.compile(r'\n\ufeff?%YAML\s')
+DIRECTIVE_PREFIX_LENGTH = len('\n\ufeff%YAML')
+"""How much of a directive might end a chunk, without the space after it."""
+
 
 def ensure_not_scalar(document) -> JsonLdRecord | list[JsonLdRecord]:
     """Ensure document is not a scalar value."""
@@ -28,51 +48,174 @@ def ensure_not_scalar(document) -> JsonLdRecord | list[JsonLdRecord]:
     return document
 
 
+@contextlib.contextmanager
+def except_yaml_errors(source: str):   # noqa: WPS238, C901
+    """Convert `ruamel.yaml` errors to typed YAML-LD exceptions."""
+    try:   # noqa: WPS225
+        yield
+
+    except (UnicodeDecodeError, ReaderError) as reader_error:
+        raise InvalidEncoding() from reader_error
+
+    except ConstructorError as err:
+        if err.problem == 'found unhashable key':
+            raise MappingKeyError() from err
+
+        raise
+
+    except ScannerError as err:
+        raise LoadingDocumentFailed(path=source) from err
+
+    except ComposerError as err:
+        raise UndefinedAliasFound() from err
+
+
+class _VersionDirectiveFound(Exception):  # noqa: N818
+    """`libyaml` is about to read a `%YAML` directive, which it disregards."""
+
+
+class _VersionDirectiveWatch:
+    """
+    Text stream which stops `libyaml` when it reads a `%YAML` directive.
+
+    Each chunk is checked as `libyaml` reads it, which takes no extra pass
+    over the stream.
+    """
+
+    def __init__(self, text_stream: IO[str]) -> None:
+        self._text_stream = text_stream
+        # The first line follows no line break, pretend it does.
+        self._tail = '\n'
+
+    def read(self, size: int = -1) -> str:
+        """Read a chunk, unless it contains a `%YAML` directive."""
+        chunk = self._text_stream.read(size)
+        if VERSION_DIRECTIVE_AFTER_LINE_BREAK.search(self._tail + chunk):
+            raise _VersionDirectiveFound()
+
+        if chunk:
+            # Keep the end of the last line, if a directive might start it.
+            tail_start = max(len(chunk) - DIRECTIVE_PREFIX_LENGTH, 0)
+            line_break = chunk.rfind('\n', tail_start)
+            self._tail = chunk[line_break:] if line_break >= 0 else ''
+
+        return chunk
+
+
+def ensure_decodable(text_stream: IO[str]) -> None:
+    """Decode the rest of the stream, to reject invalid UTF-8 anywhere in it."""
+    chunks = iter(functools.partial(text_stream.read, DECODE_CHUNK_SIZE), '')
+    collections.deque(chunks, maxlen=0)
+
+
 class YAMLDocumentParser(BaseDocumentParser):
     """Parse YAML documents."""
 
-    def __call__(   # noqa: WPS238, WPS231, WPS225, C901
+    def __call__(
         self,
-        data_stream: io.BytesIO,
+        data_stream: ParserInput,
         source: str,
         options: DocumentLoaderOptions,
     ) -> JsonLdRecord | list[JsonLdRecord]:
-        """Parse YAML document stream into LD."""
-        # FIXME This is super ugly:
-        #   because:
-        #     $: |
-        #       We have to decode the incoming stream and fail if it is not UTF8
-        #   therefore:
-        #     $: We load whole content in memory
-        try:
-            decoded_stream = io.StringIO(data_stream.read().decode())
-        except UnicodeDecodeError as unicode_decode_error:
-            raise InvalidEncoding() from unicode_decode_error
-
-        yaml_documents_stream = load_all(decoded_stream)
-
-        try:   # noqa: WPS225
-            return ensure_not_scalar(
-                self._yaml_document_from_stream(
-                    stream=yaml_documents_stream,
-                    extract_all_scripts=options.get('extractAllScripts', False),
-                ),
+        """Parse YAML document into LD."""
+        backend = choose_backend(options.get('yamlBackend'))
+        extract_all_scripts = options.get('extractAllScripts', False)
+
+        with except_yaml_errors(source):
+            if isinstance(data_stream, bytes | memoryview):
+                # Decode once, rather than for each backend we might try.
+                data_stream = str(data_stream, 'utf-8')
+
+            if (
+                backend == YAMLBackend.LIBYAML
+                and self._is_rereadable(data_stream)
+                and not self._has_version_directive(data_stream)
+            ):
+                position = self._tell(data_stream)
+                try:
+                    return self._parse(
+                        data_stream,
+                        extract_all_scripts=extract_all_scripts,
+                        backend=backend,
+                    )
+                except (ScannerError, ParserError, _VersionDirectiveFound):
+                    # libyaml implements YAML 1.1 scanner, which rejects some
+                    # YAML 1.2 documents, and disregards `%YAML` directives;
+                    # let the pure Python one decide.
+                    if position is not None:
+                        data_stream.seek(position)   # type: ignore
+
+            return self._parse(
+                data_stream,
+                extract_all_scripts=extract_all_scripts,
+                backend=YAMLBackend.PURE,
             )
 
-        except (UnicodeDecodeError, ReaderError) as reader_error:
-            raise InvalidEncoding() from reader_error
+    def iter_documents(
+        self,
+        data_stream: ParserInput,
+        source: str,
+    ) -> Generator[JsonLdRecord | list[JsonLdRecord], None, bool]:
+        """
+        Parse YAML documents of a stream one at a time.
+
+        If the root of a document is a sequence, its items are parsed one at a
+        time too. This always uses the pure Python YAML backend. Returns True:
+        a stream is a list of documents.
+        """
+        with except_yaml_errors(source), decoded(data_stream) as text_stream:
+            yield from map(ensure_not_scalar, load_items(text_stream))
 
-        except ConstructorError as err:
-            if err.problem == 'found unhashable key':
-                raise MappingKeyError() from err
+        return True
 
-            raise
+    def _is_rereadable(self, data_stream: IO[bytes] | IO[str] | str) -> bool:
+        return isinstance(data_stream, str) or data_stream.seekable()
+
+    def _has_version_directive(
+        self,
+        data_stream: IO[bytes] | IO[str] | str,
+    ) -> bool:
+        """
+        Does a `%YAML` directive choose the version of YAML?
+
+        `libyaml` disregards it, and the pure Python backend does not: such
+        documents are left to the latter, so that both backends agree. A
+        stream is watched for directives while `libyaml` reads it instead.
+        """
+        return (
+            isinstance(data_stream, str)
+            and VERSION_DIRECTIVE.search(data_stream) is not None
+        )
+
+    def _tell(self, data_stream: IO[bytes] | IO[str] | str) -> int | None:
+        if isinstance(data_stream, str):
+            return None
+
+        return data_stream.tell()
+
+    def _parse(
+        self,
+        data_stream: IO[bytes] | IO[str] | str,
+        extract_all_scripts: bool,
+        backend: YAMLBackend,
+    ) -> JsonLdRecord | list[JsonLdRecord]:
+        with decoded(data_stream) as text_stream:
+            yaml_stream = text_stream
+            if backend == YAMLBackend.LIBYAML and not isinstance(
+                text_stream,
+                str,
+            ):
+                yaml_stream = _VersionDirectiveWatch(text_stream)
+
+            yaml_document = self._yaml_document_from_stream(
+                stream=load_all(yaml_stream, backend=backend),
+                extract_all_scripts=extract_all_scripts,
+            )
 
-        except ScannerError as err:
-            raise LoadingDocumentFailed(path=source) from err
+            if not extract_all_scripts and not isinstance(text_stream, str):
+                ensure_decodable(text_stream)
 
-        except ComposerError as err:
-            raise UndefinedAliasFound() from err
+        return ensure_not_scalar(yaml_document)
 
     def _yaml_document_from_stream(self, stream, extract_all_scripts: bool):
         if extract_all_scripts:
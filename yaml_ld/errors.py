@@ -1,10 +1,15 @@
+import contextlib
+import dataclasses
+import functools
 import textwrap
 from dataclasses import dataclass
+from json import JSONDecodeError
 from pathlib import Path
 from typing import Iterable
 
 import funcy
 from documented import DocumentedError
+from pyld import jsonld
 from yarl import URL
 
 from yaml_ld.models import JsonLdRecord
@@ -13,6 +18,18 @@ from yaml_ld.models import JsonLdRecord
 class YAMLLDError(DocumentedError):
     """An error happened while processing YAML-LD data."""
 
+    def __reduce__(self):
+        """Pickle by field values, to pass errors between processes."""
+        if not dataclasses.is_dataclass(self):
+            return super().__reduce__()
+
+        field_values = {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+            if field.init
+        }
+        return functools.partial(type(self), **field_values), ()
+
 
 @dataclass
 class PyLDError(YAMLLDError):   # type: ignore
@@ -79,7 +96,7 @@ class NoLinkedDataFoundInHTML(YAMLLDError):   # type: ignore
     ```
     """
 
-    html: bytes
+    html: bytes | str
     code: str = 'loading document failed'
 
     def _preview_lines(self, html_text: str) -> Iterable[str]:
@@ -101,11 +118,13 @@ class NoLinkedDataFoundInHTML(YAMLLDError):   # type: ignore
     def html_text(self):
         """Format HTML text for printing."""
         max_line_length = 80
+        html = self.html
+        if isinstance(html, bytes):
+            html = html.decode()
+
         return '\n'.join(
             textwrap.shorten(line, max_line_length)
-            for line in self._preview_lines(
-                self.html.decode(),
-            )
+            for line in self._preview_lines(html)
         )
 
 
@@ -134,6 +153,39 @@ class InvalidEncoding(YAMLLDError):   # type: ignore
     code: str = 'invalid encoding'
 
 
+@dataclass(kw_only=True)
+class InvalidNQuadsLine(PyLDError):   # type: ignore
+    """
+    A line of an N-Triples or N-Quads document is not a valid statement.
+
+    Source: {self.source}
+    Line {self.line_number}: `{self.line}`
+    """
+
+    source: str
+    line_number: int
+    line: str
+    message: str = 'Error while parsing N-Quads; invalid quad.'
+    code: str = 'jsonld.ParseError'
+
+
+@dataclass
+class UnknownYAMLBackend(YAMLLDError):   # type: ignore
+    """
+    YAML backend `{self.backend}` is unknown.
+
+    Choose one of: {self.choices_text}.
+    """
+
+    backend: str
+    choices: list[str]
+
+    @property
+    def choices_text(self) -> str:
+        """Format the known backends for printing."""
+        return ', '.join(self.choices)
+
+
 @dataclass
 class CycleDetected(YAMLLDError):   # type: ignore
     """A YAML-LD document MUST NOT contain cycles."""
@@ -184,3 +236,47 @@ class ContentTypeNotDetermined(YAMLLDError):   # type: ignore
     def head(self) -> str:
         """Show a piece of the document content."""
         return textwrap.shorten(self.content, self.head_length)
+
+
+def except_json_ld_error(err: jsonld.JsonLdError):  # noqa: WPS238
+    """Handle JsonLdError."""
+    # We need to drill down; for instance, `to_rdf()` raises an error which
+    # contains an actual error from `expand()` in its `.cause` field.
+    err = err.cause or err
+
+    if isinstance(err, JSONDecodeError):
+        raise InvalidJSONLiteral() from err
+
+    match err.code:
+        case LoadingRemoteContextFailed.code:
+            raise LoadingRemoteContextFailed(
+                context=err.details['url'],
+                reason=str(err.details['cause']),
+            ) from err
+
+        case 'invalid @id value' | 'invalid type value':
+            raise LoadingDocumentFailed(path='') from err
+
+        case _:
+            raise PyLDError(
+                message=str(err),
+                code=err.code,
+            ) from err
+
+
+@contextlib.contextmanager
+def except_json_ld_errors():   # noqa: WPS238, C901
+    """Convert pyld errors to typed YAML-LD exceptions."""
+    try:  # noqa: WPS225
+        yield
+    except TypeError as err:
+        if 'not supported between instances of ' in str(err):
+            raise MappingKeyError() from err
+
+        raise
+    except RecursionError as err:
+        raise CycleDetected() from err
+    except JSONDecodeError as err:
+        raise InvalidScriptElement() from err
+    except jsonld.JsonLdError as err:
+        except_json_ld_error(err)
@@ -0,0 +1,259 @@
+"""
+Fast entry points to the YAML-LD API.
+
+These functions take options compiled with `.compile()` method of an options
+class, and skip argument validation: arguments are passed to `pyld` as they
+are.
+"""
+import itertools
+
+import rdflib
+from pyld import jsonld
+
+from yaml_ld.document_loaders.content_types import construct_accept_header
+from yaml_ld.document_parsers.nquads_parser import NQuadsParser
+from yaml_ld.document_parsers.rdf_parser import (
+    RDFDataset,
+    dataset_from_rdflib,
+)
+from yaml_ld.errors import except_json_ld_errors
+from yaml_ld.models import (
+    URI,
+    CompiledContext,
+    JsonLdContext,
+    JsonLdInput,
+    JsonLdRecord,
+    RemoteDocument,
+    ensure_string_or_document,
+)
+from yaml_ld.nquads_writer import to_nquad
+from yaml_ld.options import CompiledOptions
+from yaml_ld.processor import CompiledContextProcessor
+from yaml_ld.rdf import Dataset, EncodedDataset, RDFInput, iter_quads
+from yaml_ld.rdflib_writer import add_to_rdflib
+
+N_QUADS = 'application/n-quads'
+N_QUADS_FORMATS = frozenset((N_QUADS, 'application/nquads'))
+"""Names of N-Quads format `pyld` knows."""
+
+
+def expand(
+    document: JsonLdInput,
+    options: CompiledOptions,
+) -> list[JsonLdRecord]:
+    """Expand a document, see `yaml_ld.expand()`."""
+    with except_json_ld_errors():
+        return CompiledContextProcessor().expand(
+            input_=ensure_string_or_document(document),
+            options=options,
+        )
+
+
+def compact(
+    document: JsonLdInput,
+    ctx: JsonLdContext | CompiledContext | None,
+    options: CompiledOptions,
+) -> JsonLdRecord | list[JsonLdRecord]:
+    """Compact a document, see `yaml_ld.compact()`."""
+    processor = CompiledContextProcessor(ctx or {})
+    with except_json_ld_errors():
+        return processor.compact(
+            input_=ensure_string_or_document(document),
+            ctx=processor.context,
+            options=options,
+        )
+
+
+def flatten(
+    document: JsonLdInput,
+    ctx: JsonLdContext | CompiledContext | None,
+    options: CompiledOptions,
+) -> JsonLdRecord:
+    """Flatten a document, see `yaml_ld.flatten()`."""
+    processor = CompiledContextProcessor(ctx)
+    with except_json_ld_errors():
+        return processor.flatten(
+            input_=ensure_string_or_document(document),
+            ctx=processor.context,
+            options=options,
+        )
+
+
+def frame(
+    document: JsonLdInput,
+    frame: JsonLdRecord,   # noqa: WPS442
+    options: CompiledOptions,
+) -> JsonLdRecord:
+    """Frame a document, see `yaml_ld.frame()`."""
+    with except_json_ld_errors():
+        return CompiledContextProcessor().frame(
+            input_=ensure_string_or_document(document),
+            frame=frame,
+            options=options,
+        )
+
+
+def to_rdf(
+    document: JsonLdInput,
+    options: CompiledOptions,
+) -> Dataset | EncodedDataset | str:
+    """Convert a document to RDF, see `yaml_ld.to_rdf()`."""
+    if isinstance(document, URI):
+        options = options.copy()
+        options['headers']['Accept'] = construct_accept_header(document)
+
+        # Documents in RDF syntaxes need not be converted to JSON-LD first.
+        load_options = {'base': str(document), **options, 'rdfDataset': True}
+        remote_document = options['documentLoader'](
+            str(document),
+            load_options,
+        )
+        if isinstance(remote_document['document'], RDFDataset):
+            with except_json_ld_errors():
+                return _serialize_dataset(remote_document['document'], options)
+
+        # A parser might have found the base in the document, as HTML one does.
+        options['base'] = load_options['base']
+        options['documentLoader'] = _preloaded(
+            remote_document,
+            url=str(document),
+            document_loader=options['documentLoader'],
+        )
+
+    with except_json_ld_errors():
+        rdf = CompiledContextProcessor().to_rdf(
+            input_=ensure_string_or_document(document),
+            options=options,
+        )
+
+    if options.get('encoded') and isinstance(rdf, dict):
+        return EncodedDataset.from_dataset(rdf)
+
+    return rdf
+
+
+def to_rdflib(
+    document: JsonLdInput,
+    graph: rdflib.Graph,
+    options: CompiledOptions,
+) -> rdflib.Graph:
+    """Convert a document to RDF in `rdflib`, see `yaml_ld.to_rdflib()`."""
+    dataset = to_rdf(
+        document,
+        CompiledOptions({
+            option_name: option_value
+            for option_name, option_value in options.items()
+            if option_name not in {'format', 'encoded'}
+        }),
+    )
+    add_to_rdflib(iter_quads(dataset), graph)   # type: ignore
+    return graph
+
+
+def _preloaded(
+    remote_document: RemoteDocument,
+    url: str,
+    document_loader,
+):
+    """Serve a document loaded already, and load the rest as usual."""
+    def load_document(source, options):   # noqa: WPS430
+        if source == url:
+            return remote_document
+
+        return document_loader(source, options)
+
+    return load_document
+
+
+def _serialize_dataset(
+    dataset: Dataset,
+    options: dict,
+) -> Dataset | EncodedDataset | str:
+    """Convert a dataset to the output format, as `pyld` does."""
+    output_format = options.get('format')
+    if output_format is None and options.get('encoded'):
+        return EncodedDataset.from_dataset(dataset)
+
+    if output_format is None:
+        # The dataset might be cached by the loader: do not hand it out.
+        return {
+            graph_name: list(triples)
+            for graph_name, triples in dataset.items()
+        }
+
+    if output_format in N_QUADS_FORMATS:
+        # Lines are sorted, as `pyld` sorts them; repeated ones are adjacent.
+        lines = sorted(map(to_nquad, iter_quads(dataset)))
+        return ''.join(line for line, _repeats in itertools.groupby(lines))
+
+    raise jsonld.JsonLdError(
+        'Unknown output format.',
+        'jsonld.UnknownFormat',
+        {'format': output_format},
+    )
+
+
+def from_rdf(
+    dataset: RDFInput,
+    options: CompiledOptions,
+) -> JsonLdRecord:
+    """Convert an RDF dataset to a document, see `yaml_ld.from_rdf()`."""
+    input_format = options.get('format', N_QUADS)
+    if isinstance(dataset, str) and input_format not in N_QUADS_FORMATS:
+        # Let `pyld` parse the format, or report it is not supported.
+        with except_json_ld_errors():
+            return jsonld.from_rdf(dataset, options)
+
+    dict_options = {
+        option_name: option_value
+        for option_name, option_value in options.items()
+        if option_name != 'format'
+    }
+    with except_json_ld_errors():
+        return jsonld.from_rdf(_as_dataset(dataset), dict_options)
+
+
+def _as_dataset(rdf_input: RDFInput) -> Dataset:
+    """Convert any kind of RDF input to a dataset `pyld` takes as it is."""
+    match rdf_input:
+        case str():
+            return NQuadsParser().dataset(rdf_input, source='', options={})
+
+        case rdflib.Graph():
+            return dataset_from_rdflib(rdf_input)
+
+        case dict():
+            return rdf_input
+
+    dataset: Dataset = {}
+    for quad in rdf_input:
+        # `pyld` does not mind the `graph` key of a quad, no need to drop it.
+        dataset.setdefault(quad['graph'], []).append(quad)
+
+    return dataset
+
+
+def load_document(   # noqa: WPS211
+    url: URI,
+    options: CompiledOptions,
+    base=None,
+    profile=None,
+    requestProfile=None,   # noqa: N803
+) -> RemoteDocument:
+    """Load a document, see `yaml_ld.load_document()`."""
+    dict_options = options.copy()
+    headers = dict_options['headers']
+    headers['Accept'] = construct_accept_header(url)
+
+    if requestProfile:
+        headers['Accept'] = (
+            f'application/ld+json;profile={requestProfile}, '
+        ) + headers['Accept']
+
+    return jsonld.load_document(
+        url=str(url),
+        options=dict_options,
+        base=base,
+        profile=profile,
+        requestProfile=requestProfile,
+    )
@@ -1,28 +1,24 @@
 from pydantic import validate_call
-from pyld import jsonld
 
-from yaml_ld.document_loaders.content_types import (
-    DEFAULT_ACCEPT_HEADER,
-    DEFAULT_USER_AGENT,
-)
-from yaml_ld.document_loaders.default import DEFAULT_DOCUMENT_LOADER
-from yaml_ld.expand import except_json_ld_errors
+from yaml_ld import fast
 from yaml_ld.models import (
     DEFAULT_VALIDATE_CALL_CONFIG,
+    CompiledContext,
     JsonLdContext,
     JsonLdInput,
     JsonLdRecord,
-    ensure_string_or_document,
 )
 from yaml_ld.options import (
     BaseOptions,
     ExpandContextOptions,
     ExtractAllScriptsOptions,
+    ParserOptions,
 )
 
 
 class FlattenOptions(   # type: ignore
     BaseOptions,
+    ParserOptions,
     ExtractAllScriptsOptions,
     ExpandContextOptions,
 ):
@@ -38,7 +34,7 @@ DEFAULT_FLATTEN_OPTIONS = FlattenOptions()
 @validate_call(config=DEFAULT_VALIDATE_CALL_CONFIG)
 def flatten(
     document: JsonLdInput,
-    ctx: JsonLdContext | None = None,
+    ctx: JsonLdContext | CompiledContext | None = None,
     options: FlattenOptions = DEFAULT_FLATTEN_OPTIONS,
 ) -> JsonLdRecord:
     """
@@ -48,18 +44,4 @@ def flatten(
     their relationships, to simplify data processing and ensure all referenced
     nodes are included.
     """
-    dict_options = options.model_dump(by_alias=True, exclude_none=True)
-    dict_options.setdefault('documentLoader', DEFAULT_DOCUMENT_LOADER)
-    dict_options.setdefault(
-        'headers', {
-            'Accept': DEFAULT_ACCEPT_HEADER,
-            'User-Agent': DEFAULT_USER_AGENT,
-        },
-    )
-
-    with except_json_ld_errors():
-        return jsonld.flatten(
-            input_=ensure_string_or_document(document),
-            ctx=ctx,
-            options=dict_options,
-        )
+    return fast.flatten(document, ctx, options.compile())
@@ -1,23 +1,22 @@
 from pydantic import validate_call
-from pyld import jsonld
 
-from yaml_ld.document_loaders.default import DEFAULT_DOCUMENT_LOADER
-from yaml_ld.expand import except_json_ld_errors
+from yaml_ld import fast
 from yaml_ld.models import (
     DEFAULT_VALIDATE_CALL_CONFIG,
     JsonLdInput,
     JsonLdRecord,
-    ensure_string_or_document,
 )
 from yaml_ld.options import (
     BaseOptions,
     ExpandContextOptions,
     ExtractAllScriptsOptions,
+    ParserOptions,
 )
 
 
 class FrameOptions(   # type: ignore
     BaseOptions,
+    ParserOptions,
     ExtractAllScriptsOptions,
     ExpandContextOptions,
 ):
@@ -56,12 +55,4 @@ def frame(
     options: FrameOptions = DEFAULT_FRAME_OPTIONS,
 ) -> JsonLdRecord:
     """Frame a [＊-LD](/blog/any-ld/) document."""
-    dict_options = options.model_dump(by_alias=True, exclude_none=True)
-    dict_options.setdefault('documentLoader', DEFAULT_DOCUMENT_LOADER)
-
-    with except_json_ld_errors():
-        return jsonld.frame(
-            input_=ensure_string_or_document(document),
-            frame=frame,
-            options=dict_options,
-        )
+    return fast.frame(document, frame, options.compile())
@@ -1,10 +1,9 @@
-from pydantic import validate_call
-from pyld import jsonld
+from pydantic import SkipValidation, validate_call
 
-from yaml_ld.document_loaders.default import DEFAULT_DOCUMENT_LOADER
-from yaml_ld.expand import except_json_ld_errors
+from yaml_ld import fast
 from yaml_ld.models import DEFAULT_VALIDATE_CALL_CONFIG, JsonLdRecord
 from yaml_ld.options import BaseOptions
+from yaml_ld.rdf import RDFInput
 
 
 class FromRDFOptions(BaseOptions):   # type: ignore
@@ -25,12 +24,14 @@ DEFAULT_FROM_RDF_OPTIONS = FromRDFOptions()
 
 @validate_call(config=DEFAULT_VALIDATE_CALL_CONFIG)
 def from_rdf(
-    dataset: str,
+    dataset: SkipValidation[RDFInput],
     options: FromRDFOptions = DEFAULT_FROM_RDF_OPTIONS,
 ) -> JsonLdRecord:
-    """Convert a RDF dataset to a [＊-LD](/blog/any-ld/) document."""
-    dict_options = options.model_dump(by_alias=True, exclude_none=True)
-    dict_options.setdefault('documentLoader', DEFAULT_DOCUMENT_LOADER)
-
-    with except_json_ld_errors():
-        return jsonld.from_rdf(dataset, dict_options)
+    """
+    Convert a RDF dataset to a [＊-LD](/blog/any-ld/) document.
+
+    The dataset is given as N-Quads text, as a dataset `to_rdf()` returns, as
+    an iterable of quads `iter_to_rdf()` yields, or as an `rdflib` graph or
+    dataset. Only text is parsed; the rest is converted as it is.
+    """
+    return fast.from_rdf(dataset, options.compile())
@@ -0,0 +1,158 @@
+import contextlib
+from pathlib import Path
+from typing import IO, Generator, Iterator
+
+from pydantic import SkipValidation, validate_call
+from yarl import URL
+
+from yaml_ld import fast
+from yaml_ld.document_loaders import content_types
+from yaml_ld.document_parsers.json_parser import JSONDocumentParser
+from yaml_ld.document_parsers.yaml_parser import YAMLDocumentParser
+from yaml_ld.errors import NotFound
+from yaml_ld.expand import DEFAULT_EXPAND_OPTIONS, ExpandOptions
+from yaml_ld.models import (
+    DEFAULT_VALIDATE_CALL_CONFIG,
+    URI,
+    JsonLdRecord,
+)
+from yaml_ld.options import BaseOptions, CompiledOptions
+
+YAMLSource = URI | IO[bytes] | IO[str]
+"""Location of a YAML-LD or JSON-LD stream, or the stream itself."""
+
+StreamParser = YAMLDocumentParser | JSONDocumentParser
+
+
+def local_path(source: URI) -> Path | None:
+    """Find the path of a local file, if the source is one."""
+    match source:
+        case Path():
+            return source
+
+        case URL() | str():
+            url = URL(str(source))
+            if url.scheme in {'', 'file'}:
+                return Path(url.path)
+
+    return None
+
+
+def content_type_by_name(source: YAMLSource) -> str | None:
+    """Determine content type of a file, or of a stream, by its name."""
+    file_name = source if isinstance(source, URI) else getattr(
+        source,
+        'name',
+        '',
+    )
+    return content_types.by_extension(Path(str(file_name)).suffix)
+
+
+def _stream_parser(source: YAMLSource) -> StreamParser | None:
+    """Choose a parser by file name; None if the file is not YAML or JSON."""
+    content_type = content_type_by_name(source)
+    if content_type in {'application/json', content_types.APPLICATION_LD_JSON}:
+        return JSONDocumentParser()
+
+    if content_type in {None, 'application/yaml', 'application/ld+yaml'}:
+        return YAMLDocumentParser()
+
+    return None
+
+
+def is_loaded_in_full(source: YAMLSource) -> bool:
+    """
+    Tell whether a source is loaded by the document loader in one go.
+
+    Such are remote documents and local files neither in YAML nor in JSON.
+    """
+    return isinstance(source, URI) and (
+        local_path(source) is None or _stream_parser(source) is None
+    )
+
+
+@contextlib.contextmanager
+def open_local_file(path: Path) -> Iterator[IO[bytes]]:
+    """Open a local file to read it as a stream."""
+    try:
+        data_stream = path.open(mode='rb')
+    except FileNotFoundError as file_not_found:
+        raise NotFound(path) from file_not_found
+
+    with data_stream:
+        yield data_stream
+
+
+Documents = Generator[JsonLdRecord | list[JsonLdRecord], None, bool]
+"""Documents of a source; returns whether they are items of a list."""
+
+
+def _iter_loaded_documents(source: URI, options: BaseOptions) -> Documents:
+    """Load a document in one go, and iterate over its parts."""
+    remote_document = fast.load_document(
+        source,
+        CompiledOptions({**options.pyld_options(), 'extractAllScripts': True}),
+    )
+    yaml_documents = remote_document['document']
+    if isinstance(yaml_documents, dict):
+        yield yaml_documents
+        return False
+
+    yield from yaml_documents
+    return True
+
+
+def iter_documents(source: YAMLSource, options: BaseOptions) -> Documents:
+    """
+    Read YAML or JSON documents from a stream one at a time.
+
+    A remote document, or a local file in another format, such as HTML, is
+    loaded in full by the document loader.
+
+    Returns whether the documents are items of a list, as those of a YAML
+    stream or of a JSON root array are, rather than the root of the source.
+    """
+    if is_loaded_in_full(source):
+        return (yield from _iter_loaded_documents(source, options))
+
+    parser = _stream_parser(source) or YAMLDocumentParser()
+    if not isinstance(source, URI):
+        # A stream cannot be given to the document loader, read it as YAML.
+        return (
+            yield from parser.iter_documents(
+                source,
+                source=str(options.base or ''),
+            )
+        )
+
+    with open_local_file(local_path(source)) as data_stream:   # type: ignore
+        return (
+            yield from parser.iter_documents(data_stream, source=str(source))
+        )
+
+
+def with_base(options: BaseOptions, source: YAMLSource) -> BaseOptions:
+    """Resolve documents from a stream against its location by default."""
+    if options.base is not None or not isinstance(source, URI):
+        return options
+
+    return options.model_copy(update={'base': str(source)})
+
+
+@validate_call(config=DEFAULT_VALIDATE_CALL_CONFIG)
+def iter_expand(
+    source: SkipValidation[YAMLSource],
+    options: ExpandOptions = DEFAULT_EXPAND_OPTIONS,
+) -> Iterator[JsonLdRecord]:
+    """
+    Expand a multi-document YAML-LD stream, one document at a time.
+
+    Yields expanded nodes of each document as soon as that document is read,
+    so memory use is bounded by the largest document rather than the stream.
+    If the root of a document is a sequence, each of its items is read and
+    expanded on its own. A `.json` or `.jsonld` file is read as JSON-LD, one
+    item of its root array at a time.
+    """
+    compiled_options = with_base(options, source).compile()
+    for document in iter_documents(source, options):
+        yield from fast.expand(document, compiled_options)
@@ -0,0 +1,164 @@
+from typing import Generator, Iterator, TypeVar
+
+from pydantic import SkipValidation, validate_call
+from pyld import jsonld
+
+from yaml_ld import fast
+from yaml_ld.document_loaders import content_types
+from yaml_ld.document_parsers.nquads_parser import NQuadsParser
+from yaml_ld.errors import except_json_ld_errors
+from yaml_ld.iter_expand import (
+    YAMLSource,
+    content_type_by_name,
+    is_loaded_in_full,
+    iter_documents,
+    local_path,
+    open_local_file,
+    with_base,
+)
+from yaml_ld.models import DEFAULT_VALIDATE_CALL_CONFIG, URI
+from yaml_ld.rdf import Quad, iter_quads
+from yaml_ld.to_rdf import DEFAULT_TO_RDF_OPTIONS, ToRDFOptions
+
+DocumentType = TypeVar('DocumentType')
+
+
+@validate_call(config=DEFAULT_VALIDATE_CALL_CONFIG)
+def iter_to_rdf(
+    source: SkipValidation[YAMLSource],
+    options: ToRDFOptions = DEFAULT_TO_RDF_OPTIONS,
+) -> Iterator[Quad]:
+    """
+    Convert a multi-document YAML-LD stream to RDF, one document at a time.
+
+    Yields quads of each document as soon as that document is read; items of
+    a root sequence are converted one at a time. Blank node labels are shared
+    by the whole stream, as if it were one document.
+
+    The quads are those of `to_rdf()`, in another order. A quad is yielded
+    once per document it is found in, rather than once per stream: memory
+    use stays bounded by the largest document. As in `to_rdf()`, a document
+    of a list, such as a YAML stream, with nothing but `@graph` in it puts
+    its nodes into a blank node named graph.
+
+    A local `.nt` or `.nq` file, or a stream with such a name, is read as
+    N-Triples or N-Quads, one line at a time. A remote document, or a local
+    file in another format, such as HTML, is converted by `to_rdf()`.
+    """
+    quads_parser = _quads_parser(source)
+    if quads_parser is not None:
+        yield from _iter_parsed_quads(source, quads_parser)
+        return
+
+    if is_loaded_in_full(source):
+        # It is in memory anyway, and the loader might find its base in it.
+        dataset_options = options.model_copy(
+            update={'format': None, 'encoded': False},
+        )
+        yield from iter_quads(
+            fast.to_rdf(source, dataset_options.compile()),   # type: ignore
+        )
+        return
+
+    compiled_options = with_base(options, source).compile()
+    processor = jsonld.JsonLdProcessor()
+    issuer = jsonld.IdentifierIssuer('_:b')
+
+    documents = _with_list_flags(iter_documents(source, options))
+    for document, is_list_item in documents:
+        # `to_rdf()` expands all documents of a list at once, which does not
+        # unwrap `@graph` of any of them.
+        expanded = fast.expand(
+            [document] if is_list_item else document,
+            compiled_options,
+        )
+        dict_options = compiled_options.copy()
+
+        with except_json_ld_errors():
+            node_map: dict[str, dict] = {'@default': {}}
+            processor._create_node_map(   # noqa: WPS437
+                expanded,
+                node_map,
+                '@default',
+                issuer,
+            )
+
+            yield from _node_map_to_quads(
+                processor=processor,
+                node_map=node_map,
+                issuer=issuer,
+                options=dict_options,
+            )
+
+
+def _with_list_flags(
+    documents: Generator[DocumentType, None, bool],
+) -> Iterator[tuple[DocumentType, bool]]:
+    """
+    Tell whether each document is an item of a list.
+
+    Only the end of a source tells whether its only document is the root of
+    it, so this reads one document ahead.
+    """
+    try:
+        first_document = next(documents)
+    except StopIteration:
+        return
+
+    try:
+        second_document = next(documents)
+    except StopIteration as stop:
+        yield first_document, stop.value
+        return
+
+    yield first_document, True
+    yield second_document, True
+    for document in documents:
+        yield document, True
+
+
+def _node_map_to_quads(
+    processor: jsonld.JsonLdProcessor,
+    node_map: dict[str, dict],
+    issuer: jsonld.IdentifierIssuer,
+    options: dict,
+) -> Iterator[Quad]:
+    for graph_name, graph in sorted(node_map.items()):
+        # Skip relative IRIs, as `pyld` does.
+        is_absolute = jsonld._is_absolute_iri(graph_name)   # noqa: WPS437
+        if graph_name != '@default' and not is_absolute:
+            continue
+
+        triples = processor._graph_to_rdf(   # noqa: WPS437
+            graph,
+            issuer,
+            options,
+        )
+        for triple in triples:
+            yield Quad(**triple, graph=graph_name)
+
+
+def _quads_parser(source: YAMLSource) -> NQuadsParser | None:
+    """Choose a line-oriented RDF parser, if the source can be streamed."""
+    if isinstance(source, URI) and local_path(source) is None:
+        return None
+
+    parser = content_types.parser_by_content_type_map().get(
+        content_type_by_name(source),
+    )
+    if parser is not None and issubclass(parser, NQuadsParser):
+        return parser()
+
+    return None
+
+
+def _iter_parsed_quads(
+    source: YAMLSource,
+    parser: NQuadsParser,
+) -> Iterator[Quad]:
+    if not isinstance(source, URI):
+        yield from parser.iter_quads(source, source=getattr(source, 'name', ''))
+        return
+
+    with open_local_file(local_path(source)) as data_stream:   # type: ignore
+        yield from parser.iter_quads(data_stream, source=str(source))
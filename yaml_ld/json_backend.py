@@ -0,0 +1,238 @@
+import contextlib
+import io
+import json
+import os
+import re
+import string
+from enum import StrEnum
+from typing import IO, Callable, Generator, Iterator
+
+try:
+    import orjson
+except ImportError:   # pragma: no cover
+    orjson = None   # type: ignore
+
+try:
+    import msgspec
+except ImportError:   # pragma: no cover
+    msgspec = None   # type: ignore
+
+
+class JSONBackend(StrEnum):
+    """Implementation of JSON decoder."""
+
+    ORJSON = 'orjson'
+    """`orjson`, if installed."""
+
+    MSGSPEC = 'msgspec'
+    """`msgspec`, if installed."""
+
+    STDLIB = 'json'
+    """`json` module of the standard library."""
+
+
+JSON_BACKEND_VARIABLE = 'YAML_LD_JSON_BACKEND'
+"""Environment variable to choose the JSON backend by default."""
+
+Decoder = tuple[Callable[[bytes | memoryview], object], type[Exception]]
+
+_fast_decoders: dict[JSONBackend, Decoder] = {}
+if orjson is not None:
+    _fast_decoders[JSONBackend.ORJSON] = orjson.loads, orjson.JSONDecodeError
+
+if msgspec is not None:
+    _fast_decoders[JSONBackend.MSGSPEC] = (
+        msgspec.json.decode,
+        msgspec.DecodeError,
+    )
+
+LONG_INTEGER_DIGITS = 19
+"""Fast decoders turn integers this long into floats, `json` does not."""
+
+SCAN_CHUNK_SIZE = 1024 * 1024
+"""How many bytes to scan for long integers at once."""
+
+# Map every digit to `0` and everything else to a space.
+_DIGITS_TABLE = bytes(
+    ord('0') if chr(code) in string.digits else ord(' ')
+    for code in range(256)
+)
+_LONG_INTEGER = b'0' * LONG_INTEGER_DIGITS
+
+
+def choose_json_backend(
+    backend: JSONBackend | str | None = None,
+) -> JSONBackend:
+    """
+    Choose the JSON backend to use.
+
+    Unless specified, it is taken from `YAML_LD_JSON_BACKEND` environment
+    variable, and defaults to the first installed of `orjson` and `msgspec`.
+    If the chosen library is not installed, that falls back to `json`.
+    """
+    if backend is None:
+        backend = os.environ.get(JSON_BACKEND_VARIABLE)
+
+    if backend is None:
+        return next(iter(_fast_decoders), JSONBackend.STDLIB)
+
+    backend = JSONBackend(backend)
+    if backend in _fast_decoders:
+        return backend
+
+    return JSONBackend.STDLIB
+
+
+def has_long_integer(content: bytes | memoryview) -> bool:
+    """Check if a JSON document might contain a long integer."""
+    overlap = LONG_INTEGER_DIGITS - 1
+    with memoryview(content) as view:
+        for start in range(0, len(view), SCAN_CHUNK_SIZE):
+            chunk = view[start:start + SCAN_CHUNK_SIZE + overlap].tobytes()
+            if _LONG_INTEGER in chunk.translate(_DIGITS_TABLE):
+                return True
+
+    return False
+
+
+def loads(
+    content: str | bytes | memoryview,
+    backend: JSONBackend = JSONBackend.STDLIB,
+) -> object:
+    """
+    Decode a JSON document, given as text or as UTF-8 encoded bytes.
+
+    A fast backend parses bytes without decoding them to `str` first. If it
+    rejects the document, or the document contains long integers, `json`
+    decodes it instead: results and errors are the same as with `json`. Text
+    is always decoded by `json`, which needs no conversion for it.
+    """
+    if isinstance(content, str):
+        return json.loads(content)
+
+    fast_decoder = _fast_decoders.get(backend)
+    if fast_decoder is not None and not has_long_integer(content):
+        decode, decode_error = fast_decoder
+        with contextlib.suppress(decode_error):
+            return decode(content)
+
+    return json.loads(str(content, 'utf-8'))
+
+
+READ_CHUNK_SIZE = 64 * 1024
+"""How many characters to read at once when loading items of an array."""
+
+_WHITESPACE = re.compile('[ \t\n\r]*')
+_decoder = json.JSONDecoder()
+
+
+class _TextBuffer:
+    """Text read from a stream, but not decoded yet."""
+
+    def __init__(self, text_stream: IO[str]) -> None:
+        self.text_stream = text_stream
+        self.text = ''
+        self.position = 0
+
+    def next_character(self) -> str:
+        """Skip whitespace, and peek at the next character, if any."""
+        while True:   # noqa: WPS457
+            whitespace = _WHITESPACE.match(self.text, self.position)
+            self.position = whitespace.end()   # type: ignore
+            if self.position < len(self.text):
+                return self.text[self.position]
+
+            if not self.read_more(READ_CHUNK_SIZE):
+                return ''
+
+    def read_more(self, size: int) -> bool:
+        """Read more text, dropping what has been decoded already."""
+        chunk = self.text_stream.read(size)
+        self.text = self.text[self.position:] + chunk
+        self.position = 0
+        return bool(chunk)
+
+    def rest(self) -> str:
+        """Read the rest of the stream."""
+        return self.text[self.position:] + self.text_stream.read()
+
+    def decode_value(self) -> object:
+        """Decode the next value, reading as much text as it takes."""
+        size = READ_CHUNK_SIZE
+        while True:   # noqa: WPS457
+            try:
+                value, end = _decoder.raw_decode(self.text, self.position)
+            except json.JSONDecodeError as decode_error:
+                error: json.JSONDecodeError | None = decode_error
+            else:
+                error = None
+                # A number might continue in the text not read yet.
+                if end < len(self.text):
+                    self.position = end
+                    return value
+
+            if not self.read_more(size):
+                if error is not None:
+                    raise error
+
+                self.position = end
+                return value
+
+            # Do not decode a large value from scratch too many times.
+            size *= 2
+
+    def expect_end(self) -> None:
+        """Reject anything but whitespace after the document."""
+        if self.next_character():
+            raise json.JSONDecodeError('Extra data', self.text, self.position)
+
+
+def _load_root_array_items(text_buffer: _TextBuffer) -> Iterator[object]:
+    text_buffer.position += 1
+    if text_buffer.next_character() == ']':
+        text_buffer.position += 1
+        return
+
+    while True:   # noqa: WPS457
+        item = text_buffer.decode_value()
+
+        # Expansion drops free-floating scalar values anyway.
+        if isinstance(item, (dict, list)):
+            yield item
+
+        delimiter = text_buffer.next_character()
+        if delimiter == ']':
+            text_buffer.position += 1
+            return
+
+        if delimiter != ',':
+            raise json.JSONDecodeError(
+                "Expecting ',' delimiter",
+                text_buffer.text,
+                text_buffer.position,
+            )
+
+        text_buffer.position += 1
+        text_buffer.next_character()
+
+
+def load_items(text_stream: IO[str] | str) -> Generator[object, None, bool]:
+    """
+    Load a JSON document from a stream, one root array item at a time.
+
+    If the root of the document is an array, each of its items, except
+    scalars, is yielded as soon as it is read, and memory use is bounded by
+    the largest item. Other documents are yielded as they are. Returns
+    whether the root of the document is an array.
+    """
+    if isinstance(text_stream, str):
+        text_stream = io.StringIO(text_stream)
+
+    text_buffer = _TextBuffer(text_stream)
+    if text_buffer.next_character() != '[':
+        yield json.loads(text_buffer.rest())
+        return False
+
+    yield from _load_root_array_items(text_buffer)
+    text_buffer.expect_end()
+    return True
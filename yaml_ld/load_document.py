@@ -1,15 +1,15 @@
 from pydantic import validate_call
-from pyld import jsonld
 
-from yaml_ld.document_loaders.content_types import (
-    DEFAULT_USER_AGENT,
-    construct_accept_header,
-)
-from yaml_ld.document_loaders.default import DEFAULT_DOCUMENT_LOADER
+from yaml_ld import fast
 from yaml_ld.models import DEFAULT_VALIDATE_CALL_CONFIG, RemoteDocument
-from yaml_ld.options import BaseOptions
+from yaml_ld.options import BaseOptions, ParserOptions
 
-DEFAULT_BASE_OPTIONS = BaseOptions()
+
+class LoadDocumentOptions(BaseOptions, ParserOptions):   # type: ignore
+    """Options to load a document."""
+
+
+DEFAULT_LOAD_DOCUMENT_OPTIONS = LoadDocumentOptions()
 
 
 @validate_call(config=DEFAULT_VALIDATE_CALL_CONFIG)
@@ -18,30 +18,16 @@ def load_document(
     base=None,
     profile=None,
     requestProfile=None,
-    options: BaseOptions = DEFAULT_BASE_OPTIONS,
+    options: BaseOptions = DEFAULT_LOAD_DOCUMENT_OPTIONS,
 ) -> RemoteDocument:
     """
     Load an [＊-LD](blog/any-ld/) document.
 
     The document can be retrieved from local filesystem or from the Web.
     """
-    headers = {
-        'Accept': construct_accept_header(url),
-        'User-Agent': DEFAULT_USER_AGENT,
-    }
-
-    if requestProfile:
-        headers['Accept'] = (
-            f'application/ld+json;profile={requestProfile}, '
-        ) + headers['Accept']
-
-    dict_options = options.model_dump(by_alias=True, exclude_none=True)
-    dict_options.setdefault('documentLoader', DEFAULT_DOCUMENT_LOADER)
-    dict_options.setdefault('headers', headers)
-
-    return jsonld.load_document(
-        url=str(url),
-        options=dict_options,
+    return fast.load_document(
+        url,
+        options.compile(),
         base=base,
         profile=profile,
         requestProfile=requestProfile,
@@ -1,7 +1,61 @@
-from typing import Iterator
+import functools
+import os
+from enum import StrEnum
+from typing import Iterator, Pattern
 
 from ruamel.yaml import YAML
+from ruamel.yaml.composer import Composer
 from ruamel.yaml.constructor import SafeConstructor
+from ruamel.yaml.events import (
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+)
+from ruamel.yaml.main import CParser
+from ruamel.yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
+from ruamel.yaml.resolver import VersionedResolver, implicit_resolvers
+from ruamel.yaml.tag import Tag
+
+from yaml_ld.errors import CycleDetected, UnknownYAMLBackend
+
+
+def ensure_acyclic(root: Node) -> None:
+    """
+    Make sure aliases do not make a node contain itself.
+
+    Each node is visited once, however many aliases refer to it, so this takes
+    linear time.
+    """
+    active: set[int] = set()
+    finished: set[int] = set()
+    stack: list[tuple[Node, bool]] = [(root, False)]
+
+    while stack:
+        node, is_exiting = stack.pop()
+        if isinstance(node, ScalarNode):
+            continue
+
+        node_id = id(node)
+        if is_exiting:
+            active.remove(node_id)
+            finished.add(node_id)
+            continue
+
+        if node_id in active:
+            raise CycleDetected()
+
+        if node_id in finished:
+            continue
+
+        active.add(node_id)
+        stack.append((node, True))
+
+        if isinstance(node, MappingNode):
+            for key_node, value_node in node.value:
+                stack.append((key_node, False))
+                stack.append((value_node, False))
+        else:
+            stack.extend((child_node, False) for child_node in node.value)
 
 
 class _CoreSchemaConstructor(SafeConstructor):
@@ -9,18 +63,235 @@ class _CoreSchemaConstructor(SafeConstructor):
 
     The Core Schema (YAML 1.2.2 §10.3) does not include timestamp recognition.
     Date-like strings such as 2024-01-15 must remain plain strings.
+
+    An alias cycle is rejected before construction. Aliases of an acyclic
+    node share the constructed object.
     """
 
+    def construct_document(self, node: Node):
+        """Construct a document, unless it contains itself."""
+        ensure_acyclic(node)
+        return super().construct_document(node)
+
 
 _CoreSchemaConstructor.add_constructor(
     'tag:yaml.org,2002:timestamp',
     SafeConstructor.construct_yaml_str,
 )
 
-_safe_yaml = YAML(typ='safe')
-_safe_yaml.Constructor = _CoreSchemaConstructor
+
+CORE_SCHEMA_VERSION = (1, 2)
+TIMESTAMP_TAG = 'tag:yaml.org,2002:timestamp'
+
+ScalarResolvers = dict[str, list[tuple[Tag, Pattern[str]]]]
+
+
+def _core_schema_scalar_resolvers() -> ScalarResolvers:
+    """Build YAML 1.2 implicit resolvers, by the first character of a value."""
+    scalar_resolvers: ScalarResolvers = {}
+    for versions, tag, regexp, first_characters in implicit_resolvers:
+        if CORE_SCHEMA_VERSION not in versions or tag == TIMESTAMP_TAG:
+            continue
+
+        for first_character in first_characters:
+            scalar_resolvers.setdefault(first_character, []).append(
+                (Tag(suffix=tag), regexp),
+            )
+
+    return scalar_resolvers
+
+
+class _CoreSchemaResolver(VersionedResolver):
+    """
+    Resolve plain scalars by YAML 1.2 Core Schema.
+
+    Patterns are looked up by the first character of a value, and a plain
+    scalar starting with any other character, such as an IRI, is a string
+    right away. Timestamps are not matched at all.
+    """
+
+    scalar_resolvers = _core_schema_scalar_resolvers()
+
+    def resolve(self, kind, value, implicit):   # noqa: WPS110
+        """Determine the tag of a node."""
+        if kind is not ScalarNode or not implicit[0] or self._is_versioned():
+            return super().resolve(kind, value, implicit)
+
+        first_character = value[:1]
+        for tag, regexp in self.scalar_resolvers.get(first_character, ()):
+            if regexp.match(value):
+                return tag
+
+        return self.DEFAULT_SCALAR_TAG
+
+    def _is_versioned(self) -> bool:
+        """Does a `%YAML` directive request other version than 1.2?"""
+        scanner = getattr(self.loadumper, '_scanner', None)
+        yaml_version = getattr(scanner, 'yaml_version', None)
+        return yaml_version not in {None, CORE_SCHEMA_VERSION}
+
+
+class YAMLBackend(StrEnum):
+    """Implementation of YAML scanner and parser."""
+
+    LIBYAML = 'libyaml'
+    """C implementation, if `ruamel.yaml.clib` is installed."""
+
+    PURE = 'pure'
+    """Pure Python implementation."""
+
+
+YAML_BACKEND_VARIABLE = 'YAML_LD_YAML_BACKEND'
+"""Environment variable to choose the YAML backend by default."""
+
+
+def _core_schema_yaml(pure: bool) -> YAML:
+    core_schema_yaml = YAML(typ='safe', pure=pure)
+    core_schema_yaml.Constructor = _CoreSchemaConstructor
+    core_schema_yaml.Resolver = _CoreSchemaResolver
+    return core_schema_yaml
 
 
-def load_all(stream: str | object) -> Iterator[object]:
-    """Load all YAML documents from stream. YAML 1.2.2 compliant."""
+_safe_yaml = _core_schema_yaml(pure=True)
+_libyaml = None if CParser is None else _core_schema_yaml(pure=False)
+
+
+def choose_backend(backend: YAMLBackend | str | None = None) -> YAMLBackend:
+    """
+    Choose the YAML backend to use.
+
+    Unless specified, it is taken from `YAML_LD_YAML_BACKEND` environment
+    variable, and defaults to `libyaml`. Without `ruamel.yaml.clib`, that
+    falls back to `pure`. An unknown backend raises `UnknownYAMLBackend`.
+    """
+    if backend is None:
+        backend = os.environ.get(YAML_BACKEND_VARIABLE, YAMLBackend.LIBYAML)
+
+    yaml_backend = _backend_by_name(backend)
+    if _libyaml is None:
+        return YAMLBackend.PURE
+
+    return yaml_backend
+
+
+@functools.cache
+def _backend_by_name(backend: str) -> YAMLBackend:
+    """Validate a backend name once, rather than on every load."""
+    try:
+        return YAMLBackend(backend)
+    except ValueError as value_error:
+        raise UnknownYAMLBackend(
+            backend=backend,
+            choices=list(YAMLBackend),
+        ) from value_error
+
+
+def load_all(
+    stream: str | object,
+    backend: YAMLBackend = YAMLBackend.PURE,
+) -> Iterator[object]:
+    """
+    Load all YAML documents from stream. YAML 1.2.2 compliant.
+
+    `libyaml` backend, if available, is faster, but it implements YAML 1.1
+    scanner: it rejects some valid documents (for instance, an IRI in a flow
+    collection) and disregards `%YAML` directives. `YAMLDocumentParser` leaves
+    such documents to the pure Python backend.
+    """
+    if backend == YAMLBackend.LIBYAML and _libyaml is not None:
+        return _libyaml.load_all(stream)
+
     return _safe_yaml.load_all(stream)
+
+
+class _ItemComposer(Composer):
+    """Compose items of a root sequence while that sequence is still open."""
+
+    root: SequenceNode | None = None
+
+    def return_alias(self, anchored_node):
+        """Refuse to embed the root sequence into its own item."""
+        if anchored_node is self.root:
+            raise CycleDetected()
+
+        return anchored_node
+
+
+def _item_yaml() -> YAML:
+    item_yaml = _core_schema_yaml(pure=True)
+    item_yaml.Composer = _ItemComposer
+    return item_yaml
+
+
+def _load_root_sequence_items(
+    composer: _ItemComposer,
+    constructor: _CoreSchemaConstructor,
+) -> Iterator[object]:
+    parser = composer.parser
+    start_event = parser.get_event()
+    composer.root = SequenceNode(
+        'tag:yaml.org,2002:seq',
+        [],
+        start_event.start_mark,
+        None,
+        anchor=start_event.anchor,
+    )
+    if start_event.anchor is not None:
+        composer.anchors[start_event.anchor] = composer.root
+
+    # Anchors of previous items, and objects constructed for them, are kept,
+    # so that an alias to one of them resolves to the same object.
+    anchored_objects: dict[Node, object] = {}
+    index = 0
+    while not parser.check_event(SequenceEndEvent):
+        item_node = composer.compose_node(composer.root, index)
+        index += 1
+
+        # Expansion drops free-floating scalar values anyway.
+        if isinstance(item_node, ScalarNode):
+            continue
+
+        constructor.constructed_objects = anchored_objects
+        yield constructor.construct_document(item_node)
+        anchored_objects = {
+            node: constructed_object
+            for node, constructed_object in anchored_objects.items()
+            if node.anchor is not None
+        }
+
+    parser.get_event()
+
+
+def load_items(stream: str | object) -> Iterator[object]:
+    """
+    Load all YAML documents from stream, one root sequence item at a time.
+
+    A document whose root node is a sequence is not composed as a whole: each
+    of its items, except scalars, is yielded as soon as it is read. Other
+    documents are yielded as they are.
+    """
+    item_yaml = _item_yaml()
+    constructor, parser = item_yaml.get_constructor_parser(stream)
+    composer = item_yaml.composer
+
+    try:
+        # Drop the STREAM-START event.
+        parser.get_event()
+
+        while not parser.check_event(StreamEndEvent):
+            composer.anchors = {}
+
+            # Drop the DOCUMENT-START event.
+            parser.get_event()
+
+            if parser.check_event(SequenceStartEvent):
+                yield from _load_root_sequence_items(composer, constructor)
+            else:
+                yield constructor.construct_document(
+                    composer.compose_node(None, None),
+                )
+
+            # Drop the DOCUMENT-END event.
+            parser.get_event()
+    finally:
+        parser.dispose()
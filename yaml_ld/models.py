@@ -1,7 +1,7 @@
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Annotated, Any, Mapping, Sequence
 
-from pydantic import ConfigDict
+from pydantic import ConfigDict, PlainValidator
 from typing_extensions import TypedDict
 from yarl import URL
 
@@ -26,12 +26,37 @@ Or, it can be a `str`, and we will try to automatically identify what that is.
 """
 
 
-JsonLdInput = (
-    JsonLdRecord | Sequence[JsonLdRecord] | URI
-)
+def _pass_by_reference(input_: Any) -> Any:   # type: ignore
+    """
+    Check only the top-level type of a document.
+
+    Validating the whole structure would traverse and copy it, which for a big
+    document costs more than processing it.
+    """
+    if isinstance(input_, (dict, str, URL, Path)):
+        return input_
+
+    if isinstance(input_, Mapping):
+        return dict(input_)
+
+    if isinstance(input_, Sequence) and not isinstance(input_, bytes):
+        return input_
+
+    raise ValueError(
+        f'Expected a document, a list of documents, or a URI; '
+        f'got {type(input_).__name__}.',
+    )
+
+
+JsonLdInput = Annotated[
+    JsonLdRecord | Sequence[JsonLdRecord] | URI,
+    PlainValidator(_pass_by_reference),
+]
 """
 Input for `expand()`, `compact()` and other functions.
 
+Only the top-level type is validated; the document is passed on by reference.
+
 [Specification](https://w3c.github.io/json-ld-api/#dom-jsonldrecord)
 """
 
@@ -49,6 +74,80 @@ DEFAULT_VALIDATE_CALL_CONFIG = ConfigDict(
     validate_default=False,
 )
 
+DEFAULT_PROCESSING_MODE = 'json-ld-1.1'
+"""Processing mode `pyld` assumes unless told otherwise."""
+
+
+class CompiledContext:   # noqa: WPS214
+    """
+    A context processed ahead of time into an active context.
+
+    Construct it with `yaml_ld.compile_context()`. It is immutable, hashable
+    (by identity), and carries the inverse context used for compaction. It
+    holds for the base & processing mode it was compiled with only.
+    """
+
+    __slots__ = (
+        'document',
+        'base',
+        'processing_mode',
+        'active_context',
+        'inverse_context',
+    )
+
+    document: JsonLdContext
+    base: str
+    processing_mode: str
+    active_context: JsonLdRecord
+    inverse_context: JsonLdRecord
+
+    def __init__(   # noqa: WPS211
+        self,
+        document: JsonLdContext,
+        base: str,
+        processing_mode: str,
+        active_context: JsonLdRecord,
+        inverse_context: JsonLdRecord,
+    ) -> None:
+        object.__setattr__(self, 'document', document)
+        object.__setattr__(self, 'base', base)
+        object.__setattr__(self, 'processing_mode', processing_mode)
+        object.__setattr__(self, 'active_context', active_context)
+        object.__setattr__(self, 'inverse_context', inverse_context)
+
+    def __setattr__(self, name: str, attribute_value) -> None:
+        """Forbid modification."""
+        raise AttributeError(f'{type(self).__name__} is immutable.')
+
+    def __delattr__(self, name: str) -> None:
+        """Forbid modification."""
+        raise AttributeError(f'{type(self).__name__} is immutable.')
+
+    def __reduce__(self):
+        """Pickle, to pass compiled contexts between processes."""
+        return type(self), (
+            self.document,
+            self.base,
+            self.processing_mode,
+            self.active_context,
+            self.inverse_context,
+        )
+
+    def __repr__(self) -> str:
+        """Show the source of the context."""
+        return (
+            f'CompiledContext(document={self.document!r}, base={self.base!r})'
+        )
+
+    def is_compiled_for(self, options: Mapping[str, Any]) -> bool:
+        """Was the context compiled with the base & mode of these options?"""
+        return (
+            str(options.get('base') or '') == self.base
+            and options.get('processingMode', DEFAULT_PROCESSING_MODE) == (
+                self.processing_mode
+            )
+        )
+
 
 class Undefined:
     """Undefined."""
@@ -0,0 +1,42 @@
+from typing import IO, Iterable
+
+from pyld import jsonld
+
+from yaml_ld.rdf import Quad
+
+WRITE_BATCH_SIZE = 4096
+"""How many N-Quads lines to collect before writing them at once."""
+
+
+def to_nquad(quad: Quad) -> str:
+    """Serialize a quad as a line of N-Quads."""
+    graph_name = quad['graph']
+    return jsonld.JsonLdProcessor.to_nquad(
+        quad,
+        None if graph_name == '@default' else graph_name,
+    )
+
+
+def write_nquads(
+    quads: Iterable[Quad],
+    text_stream: IO[str],
+    batch_size: int = WRITE_BATCH_SIZE,
+) -> int:
+    """
+    Write quads to a stream as N-Quads, as soon as they are produced.
+
+    Lines are written in batches, which is much cheaper than a write per line
+    and keeps memory use bounded by the batch, whatever the size of output.
+    Unlike `to_rdf()`, lines are not sorted. Returns the number of quads.
+    """
+    batch: list[str] = []
+    count = 0
+    for quad in quads:
+        batch.append(to_nquad(quad))
+        if len(batch) >= batch_size:
+            text_stream.write(''.join(batch))
+            count += len(batch)
+            batch.clear()
+
+    text_stream.write(''.join(batch))
+    return count + len(batch)
@@ -1,8 +1,20 @@
-from typing import Annotated, Any
-
-from pydantic import BaseModel, ConfigDict, alias_generators
-
-from yaml_ld.models import URI, JsonLdRecord
+from typing import Annotated, Any, Iterator, Mapping
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    alias_generators,
+    field_serializer,
+)
+
+from yaml_ld.context_cache import context_resolver
+from yaml_ld.document_loaders.content_types import (
+    DEFAULT_ACCEPT_HEADER,
+    DEFAULT_USER_AGENT,
+)
+from yaml_ld.json_backend import JSONBackend
+from yaml_ld.loader import YAMLBackend
+from yaml_ld.models import URI, CompiledContext, JsonLdRecord
 
 ExtractAllScripts = Annotated[
     bool,
@@ -23,11 +35,32 @@ class ExtractAllScriptsOptions(BaseModel):    # type: ignore
 class ExpandContextOptions(BaseModel):    # type: ignore
     """Options flag to extract all scripts or not."""
 
-    expand_context: JsonLdRecord | URI | None = None
-    """A context to expand with."""
+    expand_context: JsonLdRecord | URI | CompiledContext | None = None
+    """A context to expand with; see `yaml_ld.compile_context()`."""
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    @field_serializer('expand_context', mode='wrap')
+    def _keep_compiled_context(self, expand_context, serialize):
+        """Hand a compiled context over to `pyld` as it is."""
+        if isinstance(expand_context, CompiledContext):
+            return expand_context
+
+        return serialize(expand_context)
+
+
+class ParserOptions(BaseModel):    # type: ignore
+    """Options to choose how loaded documents are parsed."""
+
+    yaml_backend: YAMLBackend | None = None
+    """YAML parser implementation; see `yaml_ld.loader.choose_backend()`."""
+
+    json_backend: JSONBackend | None = None
+    """JSON parser implementation; see `json_backend.choose_json_backend()`."""
+
+    script_workers: int | None = None
+    """Parse many scripts embedded in HTML in this many worker processes."""
+
 
 def _default_document_loader():
     from yaml_ld.document_loaders.default import (  # noqa: WPS433
@@ -36,6 +69,50 @@ def _default_document_loader():
     return DEFAULT_DOCUMENT_LOADER
 
 
+class CompiledOptions(Mapping[str, Any]):   # type: ignore
+    """
+    Options converted to the form `pyld` expects, to reuse them for many calls.
+
+    Construct with `.compile()` method of an options class, and pass to
+    functions of `yaml_ld.fast`.
+    """
+
+    __slots__ = ('_options',)
+
+    def __init__(self, options: dict[str, Any]) -> None:   # type: ignore
+        self._options = options
+
+    def __getitem__(self, key: str) -> Any:   # type: ignore
+        """Get an option value."""
+        return self._options[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over option names."""
+        return iter(self._options)
+
+    def __len__(self) -> int:
+        """Count options."""
+        return len(self._options)
+
+    def __repr__(self) -> str:
+        """Show the options."""
+        return f'CompiledOptions({self._options!r})'
+
+    def copy(self) -> dict[str, Any]:   # type: ignore
+        """
+        Make a mutable copy of the options for one call.
+
+        `pyld` copies options before using them, and this is where each call
+        gets its own headers and context resolver.
+        """
+        dict_options = dict(self._options)
+        dict_options['headers'] = dict(dict_options['headers'])
+        dict_options['contextResolver'] = context_resolver(
+            dict_options['documentLoader'],
+        )
+        return dict_options
+
+
 class BaseOptions(BaseModel):   # type: ignore
     """Base options shared by all YAML-LD API methods."""
 
@@ -51,3 +128,19 @@ class BaseOptions(BaseModel):   # type: ignore
         arbitrary_types_allowed=True,
         validate_default=False,
     )
+
+    def compile(self) -> CompiledOptions:
+        """Convert the options for `pyld` once, to reuse them for many calls."""
+        return CompiledOptions(self.pyld_options())
+
+    def pyld_options(self) -> dict[str, Any]:   # type: ignore
+        """Convert the options to a dictionary `pyld` expects."""
+        dict_options = self.model_dump(by_alias=True, exclude_none=True)
+        dict_options.setdefault('documentLoader', _default_document_loader())
+        dict_options.setdefault(
+            'headers', {
+                'Accept': DEFAULT_ACCEPT_HEADER,
+                'User-Agent': DEFAULT_USER_AGENT,
+            },
+        )
+        return dict_options
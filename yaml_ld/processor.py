@@ -0,0 +1,38 @@
+from pyld import jsonld
+
+from yaml_ld.models import CompiledContext, JsonLdContext
+
+
+class CompiledContextProcessor(jsonld.JsonLdProcessor):
+    """`pyld` processor which takes compiled contexts as they are."""
+
+    def __init__(
+        self,
+        ctx: JsonLdContext | CompiledContext | None = None,
+    ) -> None:
+        super().__init__()
+        self.compiled = ctx if isinstance(ctx, CompiledContext) else None
+        self.context = self.compiled.document if self.compiled else ctx
+
+    def process_context(self, active_ctx, local_ctx, options):
+        """Skip processing of contexts compiled for the same options."""
+        if isinstance(local_ctx, CompiledContext):
+            if local_ctx.is_compiled_for(options):
+                return local_ctx.active_context
+
+            local_ctx = local_ctx.document
+
+        elif (
+            self.compiled
+            and local_ctx is self.compiled.document
+            and self.compiled.is_compiled_for(options)
+        ):
+            return self.compiled.active_context
+
+        return super().process_context(active_ctx, local_ctx, options)
+
+    def _get_inverse_context(self, active_ctx):
+        if self.compiled and active_ctx is self.compiled.active_context:
+            return self.compiled.inverse_context
+
+        return super()._get_inverse_context(active_ctx)
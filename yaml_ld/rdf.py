@@ -1,6 +1,9 @@
-from typing import Literal
+import sys
+from array import array
+from typing import Iterable, Iterator, Literal, NamedTuple
 
-from typing_extensions import TypedDict
+import rdflib
+from typing_extensions import NotRequired, TypedDict
 
 TermType = Literal['IRI', 'blank node', 'literal']
 
@@ -25,6 +28,7 @@ class LiteralTerm(TypedDict):
     type: Literal['literal']
     value: str   # noqa: WPS110
     datatype: str | None
+    language: NotRequired[str]
 
 
 Term = IRITerm | BlankTerm | LiteralTerm
@@ -40,3 +44,141 @@ class Triple(TypedDict):
 
 Graph = list[Triple]
 Dataset = dict[str, Graph]
+
+
+class Quad(Triple):
+    """RDF Quad: a triple in a named graph, or in `@default` one."""
+
+    graph: str
+
+
+def iter_quads(dataset: Dataset) -> Iterator[Quad]:
+    """Iterate over triples of a dataset as quads, with their graph names."""
+    for graph_name, triples in dataset.items():
+        for triple in triples:
+            yield Quad(**triple, graph=graph_name)
+
+
+class CompactTerm(NamedTuple):
+    """RDF Term as a tuple, which takes a fraction of memory of a dict."""
+
+    type: TermType
+    value: str   # noqa: WPS110
+    datatype: str | None = None
+    language: str | None = None
+
+    @classmethod
+    def from_term(cls, term: Term) -> 'CompactTerm':
+        """Convert a term, interning the strings many terms repeat."""
+        if term['type'] != 'literal':
+            return cls(term['type'], sys.intern(term['value']))
+
+        datatype = term.get('datatype')
+        language = term.get('language')
+        return cls(
+            'literal',
+            term['value'],
+            None if datatype is None else sys.intern(datatype),
+            None if language is None else sys.intern(language),
+        )
+
+    def as_term(self) -> Term:
+        """Convert back to the dict `pyld` works with."""
+        if self.type == 'IRI':
+            return IRITerm(type='IRI', value=self.value)
+
+        if self.type == 'blank node':
+            return BlankTerm(type='blank node', value=self.value)
+
+        literal = LiteralTerm(
+            type='literal',
+            value=self.value,
+            datatype=self.datatype,
+        )
+        if self.language is not None:
+            literal['language'] = self.language
+
+        return literal
+
+
+QUAD_WIDTH = 4
+"""Term ids per quad in `EncodedDataset`: subject, predicate, object, graph."""
+
+
+class EncodedDataset:
+    """
+    RDF Dataset in a term dictionary: each distinct term is stored once.
+
+    Quads are kept as four integer ids of terms in one flat array, so a quad
+    costs 16 bytes on top of the terms it introduces. A dataset in a `Dataset`
+    form takes a dict per triple, and another one per term of it.
+
+    Iterating yields quads as `pyld` expects them; quads share the dicts of
+    their terms, which must therefore not be modified.
+    """
+
+    __slots__ = ('terms', 'quad_ids', '_term_ids')
+
+    def __init__(self, quads: Iterable[Quad] = ()) -> None:
+        """Encode quads, for instance those `iter_to_rdf()` yields."""
+        self.terms: list[CompactTerm] = []
+        self.quad_ids = array('I')
+        self._term_ids: dict[CompactTerm, int] = {}
+        self.extend(quads)
+
+    @classmethod
+    def from_dataset(cls, dataset: Dataset) -> 'EncodedDataset':
+        """Encode a dataset `to_rdf()` returns."""
+        return cls(iter_quads(dataset))
+
+    def term_id(self, term: CompactTerm) -> int:
+        """Find the id of a term, adding the term if it is new."""
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = self._term_ids[term] = len(self.terms)
+            self.terms.append(term)
+
+        return term_id
+
+    def add(self, quad: Quad) -> None:
+        """Add a quad."""
+        graph_name = quad['graph']
+        self.quad_ids.extend((
+            self.term_id(CompactTerm.from_term(quad['subject'])),
+            self.term_id(CompactTerm.from_term(quad['predicate'])),
+            self.term_id(CompactTerm.from_term(quad['object'])),
+            self.term_id(CompactTerm(
+                'blank node' if graph_name.startswith('_:') else 'IRI',
+                sys.intern(graph_name),
+            )),
+        ))
+
+    def extend(self, quads: Iterable[Quad]) -> None:
+        """Add many quads."""
+        for quad in quads:
+            self.add(quad)
+
+    def __len__(self) -> int:
+        """Count quads."""
+        return len(self.quad_ids) // QUAD_WIDTH
+
+    def __iter__(self) -> Iterator[Quad]:
+        """Decode quads, converting each distinct term to a dict only once."""
+        terms = [term.as_term() for term in self.terms]
+        quad_ids = iter(self.quad_ids)
+        for subject, predicate, rdf_object, graph in zip(   # noqa: WPS221
+            quad_ids, quad_ids, quad_ids, quad_ids,
+        ):
+            yield Quad(
+                subject=terms[subject],
+                predicate=terms[predicate],
+                object=terms[rdf_object],
+                graph=terms[graph]['value'],
+            )
+
+
+RDFInput = str | Dataset | Iterable[Quad] | rdflib.Graph
+"""
+RDF to convert: N-Quads, a dataset, quads, an `EncodedDataset`, or an `rdflib`
+graph.
+"""
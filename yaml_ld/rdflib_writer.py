@@ -0,0 +1,124 @@
+from typing import Iterable
+
+from rdflib import BNode, ConjunctiveGraph, Dataset, Graph, Literal, URIRef
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from rdflib.term import Node
+
+from yaml_ld.document_parsers.rdf_parser import RDF_LANG_STRING, XSD_STRING
+from yaml_ld.rdf import Quad, Term
+
+ADD_BATCH_SIZE = 4096
+"""How many quads to collect before adding them to a graph at once."""
+
+
+class RDFLibTerms:
+    """
+    Build `rdflib` terms for quads added to a graph, each distinct one once.
+
+    A blank node label gets a new `BNode`, which is the same for all quads
+    added with this instance: blank nodes of different conversions never
+    merge, as when parsing N-Quads.
+    """
+
+    def __init__(self, graph: Graph) -> None:
+        self.graph = graph
+        self._nodes: dict[tuple, Node] = {}
+        self._contexts: dict[str, Graph | None] = {}
+
+    def node(self, term: Term) -> Node:
+        """Build an `rdflib` term, or find one built already."""
+        key = (
+            term['type'],
+            term['value'],
+            term.get('datatype'),
+            term.get('language'),
+        )
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = self._build(term)
+
+        return node
+
+    def context(self, graph_name: str) -> Graph | None:
+        """Find the graph for a graph name; None if it cannot hold it."""
+        try:
+            return self._contexts[graph_name]
+        except KeyError:
+            context = self._contexts[graph_name] = self._context(graph_name)
+            return context
+
+    def _context(self, graph_name: str) -> Graph | None:
+        if not isinstance(self.graph, ConjunctiveGraph):
+            # `rdflib` itself keeps only the default graph of N-Quads here.
+            return self.graph if graph_name == '@default' else None
+
+        if graph_name == '@default':
+            identifier = (
+                DATASET_DEFAULT_GRAPH_ID
+                if isinstance(self.graph, Dataset)
+                else self.graph.default_context.identifier
+            )
+        else:
+            term_type = 'blank node' if graph_name.startswith('_:') else 'IRI'
+            identifier = self.node(
+                {'type': term_type, 'value': graph_name},   # type: ignore
+            )
+
+        if isinstance(self.graph, Dataset):
+            return self.graph.graph(identifier)
+
+        return self.graph.get_context(identifier)
+
+    def _build(self, term: Term) -> Node:
+        match term:
+            case {'type': 'IRI'}:
+                return URIRef(term['value'])
+
+            case {'type': 'blank node'}:
+                return BNode()
+
+            case {'datatype': str() as datatype} if datatype == RDF_LANG_STRING:
+                return Literal(term['value'], lang=term['language'])
+
+            case {'datatype': str() as datatype} if datatype != XSD_STRING:
+                return Literal(term['value'], datatype=URIRef(datatype))
+
+        return Literal(term['value'])
+
+
+def add_to_rdflib(
+    quads: Iterable[Quad],
+    graph: Graph,
+    batch_size: int = ADD_BATCH_SIZE,
+) -> int:
+    """
+    Add quads to an `rdflib` graph or dataset, in batches of `addN()` calls.
+
+    A plain `Graph` takes quads of the default graph only, and a `Dataset`
+    takes all of them. Returns the number of quads added.
+
+    Batches go to the store of the graph: the graph itself would check terms
+    and look up the context of every quad again, which takes longer than the
+    rest of adding a quad.
+    """
+    terms = RDFLibTerms(graph)
+    batch: list[tuple[Node, Node, Node, Graph]] = []
+    count = 0
+    for quad in quads:
+        context = terms.context(quad['graph'])
+        if context is None:
+            continue
+
+        batch.append((
+            terms.node(quad['subject']),
+            terms.node(quad['predicate']),
+            terms.node(quad['object']),
+            context,
+        ))
+        if len(batch) >= batch_size:
+            graph.store.addN(batch)
+            count += len(batch)
+            batch.clear()
+
+    graph.store.addN(batch)
+    return count + len(batch)
@@ -1,36 +1,46 @@
+from typing import Any
+
 from pydantic import validate_call
-from pyld import jsonld
 
-from yaml_ld.document_loaders.content_types import (
-    DEFAULT_ACCEPT_HEADER,
-    DEFAULT_USER_AGENT,
-    construct_accept_header,
-)
-from yaml_ld.document_loaders.default import DEFAULT_DOCUMENT_LOADER
-from yaml_ld.expand import except_json_ld_errors
-from yaml_ld.models import (
-    DEFAULT_VALIDATE_CALL_CONFIG,
-    URI,
-    JsonLdInput,
-    ensure_string_or_document,
+from yaml_ld import fast
+from yaml_ld.models import DEFAULT_VALIDATE_CALL_CONFIG, JsonLdInput
+from yaml_ld.options import (
+    BaseOptions,
+    ExtractAllScriptsOptions,
+    ParserOptions,
 )
-from yaml_ld.options import BaseOptions, ExtractAllScriptsOptions
-from yaml_ld.rdf import Dataset
+from yaml_ld.rdf import Dataset, EncodedDataset
 
 
-class ToRDFOptions(BaseOptions, ExtractAllScriptsOptions):   # type: ignore
+class ToRDFOptions(   # type: ignore
+    BaseOptions,
+    ParserOptions,
+    ExtractAllScriptsOptions,
+):
     """Options for converting ＊-LD to RDF."""
 
     format: str | None = None
     """The format to use to output a string: 'application/n-quads'
     for N-Quads."""
 
+    encoded: bool = False
+    """
+    True to return an `EncodedDataset`, which takes much less memory than a
+    `Dataset`. Ignored if `format` is set.
+    """
+
     produce_generalized_rdf: bool = False
     """True to output generalized RDF, false to produce only standard RDF."""
 
     rdf_direction: str = 'i18n-datatype'
     """Only 'i18n-datatype' supported."""
 
+    def pyld_options(self) -> dict[str, Any]:   # type: ignore
+        """Convert the options, always extracting all scripts."""
+        dict_options = super().pyld_options()
+        dict_options['extractAllScripts'] = True
+        return dict_options
+
 
 DEFAULT_TO_RDF_OPTIONS = ToRDFOptions()
 
@@ -39,29 +49,6 @@ DEFAULT_TO_RDF_OPTIONS = ToRDFOptions()
 def to_rdf(
     document: JsonLdInput,
     options: ToRDFOptions = DEFAULT_TO_RDF_OPTIONS,
-) -> Dataset | str:
+) -> Dataset | EncodedDataset | str:
     """Convert a [＊-LD](/blog/any-ld/) document to RDF."""
-    dict_options = options.model_dump(by_alias=True, exclude_none=True)
-    dict_options.setdefault('documentLoader', DEFAULT_DOCUMENT_LOADER)
-
-    accept_header = DEFAULT_ACCEPT_HEADER
-    if isinstance(document, URI):
-        accept_header = construct_accept_header(document)
-
-    dict_options.setdefault(
-        'headers', {
-            'Accept': accept_header,
-            'User-Agent': DEFAULT_USER_AGENT,
-        },
-    )
-
-    dict_options['extractAllScripts'] = True
-
-    with except_json_ld_errors():
-        jsonld._resolved_context_cache = jsonld.LRUCache(  # noqa: WPS437
-            maxsize=jsonld.RESOLVED_CONTEXT_CACHE_MAX_SIZE,
-        )
-        return jsonld.to_rdf(
-            input_=ensure_string_or_document(document),
-            options=dict_options,
-        )
+    return fast.to_rdf(document, options.compile())
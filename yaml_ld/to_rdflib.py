@@ -0,0 +1,27 @@
+import rdflib
+from pydantic import SkipValidation, validate_call
+
+from yaml_ld import fast
+from yaml_ld.models import DEFAULT_VALIDATE_CALL_CONFIG, JsonLdInput
+from yaml_ld.to_rdf import DEFAULT_TO_RDF_OPTIONS, ToRDFOptions
+
+
+@validate_call(config=DEFAULT_VALIDATE_CALL_CONFIG)
+def to_rdflib(
+    document: JsonLdInput,
+    graph: SkipValidation[rdflib.Graph | None] = None,
+    options: ToRDFOptions = DEFAULT_TO_RDF_OPTIONS,
+) -> rdflib.Graph:
+    """
+    Convert a [＊-LD](/blog/any-ld/) document to RDF in an `rdflib` graph.
+
+    Quads are added to `graph` as they are, with no N-Quads text to print and
+    parse again; a new `rdflib.Dataset` is created if `graph` is omitted. A
+    plain `rdflib.Graph` takes the default graph only. `format` and `encoded`
+    options are ignored.
+    """
+    return fast.to_rdflib(
+        document,
+        rdflib.Dataset() if graph is None else graph,
+        options.compile(),
+    )